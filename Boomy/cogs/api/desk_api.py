@@ -30,8 +30,8 @@ class DeskAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 if error is not None:
@@ -93,7 +93,7 @@ class DeskAPI(commands.Cog):
         return None
 
     @staticmethod
-    async def reply_error(response: discord.Message, message: str, lang, prefix="", suffix="", **kwargs):
+    async def reply_error(response: discord.Message | discord.PartialMessage, message: str, lang, prefix="", suffix="", **kwargs):
         content = prefix
         content += translation_manager.translate_random(message, lang=lang, **kwargs)
         content += "\n"
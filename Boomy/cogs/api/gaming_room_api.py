@@ -1,5 +1,4 @@
 import discord
-from discord import DMChannel
 from discord.ext import commands
 from fastapi import status, APIRouter
 from fastapi.responses import JSONResponse
@@ -77,8 +76,8 @@ class GamingRoomAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 match error:
@@ -147,8 +146,8 @@ class GamingRoomAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 match error:
@@ -236,8 +235,8 @@ class GamingRoomAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 match error:
@@ -298,8 +297,8 @@ class GamingRoomAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 match error:
@@ -360,8 +359,8 @@ class GamingRoomAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 match error:
@@ -425,8 +424,8 @@ class GamingRoomAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 match error:
@@ -492,15 +491,11 @@ class GamingRoomAPI(commands.Cog):
         user_id: int | None = data.get("user_id", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
-            user = await self.bot.fetch_user(user_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
+            user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
 
-            match channel:
-                case DMChannel():
-                    guild_id = "@me"
-                case _:
-                    guild_id = channel.guild.id
+            guild_id = data.get("guild_id", None) or "@me"
 
             prefix = f"https://discord.com/channels/{guild_id}/{channel.id}/{response.id}\n"
 
@@ -565,7 +560,7 @@ class GamingRoomAPI(commands.Cog):
         return await user.send(content=content, **kwargs)
 
     @staticmethod
-    async def reply_error(response: discord.Message, message: str, lang, prefix="", suffix="", **kwargs):
+    async def reply_error(response: discord.Message | discord.PartialMessage, message: str, lang, prefix="", suffix="", **kwargs):
         content = prefix
         content += translation_manager.translate_random(message, lang=lang, **kwargs)
         content += "\n"
@@ -50,8 +50,8 @@ class StadiumAPI(commands.Cog):
         winner_id: int | None = data.get("winner_id", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 if error is not None:
@@ -153,8 +153,8 @@ class StadiumAPI(commands.Cog):
         winner_id: int | None = data.get("winner_id", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 if error is not None:
@@ -175,18 +175,22 @@ class StadiumAPI(commands.Cog):
                     case "zorua":
                         content += ".zorua"
 
-                winner = await self.bot.fetch_user(winner_id)
+                winner = None
 
-                match winner.id:
-                    case Celebrity.Boomy.value:
-                        content += ".boomy_win"
-                    case _:
-                        content += ".boomy_lose"
+                # Only teams double-checked with a real battle have a winner
+                if winner_id is not None:
+                    winner = self.bot.get_user(winner_id) or await self.bot.fetch_user(winner_id)
+
+                    match winner.id:
+                        case Celebrity.Boomy.value:
+                            content += ".boomy_win"
+                        case _:
+                            content += ".boomy_lose"
 
                 await response.reply(
                     content=translation_manager.translate_random(
-                        content=content, lang=locale,
-                        winner=winner.display_name
+                        content, lang=locale,
+                        winner=winner.display_name if winner is not None else None
                     )
                 )
             except InvalidAttachment:
@@ -235,8 +239,8 @@ class StadiumAPI(commands.Cog):
         error: str | None = data.get("error", None)
 
         try:
-            channel = await self.bot.fetch_channel(channel_id)
-            response = await channel.fetch_message(response_id)
+            channel = self.bot.get_partial_messageable(channel_id)
+            response = channel.get_partial_message(response_id)
 
             try:
                 if error is not None:
@@ -290,7 +294,7 @@ class StadiumAPI(commands.Cog):
         return None
 
     @staticmethod
-    async def reply_error(response: discord.Message, message: str, lang, prefix="", suffix="", **kwargs):
+    async def reply_error(response: discord.Message | discord.PartialMessage, message: str, lang, prefix="", suffix="", **kwargs):
         content = prefix
         content += translation_manager.translate_random(message, lang=lang, **kwargs)
         content += "\n"
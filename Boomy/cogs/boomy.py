@@ -1,8 +1,6 @@
 import asyncio
-import json
 import os
 import random
-import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -11,21 +9,25 @@ from typing import Any
 import aiohttp
 import discord
 from discord import option
-from discord.ext import commands
+from discord.ext import commands, tasks
 from vault.data.characters import Celebrity
+from vault.database.async_vault import UnitOfWork
 from vault.exceptions.ask_before_introduction import AskBeforeIntroduction
 from vault.exceptions.ask_in_cooldown import AskInCooldown
 from vault.exceptions.cog_not_registered import CogNotRegistered
 from vault.exceptions.interrupted_ask import InterruptedAsk
 from vault.exceptions.interrupted_introduction import InterruptedIntroduction
 from vault.exceptions.interrupted_talk import InterruptedTalk
+from vault.utils.expiring_store import ExpiringStore
 
 from cogs.maintenance_room import MaintenanceRoom
 from cogs.storage_room import StorageRoom
 from config import Config
 from data.conversation import Conversation
 from data.topics import Topics
+from logger import logger
 from main import translation_manager
+from utils.ping_dictionary import PingDictionary
 
 
 class Mood(Enum):
@@ -68,8 +70,35 @@ class Boomy(commands.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
         self.stats: Stats = Stats()
-        self.ping_cooldowns: dict[int, float] = dict()
-        self.conversations: dict[int, Conversation] = dict()
+        # Entries live as long as their cooldown, an expired entry behaves exactly like a missing one
+        self.ping_cooldowns: ExpiringStore[int, float] = ExpiringStore(ttl=10, max_size=4096)
+        self.conversations: ExpiringStore[int, Conversation] = ExpiringStore(ttl=10 * 60, max_size=4096)
+        self.__ping_dictionaries: dict[str, PingDictionary] = dict()
+        self.__reload_ping_dictionaries.start()
+
+    def cog_unload(self):
+        self.__reload_ping_dictionaries.cancel()
+
+    @tasks.loop(seconds=5)
+    async def __reload_ping_dictionaries(self):
+        for language, ping_dictionary in self.__ping_dictionaries.items():
+            try:
+                ping_dictionary.reload_if_changed()
+            except (OSError, ValueError) as e:
+                # Half-written file, keep the previous dictionary until the next check
+                logger.warning(f"Could not reload the {language} pings dictionary: {e}")
+
+    def __get_ping_dictionary(self, language: str) -> PingDictionary:
+        ping_dictionary = self.__ping_dictionaries.get(language, None)
+
+        if ping_dictionary is None:
+            ping_dictionary = PingDictionary(
+                os.path.join(translation_manager.locale_dir, language, "dictionaries", "pings.json")
+            )
+            ping_dictionary.reload_if_changed()
+            self.__ping_dictionaries[language] = ping_dictionary
+
+        return ping_dictionary
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -88,37 +117,17 @@ class Boomy(commands.Cog):
                 case Celebrity.Zark.value | Celebrity.Amethyst.value:
                     pass
                 case _:
-                    user = self.storage_room_cog.user_database.fetch_or_register(message.author.id)
+                    async with self.storage_room_cog.unit_of_work() as vault:
+                        user = await vault.user_database.fetch_or_register(message.author.id)
 
                     if not user.premium and message.author.id in self.ping_cooldowns:
                         cooldown = 1 * 10
                         if now - self.ping_cooldowns[message.author.id] < cooldown:
                             return
 
-            response = "response.ping"
-
-            with open(
-                    os.path.join(
-                        translation_manager.locale_dir, translation_manager.language, "dictionaries",
-                        "pings.json"
-                    ),
-                    "r",
-                    encoding="utf-8"
-            ) as f:
-                pings_dictionary = json.load(f)
-
-                ping_data = pings_dictionary.get(str(message.author.id), None)
-
-                if ping_data is not None:
-                    response += "." + ping_data["base"]
-                else:
-                    ping_data = pings_dictionary.get("_", None)
-
-                if ping_data is not None:
-                    branch = self.__find_branch(message.content.lower(), ping_data.get("keywords", {}))
-
-                    if branch:
-                        response += "." + branch
+            response = self.__get_ping_dictionary(translation_manager.language).get_response(
+                message.author.id, message.content.lower(), "response.ping"
+            )
 
             self.ping_cooldowns[message.author.id] = now
 
@@ -229,13 +238,17 @@ class Boomy(commands.Cog):
     async def talk(self, ctx: discord.ApplicationContext, ask: str):
         await ctx.defer()
 
+        async with self.storage_room_cog.unit_of_work() as vault:
+            await self.__talk(ctx, ask, vault)
+
+    async def __talk(self, ctx: discord.ApplicationContext, ask: str, vault: UnitOfWork):
         data: dict[str, Any] = {
             "channel_id": ctx.channel.id,
             "response_id": None,
             "locale": ctx.interaction.locale
         }
 
-        user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
+        user = await vault.user_database.fetch_or_register(ctx.author.id)
 
         now = time.time()
 
@@ -264,6 +277,7 @@ class Boomy(commands.Cog):
             state["index"] = 1
             state["reached_end"] = False
             state["last_time"] = now
+            self.conversations.touch(user.id)
 
         action: str | None = None
         story: str | None = None
@@ -387,43 +401,44 @@ class Boomy(commands.Cog):
             state["index"] += 1
 
         state["last_time"] = now
+        self.conversations.touch(user.id)
 
         if state["reached_end"]:
             # Finished introduction
             if "conversation.introduction" in state["action"]:
                 if not user.statistics.met_boomy:
                     user.statistics.met_boomy = True
-                    self.storage_room_cog.user_database.update(user.id, user)
+                    await vault.user_database.update(user.id, user)
 
             match state["action"] + "." + state["story"]:
                 case "conversation.talk.ask.about_boomy.intro":
                     if not user.statistics.knows_boomy:
                         user.statistics.knows_boomy = True
-                        self.storage_room_cog.user_database.update(user.id, user)
+                        await vault.user_database.update(user.id, user)
                 case "conversation.talk.ask.about_cafe.intro":
                     if not user.statistics.knows_cafe:
                         user.statistics.knows_cafe = True
-                        self.storage_room_cog.user_database.update(user.id, user)
+                        await vault.user_database.update(user.id, user)
                 case "conversation.talk.ask.about_berry.intro":
                     if not user.statistics.knows_berry:
                         user.statistics.knows_berry = True
-                        self.storage_room_cog.user_database.update(user.id, user)
+                        await vault.user_database.update(user.id, user)
                 case "conversation.talk.ask.about_jax.intro":
                     if not user.statistics.knows_jax:
                         user.statistics.knows_jax = True
-                        self.storage_room_cog.user_database.update(user.id, user)
+                        await vault.user_database.update(user.id, user)
                 case "conversation.talk.ask.about_dad.intro":
                     if not user.statistics.knows_dad:
                         user.statistics.knows_dad = True
-                        self.storage_room_cog.user_database.update(user.id, user)
+                        await vault.user_database.update(user.id, user)
                 case "conversation.talk.ask.about_mystery_console.intro":
                     if not user.statistics.knows_mystery_console:
                         user.statistics.knows_mystery_console = True
-                        self.storage_room_cog.user_database.update(user.id, user)
+                        await vault.user_database.update(user.id, user)
                 case "conversation.talk.ask.about_boomy_ears.intro":
                     if not user.statistics.knows_boomy_ears:
                         user.statistics.knows_boomy_ears = True
-                        self.storage_room_cog.user_database.update(user.id, user)
+                        await vault.user_database.update(user.id, user)
 
         result += "\n⮟" if not state["reached_end"] else ""
 
@@ -565,29 +580,6 @@ class Boomy(commands.Cog):
         """
         raise NotImplemented()
 
-    def __find_branch(self, text: str, keywords: dict[str, str | dict]) -> str | None:
-        """
-        Recursively search for the first matching keyword sequence.
-        - If a keyword maps to a dict: keep searching inside that dict.
-        - If a keyword maps to a string: return it.
-        """
-        for keyword, branch in keywords.items():
-            pattern = r"\b(" + keyword + r")\b"
-            match = re.search(pattern, text)
-            if not match:
-                continue
-
-            if isinstance(branch, dict):
-                # continue searching in the substring after this match
-                next_text = text[match.end():]
-                result = self.__find_branch(next_text, branch)
-                if result:
-                    return result
-            elif isinstance(branch, str):
-                return branch
-
-        return None
-
     @staticmethod
     async def respond_error(interaction: discord.Interaction, message: str, lang, prefix="", suffix="", **kwargs):
         content = prefix
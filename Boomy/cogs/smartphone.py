@@ -1,27 +1,52 @@
+import asyncio
+import json
+from typing import Any, Callable, Awaitable
+
 import discord
 import uvicorn
 from discord.ext import commands
-from fastapi import FastAPI
+from fastapi import FastAPI, APIRouter, status
+from fastapi.responses import JSONResponse
 from vault.exceptions.cog_not_registered import CogNotRegistered
 
 from cogs.api.boomy_api import BoomyAPI
 from cogs.api.desk_api import DeskAPI
 from cogs.api.gaming_room_api import GamingRoomAPI
 from cogs.api.stadium_api import StadiumAPI
+from logger import logger
 
 
 class Smartphone(commands.Cog):
     def __init__(self, bot: discord.Bot):
         self.bot = bot
         self.__server: uvicorn.Server | None = None
+        self.__handlers: dict[str, Callable[[dict], Awaitable[JSONResponse | None]]] = {}
+
+        self.router = APIRouter()
+        self.router.add_api_route(
+            "/batch",
+            self.batch,
+            status_code=status.HTTP_200_OK,
+            methods=["POST"]
+        )
 
     async def cog_load(self):
         api = FastAPI()
 
-        api.include_router(self.boomy_api_cog.router)
-        api.include_router(self.desk_api_cog.router)
-        api.include_router(self.gaming_room_api_cog.router)
-        api.include_router(self.stadium_api_cog.router)
+        routers = [
+            self.boomy_api_cog.router,
+            self.desk_api_cog.router,
+            self.gaming_room_api_cog.router,
+            self.stadium_api_cog.router
+        ]
+
+        for router in routers:
+            api.include_router(router)
+
+            for route in router.routes:
+                self.__handlers[route.path] = route.endpoint
+
+        api.include_router(self.router)
 
         api_version = 1
 
@@ -35,6 +60,45 @@ class Smartphone(commands.Cog):
             await self.__server.shutdown()
             self.__server = None
 
+    async def batch(self, data: dict):
+        """
+        Handle several events in one request.
+        Events for the same channel are handled in the order they were sent, different channels concurrently.
+        :param data: {"events": [{"path": "/gaming-room/play", "data": {...}}, ...]}
+        :return: One {"status", "error"} result per event, in the same order
+        """
+        events: list[dict[str, Any]] = data.get("events", [])
+        results: list[dict[str, Any] | None] = [None] * len(events)
+
+        channels: dict[int | None, list[int]] = {}
+        for index, event in enumerate(events):
+            channels.setdefault(event.get("data", {}).get("channel_id", None), []).append(index)
+
+        async def handle_channel(indexes: list[int]):
+            for index in indexes:
+                results[index] = await self.__handle_event(events[index])
+
+        await asyncio.gather(*(handle_channel(indexes) for indexes in channels.values()))
+
+        return {"results": results}
+
+    async def __handle_event(self, event: dict[str, Any]) -> dict[str, Any]:
+        handler = self.__handlers.get(event.get("path", None), None)
+
+        if handler is None:
+            return {"status": status.HTTP_404_NOT_FOUND, "error": "UnknownPath"}
+
+        try:
+            response = await handler(event.get("data", {}))
+        except Exception as e:
+            logger.error(f"Batched event for {event.get('path')} failed: {e}")
+            return {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "error": "Exception"}
+
+        if response is None:
+            return {"status": status.HTTP_204_NO_CONTENT, "error": None}
+
+        return {"status": response.status_code, "error": json.loads(response.body).get("error", None)}
+
     @property
     def boomy_api_cog(self):
         boomy_api_cog: BoomyAPI | None = self.bot.get_cog("BoomyAPI")
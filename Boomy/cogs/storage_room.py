@@ -1,3 +1,5 @@
+from typing import AsyncContextManager
+
 import discord
 from discord.ext import commands
 from sqlalchemy import create_engine
@@ -7,9 +9,13 @@ from vault.data.database.gameboy_cartridge import GameBoyCartridge
 from vault.data.database.gameboy_profile import GameBoyProfile
 from vault.data.database.nes_cartridge import NESCartridge
 from vault.data.database.pokemon import Pokemon
+from vault.data.database.rom import Rom
 from vault.data.database.statistics import Statistics
 from vault.data.database.user import User
+from vault.database.async_vault import AsyncVault, UnitOfWork
 from vault.database.cartridge_database import CartridgeDatabase
+from vault.database.migrations import Migrations
+from vault.database.user_cache import UserCache
 from vault.database.user_database import UserDatabase
 
 from config import Config
@@ -21,23 +27,46 @@ class StorageRoom(commands.Cog):
         self.__session = None
         self.__user_database = None
         self.__cartridge_database = None
+        self.__async_vault = None
 
     async def cog_load(self):
-        engine = create_engine(Config.DATABASE_CONNECTION, echo=False)
+        engine = create_engine(
+            Config.DATABASE_CONNECTION,
+            echo=False,
+            pool_pre_ping=True,
+            pool_recycle=Config.DATABASE_POOL_RECYCLE
+        )
 
         User.metadata.create_all(engine)
         Statistics.metadata.create_all(engine)
         Pokemon.metadata.create_all(engine)
         GameBoyProfile.metadata.create_all(engine)
+        Rom.metadata.create_all(engine)
         Cartridge.metadata.create_all(engine)
         GameBoyCartridge.metadata.create_all(engine)
         NESCartridge.metadata.create_all(engine)
 
-        self.__session = Session(engine)
-        self.__user_database = UserDatabase(self.__session)
+        Migrations.run(engine)
+
+        # Cached users stay usable after a commit instead of reloading on their next attribute access
+        self.__session = Session(engine, expire_on_commit=False)
+        user_cache = UserCache()
+        self.__user_database = UserDatabase(self.__session, user_cache)
         self.__cartridge_database = CartridgeDatabase(self.__session)
 
+        self.__async_vault = AsyncVault(
+            Config.DATABASE_ASYNC_CONNECTION,
+            pool_size=Config.DATABASE_POOL_SIZE,
+            max_overflow=Config.DATABASE_MAX_OVERFLOW,
+            pool_recycle=Config.DATABASE_POOL_RECYCLE,
+            user_cache=user_cache
+        )
+
     async def cog_unload(self):
+        if self.__async_vault:
+            await self.__async_vault.dispose()
+            self.__async_vault = None
+
         if self.__session:
             self.__session.close()
             self.__session = None
@@ -45,6 +74,13 @@ class StorageRoom(commands.Cog):
             self.__user_database = None
             self.__cartridge_database = None
 
+    def unit_of_work(self) -> AsyncContextManager[UnitOfWork]:
+        """
+        Open a session scoped to a single interaction on the pooled async engine.
+        :return:
+        """
+        return self.__async_vault.unit_of_work()
+
     @property
     def user_database(self) -> UserDatabase:
         return self.__user_database
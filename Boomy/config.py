@@ -42,6 +42,12 @@ class Config:
     if not DATABASE_CONNECTION:
         raise MissingEnvironmentVariable("DATABASE_CONNECTION")
 
+    # Falls back to DATABASE_CONNECTION with its driver swapped for an asyncio one
+    DATABASE_ASYNC_CONNECTION = os.getenv("DATABASE_ASYNC_CONNECTION", DATABASE_CONNECTION)
+    DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", 10))
+    DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", 10))
+    DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", 30 * 60))
+
     CAFE_API = os.getenv("CAFE_API", "http://localhost:8000")
     BOOMY_API = os.getenv("BOOMY_API", "http://localhost:8001")
     BERRY_API = os.getenv("BERRY_API", "http://localhost:8002")
@@ -0,0 +1,71 @@
+from collections import deque
+from typing import Iterator
+
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher, finds every occurrence of every pattern in a single pass over the text.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = patterns
+        self.__goto: list[dict[str, int]] = [{}]
+        self.__fail: list[int] = [0]
+        self.__output: list[list[int]] = [[]]
+
+        for index, pattern in enumerate(patterns):
+            self.__insert(index, pattern)
+
+        self.__build()
+
+    def __insert(self, index: int, pattern: str):
+        if not pattern:
+            return
+
+        state = 0
+        for char in pattern:
+            next_state = self.__goto[state].get(char, None)
+
+            if next_state is None:
+                next_state = len(self.__goto)
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__output.append([])
+                self.__goto[state][char] = next_state
+
+            state = next_state
+
+        self.__output[state].append(index)
+
+    def __build(self):
+        queue = deque(self.__goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+
+            for char, next_state in self.__goto[state].items():
+                queue.append(next_state)
+
+                fail = self.__fail[state]
+                while fail and char not in self.__goto[fail]:
+                    fail = self.__fail[fail]
+
+                self.__fail[next_state] = self.__goto[fail].get(char, 0)
+                self.__output[next_state] = self.__output[next_state] + self.__output[self.__fail[next_state]]
+
+    def find_all(self, text: str) -> Iterator[tuple[int, int, int]]:
+        """
+        Find every, possibly overlapping, occurrence in the text.
+        :param text:
+        :return: (pattern index, start, end) tuples, ordered by end
+        """
+        state = 0
+
+        for position, char in enumerate(text):
+            while state and char not in self.__goto[state]:
+                state = self.__fail[state]
+
+            state = self.__goto[state].get(char, 0)
+
+            for index in self.__output[state]:
+                yield index, position + 1 - len(self.patterns[index]), position + 1
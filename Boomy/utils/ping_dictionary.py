@@ -0,0 +1,162 @@
+import json
+import os
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+
+from utils.aho_corasick import AhoCorasick
+
+# Keywords using any of these are real regular expressions and cannot go in the automaton
+REGEX_METACHARACTERS = set(".^$*+?{}[]\\()")
+
+
+@dataclass
+class KeywordEntry:
+    # Indexes of the keyword's literal alternatives in the automaton, empty for regex keywords
+    alternatives: list[int]
+    regex: re.Pattern | None
+    branch: "str | list[KeywordEntry]"
+
+
+class KeywordTree:
+    """
+    A ping keyword tree compiled into one automaton, so finding a branch only scans the message once.
+    """
+
+    def __init__(self, keywords: dict[str, str | dict]):
+        self.__patterns: dict[str, int] = {}
+        self.__root = self.__compile(keywords)
+        self.__automaton = AhoCorasick(list(self.__patterns.keys()))
+
+    def __compile(self, keywords: dict[str, str | dict]) -> list[KeywordEntry]:
+        entries = []
+
+        for keyword, branch in keywords.items():
+            if isinstance(branch, dict):
+                branch = self.__compile(branch)
+            elif not isinstance(branch, str):
+                continue
+
+            if REGEX_METACHARACTERS.isdisjoint(keyword):
+                alternatives = [self.__patterns.setdefault(alternative, len(self.__patterns))
+                                for alternative in keyword.split("|")]
+                entries.append(KeywordEntry(alternatives=alternatives, regex=None, branch=branch))
+            else:
+                entries.append(KeywordEntry(alternatives=[], regex=re.compile(r"\b(" + keyword + r")\b"), branch=branch))
+
+        return entries
+
+    def find_branch(self, text: str) -> str | None:
+        """
+        Search for the first matching keyword sequence.
+        - If a keyword maps to a list of entries: keep searching inside it, after the keyword.
+        - If a keyword maps to a string: return it.
+        """
+        occurrences: dict[int, list[int]] = defaultdict(list)
+
+        for index, start, end in self.__automaton.find_all(text):
+            occurrences[index].append(start)
+
+        return self.__resolve(self.__root, text, 0, occurrences)
+
+    def __resolve(self, entries: list[KeywordEntry], text: str, offset: int,
+                  occurrences: dict[int, list[int]]) -> str | None:
+        for entry in entries:
+            match_end = self.__find_match(entry, text, offset, occurrences)
+            if match_end is None:
+                continue
+
+            if isinstance(entry.branch, list):
+                # continue searching in the text after this match
+                result = self.__resolve(entry.branch, text, match_end, occurrences)
+                if result:
+                    return result
+            else:
+                return entry.branch
+
+        return None
+
+    def __find_match(self, entry: KeywordEntry, text: str, offset: int,
+                     occurrences: dict[int, list[int]]) -> int | None:
+        if entry.regex is not None:
+            match = entry.regex.search(text[offset:])
+            return offset + match.end() if match else None
+
+        # Leftmost occurrence wins, ties go to the alternative listed first, like a regex alternation
+        best: tuple[int, int] | None = None
+
+        for index in entry.alternatives:
+            length = len(self.__automaton.patterns[index])
+            starts = occurrences.get(index, [])
+
+            for start in starts[bisect_left(starts, offset):]:
+                if best is not None and start >= best[0]:
+                    break
+
+                if self.__is_boundary(text, start, offset) and self.__is_boundary(text, start + length, offset):
+                    best = (start, start + length)
+                    break
+
+        return best[1] if best else None
+
+    @staticmethod
+    def __is_boundary(text: str, position: int, offset: int) -> bool:
+        # Same as \b, with everything before the offset out of sight
+        before = text[position - 1] if position > offset else ""
+        after = text[position] if position < len(text) else ""
+        return KeywordTree.__is_word(before) != KeywordTree.__is_word(after)
+
+    @staticmethod
+    def __is_word(char: str) -> bool:
+        return char.isalnum() or char == "_"
+
+
+class PingDictionary:
+    """
+    The pings dictionary of a language, loaded once and reloaded whenever the file changes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__mtime: float | None = None
+        # user id, or "_" for everyone else -> (base, compiled keywords)
+        self.__entries: dict[str, tuple[str | None, KeywordTree]] = {}
+
+    def reload_if_changed(self) -> bool:
+        try:
+            mtime = os.path.getmtime(self.path)
+        except FileNotFoundError:
+            self.__mtime = None
+            self.__entries = {}
+            return False
+
+        if mtime == self.__mtime:
+            return False
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            pings_dictionary = json.load(f)
+
+        # Swapped in at once, a half-built dictionary is never seen
+        self.__entries = {
+            key: (ping_data.get("base", None), KeywordTree(ping_data.get("keywords", {})))
+            for key, ping_data in pings_dictionary.items()
+        }
+        self.__mtime = mtime
+        return True
+
+    def get_response(self, user_id: int, text: str, response: str) -> str:
+        entry = self.__entries.get(str(user_id), None)
+
+        if entry is not None:
+            response += "." + entry[0]
+        else:
+            entry = self.__entries.get("_", None)
+
+        if entry is not None:
+            branch = entry[1].find_branch(text)
+
+            if branch:
+                response += "." + branch
+
+        return response
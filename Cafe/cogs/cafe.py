@@ -1,12 +1,11 @@
-import asyncio
 import time
 from typing import Any
 
-import aiohttp
 import discord
 from discord.ext import commands
 from vault.exceptions.cog_not_registered import CogNotRegistered
 
+from cogs.intercom import Intercom
 from cogs.maintenance_room import MaintenanceRoom
 from config import Config
 from main import translation_manager
@@ -45,21 +44,15 @@ class Cafe(commands.Cog):
             )
         )
 
-        async def ping_them_creatures(url, sesh):
-            try:
-                await sesh.post(url, json=data)
-            except Exception:
-                pass
-
         creatures = [
-            f"{Config.CAFE_API}/ping",
-            f"{Config.BOOMY_API}/ping",
-            f"{Config.BERRY_API}/ping",
-            f"{Config.JAX_API}/ping",
+            Config.CAFE_API,
+            Config.BOOMY_API,
+            Config.BERRY_API,
+            Config.JAX_API,
         ]
 
-        async with aiohttp.ClientSession() as session:
-            await asyncio.gather(*(ping_them_creatures(url, session) for url in creatures))
+        for api in creatures:
+            self.intercom_cog.send(api, "/ping", data)
 
     @ping.error
     async def on_ping_error(self, ctx: discord.ApplicationContext, exception):
@@ -83,21 +76,15 @@ class Cafe(commands.Cog):
 
         data["response_id"] = response.id
 
-        async def ping_them_creatures(url, sesh: aiohttp.ClientSession):
-            try:
-                await sesh.post(url, json=data)
-            except Exception:
-                pass
-
         creatures = [
-            f"{Config.CAFE_API}/ping",
-            f"{Config.BOOMY_API}/ping",
-            f"{Config.BERRY_API}/ping",
-            f"{Config.JAX_API}/ping",
+            Config.CAFE_API,
+            Config.BOOMY_API,
+            Config.BERRY_API,
+            Config.JAX_API,
         ]
 
-        async with aiohttp.ClientSession() as session:
-            await asyncio.gather(*(ping_them_creatures(url, session) for url in creatures))
+        for api in creatures:
+            self.intercom_cog.send(api, "/ping", data)
 
     @property
     def maintenance_room_cog(self):
@@ -108,6 +95,15 @@ class Cafe(commands.Cog):
 
         return maintenance_room_cog
 
+    @property
+    def intercom_cog(self):
+        intercom_cog: Intercom | None = self.bot.get_cog("Intercom")
+
+        if intercom_cog is None:
+            raise CogNotRegistered()
+
+        return intercom_cog
+
 
 def setup(bot):
     bot.add_cog(Cafe(bot))
@@ -1,24 +1,23 @@
-import os
-import tempfile
 from typing import Any
 
-import cynes
 import discord
-import requests
 from discord import option
 from discord.ext import commands
-from pyboy import PyBoy
-from pyboy.utils import PyBoyException
 from sqlalchemy.exc import IntegrityError
 from vault.data.consoles import Console
 from vault.data.database.gameboy_cartridge import GameBoyCartridge
 from vault.data.database.nes_cartridge import NESCartridge
+from vault.data.database.rom import Rom
 from vault.data.database.user import User
+from vault.data.rom_header import GameBoyHeader, NESHeader
+from vault.database.fetch_profile import FetchProfile
 from vault.exceptions.cog_not_registered import CogNotRegistered
 from vault.exceptions.console_not_valid import ConsoleNotValid
 from vault.exceptions.game_already_registered import GameAlreadyRegistered
 from vault.exceptions.invalid_rom import InvalidROM
+from vault.exceptions.rom_not_found import RomNotFound
 
+from cogs.intercom import Intercom
 from cogs.maintenance_room import MaintenanceRoom
 from cogs.storage_room import StorageRoom
 from config import Config
@@ -72,7 +71,7 @@ class Desk(commands.Cog):
             "locale": ctx.interaction.locale
         }
 
-        user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
+        user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id, FetchProfile.Cartridges)
 
         rom_bytes = await cartridge.read()
 
@@ -92,13 +91,7 @@ class Desk(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/desk/check-in",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/desk/check-in", data)
 
     @checkin.error
     async def on_checkin_error(self, ctx: discord.ApplicationContext, exception):
@@ -138,32 +131,17 @@ class Desk(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/desk/check-in",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/desk/check-in", data)
 
     async def __checkin_gameboy(self, user: User, title: str, rom_bytes: bytes):
-        with tempfile.NamedTemporaryFile(dir=os.path.join(Config.PROJECT_ROOT, "temp"), delete=False) as tmp_file:
-            tmp_file.write(rom_bytes)
-            tmp_path = tmp_file.name
-
-            try:
-                emulator: PyBoy = PyBoy(
-                    gamerom=tmp_path,
-                    window="null"
-                )
-
-                emulator.stop(save=False)
-            except PyBoyException:
-                raise InvalidROM()
+        # Rejects anything that is not a Game Boy ROM before it ever reaches an emulator
+        header = GameBoyHeader.parse(rom_bytes)
+        rom = self.__fetch_or_create_rom(rom_bytes)
 
         cartridge: GameBoyCartridge = GameBoyCartridge(
             title=title,
-            rom=rom_bytes
+            rom=rom,
+            header=header.to_dict()
         )
 
         # Store ROM in database
@@ -175,20 +153,13 @@ class Desk(commands.Cog):
             raise GameAlreadyRegistered()
 
     async def __checkin_nes(self, user: User, title: str, rom_bytes: bytes):
-        with tempfile.NamedTemporaryFile(dir=os.path.join(Config.PROJECT_ROOT, "temp"), delete=False) as tmp_file:
-            tmp_file.write(rom_bytes)
-            tmp_path = tmp_file.name
-
-            try:
-                cynes.NES(
-                    rom=tmp_path
-                )
-            except RuntimeError:
-                raise InvalidROM()
+        header = NESHeader.parse(rom_bytes)
+        rom = self.__fetch_or_create_rom(rom_bytes)
 
         cartridge: NESCartridge = NESCartridge(
             title=title,
-            rom=rom_bytes
+            rom=rom,
+            header=header.to_dict()
         )
 
         # Store ROM in database
@@ -199,6 +170,13 @@ class Desk(commands.Cog):
         except IntegrityError:
             raise GameAlreadyRegistered()
 
+    def __fetch_or_create_rom(self, rom_bytes: bytes) -> Rom:
+        try:
+            # Known ROMs are already in the Vault, their bytes do not need to be stored again
+            return self.storage_room_cog.rom_database.fetch(Rom.generate_hash(rom_bytes))
+        except RomNotFound:
+            return Rom(data=rom_bytes)
+
     @staticmethod
     async def respond_error(interaction: discord.Interaction, message: str, lang, prefix="", suffix="", **kwargs):
         content = prefix
@@ -239,6 +217,15 @@ class Desk(commands.Cog):
 
         return maintenance_room_cog
 
+    @property
+    def intercom_cog(self):
+        intercom_cog: Intercom | None = self.bot.get_cog("Intercom")
+
+        if intercom_cog is None:
+            raise CogNotRegistered()
+
+        return intercom_cog
+
 
 def setup(bot):
     bot.add_cog(Desk(bot))
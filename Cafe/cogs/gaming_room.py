@@ -1,7 +1,7 @@
+import asyncio
 from typing import Type, Any
 
 import discord
-import requests
 from PIL import Image
 from discord import option, DMChannel, ButtonStyle
 from discord.ext import commands
@@ -25,36 +25,83 @@ from vault.exceptions.last_message_not_found import LastMessageNotFound
 from vault.exceptions.no_previous_state import NoPreviousState
 from vault.exceptions.no_save_state import NoSaveState
 from vault.exceptions.not_enough_joypads import NotEnoughJoypads
+from vault.exceptions.too_many_live_streams import TooManyLiveStreams
+from vault.exceptions.too_many_spectators import TooManySpectators
 from vault.exceptions.unauthorized_joypad_access import UnauthorizedJoypadAccess
 from vault.exceptions.user_already_invited import UserAlreadyInvited
 from vault.exceptions.user_is_cartridge_owner import UserIsCartridgeOwner
+from vault.utils.expiring_store import ExpiringStore
 
+from cogs.intercom import Intercom
 from cogs.maintenance_room import MaintenanceRoom
 from cogs.storage_room import StorageRoom
 from config import Config
 from data.gaming_session import GamingSession
 from emulator.base_emulator import BaseEmulator
 from emulator.game.base_game_instance import BaseGameInstance
+from emulator.game.base_game_instance_manager import BaseGameInstanceManager
 from emulator.gameboy_emulator import GameBoyEmulator
+from emulator.input_window import InputWindow
 from emulator.nes_emulator import NESEmulator
+from logger import logger
 from main import translation_manager
+from utils.checkpoint import Checkpoint
 from utils.discord_utils import image_to_embed, gif_to_embed
+from utils.spectator_feed import SpectatorFeed
 from utils.frame_utils import FrameUtils
+from utils.live_stream import LiveStream
 
 
 class GamingRoom(commands.Cog):
+    JOYPAD_PREFIX = "joypad"
+    FAST_PATH_DEADLINE = 1.5  # seconds, Discord waits 3 seconds for the first response
+    LIVE_CHUNK_BUTTON = "frame 60"  # about two seconds of game time per chunk
+    LIVE_FRAME_STEP = 2  # only every other frame is uploaded
+
     def __init__(self, bot: discord.Bot):
         self.bot = bot
         self.gameboy_emulator = GameBoyEmulator()
         self.nes_emulator = NESEmulator()
-        self.sessions: dict[int, GamingSession] = dict()
+        self.sessions: ExpiringStore[int, GamingSession] = ExpiringStore(ttl=30 * 60, max_size=4096)
 
     async def cog_load(self):
         pass
 
     async def cog_unload(self):
-        self.gameboy_emulator.game_instance_manager.shutdown()
-        self.nes_emulator.game_instance_manager.shutdown()
+        # Stopped first, a chunk still playing holds its game's lock until it is done, so the checkpoint waits for it
+        for owner_id, session in self.sessions.items():
+            if session["live_stream"] is not None:
+                session["live_stream"].stop()
+
+        sessions = [
+            (
+                owner_id,
+                session["cartridge"].id,
+                session["message"].channel.id if session["message"] is not None else None,
+                session["message"].id if session["message"] is not None else None
+            )
+            for owner_id, session in self.sessions.items()
+            if session["cartridge"] is not None
+        ]
+
+        # Everything is picked up again lazily, by the first interaction that needs it
+        await asyncio.gather(
+            asyncio.to_thread(self.__checkpoint_sessions, sessions),
+            self.gameboy_emulator.game_instance_manager.checkpoint(),
+            self.nes_emulator.game_instance_manager.checkpoint()
+        )
+
+    @staticmethod
+    def __get_checkpoint_name(owner_id: int) -> str:
+        return f"session-{owner_id}"
+
+    @staticmethod
+    def __checkpoint_sessions(sessions: list[tuple[int, int, int | None, int | None]]):
+        for owner_id, cartridge_id, channel_id, message_id in sessions:
+            try:
+                Checkpoint.write(GamingRoom.__get_checkpoint_name(owner_id), (cartridge_id, channel_id, message_id))
+            except OSError as e:
+                logger.warning(f"Could not checkpoint the session of {owner_id}: {e}")
 
     @discord.slash_command(
         name="play",
@@ -91,24 +138,34 @@ class GamingRoom(commands.Cog):
 
         user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
 
-        if user.id not in self.sessions:
+        # A session left from before a restart still has a message to clean up
+        if await self.__resume_session(user.id) is None:
             self.sessions[user.id] = {
                 "emulator": None,
-                "joypad": None,
-                "message": None
+                "cartridge": None,
+                "message": None,
+                "spectators": SpectatorFeed(),
+                "input_window": None,
+                "live_stream": None
             }
 
         match console:
             case Console.Pikapalette.value:
                 emulator = self.gameboy_emulator
                 cartridge = self.storage_room_cog.cartridge_database.fetch_gameboy_cartridge(user, title)
-                game_instance, frame = await self.__start_game(emulator, cartridge, user)
-                joypad = self.__build_gameboy_joypad(emulator, cartridge, user)
+
+                async with self.__get_game_lock(cartridge):
+                    game_instance, frame = await self.__start_game(emulator, cartridge, user)
+
+                joypad = self.__build_gameboy_joypad(cartridge, user)
             case Console.PonytaEntertainmentSystem.value:
                 emulator = self.nes_emulator
                 cartridge = self.storage_room_cog.cartridge_database.fetch_nes_cartridge(user, title)
-                game_instance, frame = await self.__start_game(emulator, cartridge, user)
-                joypad = self.__build_nes_joypad(emulator, cartridge, user)
+
+                async with self.__get_game_lock(cartridge):
+                    game_instance, frame = await self.__start_game(emulator, cartridge, user)
+
+                joypad = self.__build_nes_joypad(cartridge, user)
 
                 # These save states must be reset, otherwise loading them causes a 0xC0000005 error
                 cartridge.state = None
@@ -127,9 +184,20 @@ class GamingRoom(commands.Cog):
             except discord.HTTPException:
                 pass
 
+        # Spectators keep watching whatever the player plays next
+        spectators = self.sessions[user.id]["spectators"]
+        spectators.publish(image_bytes, False)
+
+        if self.sessions[user.id]["live_stream"] is not None:
+            self.sessions[user.id]["live_stream"].stop()
+
         self.sessions[user.id] = {
             "emulator": emulator,
-            "joypad": joypad
+            "cartridge": cartridge,
+            "message": None,
+            "spectators": spectators,
+            "input_window": self.__create_input_window(cartridge),
+            "live_stream": None
         }
 
         response = await ctx.respond(
@@ -138,20 +206,14 @@ class GamingRoom(commands.Cog):
             ),
             file=file,
             embed=embed,
-            view=self.sessions[user.id]["joypad"]
+            view=joypad
         )
 
         data["response_id"] = response.id
 
         self.sessions[user.id]["message"] = response
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/play",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/play", data)
 
     @play.error
     async def on_play_error(self, ctx: discord.ApplicationContext, exception):
@@ -193,13 +255,7 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/play",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/play", data)
 
     @discord.slash_command(
         name="invite",
@@ -222,7 +278,9 @@ class GamingRoom(commands.Cog):
 
         user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
 
-        if user.id not in self.sessions:
+        game = await self.__resume_session(user.id)
+
+        if game is None:
             raise GameNotStarted()
 
         match who.id:
@@ -237,7 +295,8 @@ class GamingRoom(commands.Cog):
             case Celebrity.Jax.value:
                 raise JaxRefusesInvite()
 
-        game = self.sessions[user.id]
+        if game["message"] is None:
+            raise LastMessageNotFound()
 
         invited_user = self.storage_room_cog.user_database.fetch_or_register(who.id)
 
@@ -249,7 +308,7 @@ class GamingRoom(commands.Cog):
             case DMChannel():
                 guild_id = "@me"
             case _:
-                guild_id = game["message"].channel.guild.id
+                guild_id = game["message"].guild.id
 
         message_link = f"https://discord.com/channels/{guild_id}/{game['message'].channel.id}/{game['message'].id}"
 
@@ -265,13 +324,7 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/invite",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/invite", data)
 
     @invite.error
     async def on_invite_error(self, ctx: discord.ApplicationContext, exception):
@@ -335,30 +388,15 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            match data["error"]:
-                case "BoomyRefusesInvite":
-                    requests.post(
-                        f"{Config.BOOMY_API}/gaming-room/invite",
-                        json=data
-                    )
-                case "BerryRefusesInvite":
-                    requests.post(
-                        f"{Config.BERRY_API}/gaming-room/invite",
-                        json=data
-                    )
-                case "JaxRefusesInvite":
-                    requests.post(
-                        f"{Config.JAX_API}/gaming-room/invite",
-                        json=data
-                    )
-                case _:
-                    requests.post(
-                        f"{Config.BOOMY_API}/gaming-room/invite",
-                        json=data
-                    )
-        except requests.exceptions.ConnectionError:
-            pass
+        match data["error"]:
+            case "BoomyRefusesInvite":
+                self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/invite", data)
+            case "BerryRefusesInvite":
+                self.intercom_cog.send(Config.BERRY_API, "/gaming-room/invite", data)
+            case "JaxRefusesInvite":
+                self.intercom_cog.send(Config.JAX_API, "/gaming-room/invite", data)
+            case _:
+                self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/invite", data)
 
     @discord.slash_command(
         name="restart",
@@ -375,23 +413,26 @@ class GamingRoom(commands.Cog):
 
         user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
 
-        if user.id not in self.sessions:
-            raise GameNotStarted()
+        game = await self.__resume_session(user.id)
 
-        game = self.sessions[user.id]
+        if game is None:
+            raise GameNotStarted()
 
         cartridge, instance, users = game["emulator"].game_instance_manager.get_instance_from_user(user)
 
-        instance.restart()
-        cartridge.state = instance.save_state
+        async with self.__get_game_lock(cartridge):
+            instance.restart()
+            cartridge.state = instance.save_state
 
-        game_instance, frame = await self.__start_game(game["emulator"], cartridge, user)
+            game_instance, frame = await self.__start_game(game["emulator"], cartridge, user)
 
         self.storage_room_cog.user_database.update(user.id, user)
 
         image_bytes = FrameUtils.frame_to_bytes(frame)
         file, embed = image_to_embed(image_bytes)
 
+        game["spectators"].publish(image_bytes, False)
+
         if self.sessions[user.id]["message"] is not None:
             try:
                 await self.sessions[user.id]["message"].delete()
@@ -404,20 +445,14 @@ class GamingRoom(commands.Cog):
             ),
             file=file,
             embed=embed,
-            view=self.sessions[user.id]["joypad"]
+            view=self.__build_joypad_for(cartridge, user)
         )
 
         data["response_id"] = response.id
 
         self.sessions[user.id]["message"] = response
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/restart",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/restart", data)
 
     @restart.error
     async def on_restart_error(self, ctx: discord.ApplicationContext, exception):
@@ -449,13 +484,7 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/restart",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/restart", data)
 
     @discord.slash_command(
         name="save",
@@ -472,10 +501,10 @@ class GamingRoom(commands.Cog):
 
         user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
 
-        if user.id not in self.sessions:
-            raise GameNotStarted()
+        game = await self.__resume_session(user.id)
 
-        game = self.sessions[user.id]
+        if game is None:
+            raise GameNotStarted()
 
         cartridge, instance, users = game["emulator"].game_instance_manager.get_instance_from_user(user)
 
@@ -491,13 +520,7 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/save",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/save", data)
 
     @save.error
     async def on_save_error(self, ctx: discord.ApplicationContext, exception):
@@ -529,13 +552,7 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/save",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/save", data)
 
     @discord.slash_command(
         name="load",
@@ -552,25 +569,28 @@ class GamingRoom(commands.Cog):
 
         user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
 
-        if user.id not in self.sessions:
-            raise GameNotStarted()
+        game = await self.__resume_session(user.id)
 
-        game = self.sessions[user.id]
+        if game is None:
+            raise GameNotStarted()
 
         cartridge, instance, users = game["emulator"].game_instance_manager.get_instance_from_user(user)
 
         if cartridge.save_state is None:
             raise NoSaveState()
 
-        cartridge.state = cartridge.save_state
+        async with self.__get_game_lock(cartridge):
+            cartridge.state = cartridge.save_state
 
-        game_instance, frame = await self.__start_game(game["emulator"], cartridge, user)
+            game_instance, frame = await self.__start_game(game["emulator"], cartridge, user)
 
         self.storage_room_cog.user_database.update(user.id, user)
 
         image_bytes = FrameUtils.frame_to_bytes(frame)
         file, embed = image_to_embed(image_bytes)
 
+        game["spectators"].publish(image_bytes, False)
+
         if self.sessions[user.id]["message"] is not None:
             try:
                 await self.sessions[user.id]["message"].delete()
@@ -583,20 +603,14 @@ class GamingRoom(commands.Cog):
             ),
             file=file,
             embed=embed,
-            view=self.sessions[user.id]["joypad"]
+            view=self.__build_joypad_for(cartridge, user)
         )
 
         data["response_id"] = response.id
 
         self.sessions[user.id]["message"] = response
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/load",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/load", data)
 
     @load.error
     async def on_load_error(self, ctx: discord.ApplicationContext, exception):
@@ -632,13 +646,7 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/load",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/load", data)
 
     @discord.slash_command(
         name="rewind",
@@ -655,23 +663,26 @@ class GamingRoom(commands.Cog):
 
         user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
 
-        if user.id not in self.sessions:
-            raise GameNotStarted()
+        game = await self.__resume_session(user.id)
 
-        game = self.sessions[user.id]
+        if game is None:
+            raise GameNotStarted()
 
         cartridge, instance, users = game["emulator"].game_instance_manager.get_instance_from_user(user)
 
-        instance.previous_state()
-        cartridge.state = instance.save_state
+        async with self.__get_game_lock(cartridge):
+            instance.previous_state()
+            cartridge.state = instance.save_state
 
-        game_instance, frame = await self.__start_game(game["emulator"], cartridge, user)
+            game_instance, frame = await self.__start_game(game["emulator"], cartridge, user)
 
         self.storage_room_cog.user_database.update(user.id, user)
 
         image_bytes = FrameUtils.frame_to_bytes(frame)
         file, embed = image_to_embed(image_bytes)
 
+        game["spectators"].publish(image_bytes, False)
+
         if self.sessions[user.id]["message"] is not None:
             try:
                 await self.sessions[user.id]["message"].delete()
@@ -684,20 +695,14 @@ class GamingRoom(commands.Cog):
             ),
             file=file,
             embed=embed,
-            view=self.sessions[user.id]["joypad"]
+            view=self.__build_joypad_for(cartridge, user)
         )
 
         data["response_id"] = response.id
 
         self.sessions[user.id]["message"] = response
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/rewind",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/rewind", data)
 
     @rewind.error
     async def on_rewind_error(self, ctx: discord.ApplicationContext, exception):
@@ -733,13 +738,107 @@ class GamingRoom(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/gaming-room/rewind",
-                json=data
+        self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/rewind", data)
+
+    @discord.slash_command(
+        name="spectate",
+        description="Boomy wheels a screen over here, so everyone can watch a friend play! Again to roll it away."
+    )
+    @option(
+        input_type=discord.SlashCommandOptionType.user,
+        name="who",
+        description="Whose game should Boomy put on the big screen?",
+        required=True
+    )
+    async def spectate(self, ctx: discord.ApplicationContext, who: discord.User):
+        await ctx.defer()
+
+        game = await self.__resume_session(who.id)
+
+        if game is None:
+            raise GameNotStarted()
+
+        if ctx.channel.id in game["spectators"]:
+            game["spectators"].unsubscribe(ctx.channel.id)
+            message = "response.gaming_room.spectate.stopped"
+        else:
+            if len(game["spectators"]) >= SpectatorFeed.MAX_SPECTATORS:
+                raise TooManySpectators()
+
+            game["spectators"].subscribe(ctx.channel)
+            message = "response.gaming_room.spectate.success"
+
+        await ctx.respond(
+            content=translation_manager.translate_random(message, lang=ctx.interaction.locale)
+        )
+
+    @spectate.error
+    async def on_spectate_error(self, ctx: discord.ApplicationContext, exception):
+        match exception.original:
+            case GameNotStarted():
+                message = "response.gaming_room.spectate.fail_no_game"
+            case TooManySpectators():
+                message = "response.gaming_room.spectate.fail_too_many_spectators"
+            case _:
+                message = "response.gaming_room.spectate.fail_unknown"
+                await self.maintenance_room_cog.handle_exception()
+
+        await self.respond_error(
+            interaction=ctx.interaction,
+            message=message,
+            lang=ctx.interaction.locale
+        )
+
+    @discord.slash_command(
+        name="live",
+        description="Boomy leaves your console running—no waiting between presses! Again to pause it."
+    )
+    async def live(self, ctx: discord.ApplicationContext):
+        await ctx.defer()
+
+        user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
+
+        game = await self.__resume_session(user.id)
+
+        if game is None:
+            raise GameNotStarted()
+
+        if game["message"] is None:
+            raise LastMessageNotFound()
+
+        if game["live_stream"] is not None and game["live_stream"].running:
+            game["live_stream"].stop()
+            message = "response.gaming_room.live.stopped"
+        else:
+            game["live_stream"] = LiveStream(
+                emulate=lambda presses: self.__emulate_chunk(game, user, presses),
+                upload=lambda chunk: self.__upload_chunk(game, chunk)
             )
-        except requests.exceptions.ConnectionError:
-            pass
+            game["live_stream"].start()
+            message = "response.gaming_room.live.success"
+
+        await ctx.respond(
+            content=translation_manager.translate_random(message, lang=ctx.interaction.locale)
+        )
+
+    @live.error
+    async def on_live_error(self, ctx: discord.ApplicationContext, exception):
+        match exception.original:
+            case GameNotStarted():
+                message = "response.gaming_room.live.fail_no_game"
+            case LastMessageNotFound():
+                message = "response.gaming_room.live.fail_msg_not_found"
+            case TooManyLiveStreams():
+                message = "response.gaming_room.live.fail_too_many_live_streams"
+            case _:
+                message = "response.gaming_room.live.fail_unknown"
+                await self.maintenance_room_cog.handle_exception()
+
+        await self.respond_error(
+            interaction=ctx.interaction,
+            message=message,
+            lang=ctx.interaction.locale
+        )
 
     async def repair_submit(self, ctx: discord.ApplicationContext):
         """
@@ -782,17 +881,176 @@ class GamingRoom(commands.Cog):
         return emulator.start(cartridge, user)
 
     @staticmethod
-    async def __play_game(
+    def __play_game(
             emulator: BaseEmulator,
             cartridge: Cartridge,
-            user: User,
-            button=None
-    ) -> tuple[BaseGameInstance, list[Image]]:
-        return emulator.input(cartridge=cartridge, user=user, button=button)
+            presses: list[tuple[User, str | None]]
+    ) -> tuple[bytes, bool]:
+        """
+        Emulate one or more presses and encode what they show, away from the event loop.
+        Everything it reads from the database must already be loaded, the session is not thread safe.
+        :param emulator:
+        :param cartridge:
+        :param presses: More than one only for emulators that take every player's input at once
+        :return: A PNG, or a GIF and True if the presses showed more than one frame
+        """
+        if len(presses) == 1:
+            user, button = presses[0]
+            game_instance, frames = emulator.input(cartridge=cartridge, user=user, button=button)
+        else:
+            game_instance, frames = emulator.input_many(cartridge=cartridge, presses=presses)
 
-    def __build_gameboy_joypad(
-            self, emulator: GameBoyEmulator, cartridge: GameBoyCartridge, user: User | Type[User]
-    ) -> View:
+        if len(frames) == 1:
+            return FrameUtils.frame_to_bytes(frames[0]), False
+
+        return FrameUtils.frames_to_bytes(frames), True
+
+    @staticmethod
+    def __play_chunk(
+            emulator: BaseEmulator,
+            cartridge: Cartridge,
+            owner: User,
+            presses: list[tuple[User, str | None]]
+    ) -> bytes:
+        """
+        Play the presses made since the last chunk, then keep the game running for one more chunk.
+        :param emulator:
+        :param cartridge:
+        :param owner:
+        :param presses:
+        :return: A GIF, at a reduced frame rate
+        """
+        frames: list[Image] = []
+
+        for user, button in presses:
+            game_instance, press_frames = emulator.input(cartridge=cartridge, user=user, button=button)
+            frames += press_frames
+
+        game_instance, chunk_frames = emulator.input(
+            cartridge=cartridge, user=owner, button=GamingRoom.LIVE_CHUNK_BUTTON
+        )
+        frames += chunk_frames
+
+        return FrameUtils.frames_to_bytes(
+            frames[::GamingRoom.LIVE_FRAME_STEP], fps=30 // GamingRoom.LIVE_FRAME_STEP
+        )
+
+    async def __emulate_chunk(
+            self,
+            session: GamingSession,
+            owner: User,
+            presses: list[tuple[User, str | None]]
+    ) -> bytes:
+        emulator, cartridge = session["emulator"], session["cartridge"]
+
+        async with self.__get_game_lock(cartridge):
+            for user, _ in [(owner, None), *presses]:
+                emulator.game_instance_manager.get_game_instance(cartridge, user)
+
+            emulator.prepare(cartridge)
+            playing = asyncio.ensure_future(asyncio.to_thread(self.__play_chunk, emulator, cartridge, owner, presses))
+
+            try:
+                chunk = await asyncio.shield(playing)
+            except asyncio.CancelledError:
+                # A stopped stream's thread keeps playing, the game is only let go once it is done
+                await asyncio.wait({playing})
+                raise
+
+        self.storage_room_cog.user_database.update(owner.id, owner)
+
+        return chunk
+
+    async def __upload_chunk(self, session: GamingSession, chunk: bytes):
+        file, embed = self.__publish_frame(session, chunk, True)
+
+        try:
+            await session["message"].edit(file=file, embed=embed)
+        except discord.HTTPException as e:
+            # The stream goes on, the next chunk is tried regardless
+            logger.warning(f"Could not upload a live chunk to {session['message'].channel.id}: {e}")
+
+    @staticmethod
+    def __publish_frame(
+            session: GamingSession,
+            image_bytes: bytes,
+            animated: bool
+    ) -> tuple[discord.File, discord.Embed]:
+        # Spectators upload the same bytes as the player, alongside the player's own edit
+        session["spectators"].publish(image_bytes, animated)
+
+        if animated:
+            return gif_to_embed(image_bytes)
+
+        return image_to_embed(image_bytes)
+
+    @staticmethod
+    def __create_input_window(cartridge: Cartridge) -> InputWindow | None:
+        # Only the NES takes both players' buttons in the same frames
+        if isinstance(cartridge, NESCartridge):
+            return InputWindow(Config.NES_INPUT_WINDOW, 2)
+
+        return None
+
+    async def __press(self, session: GamingSession, user: User, button: str) -> tuple[bytes, bool, bool]:
+        """
+        :param session:
+        :param user:
+        :param button:
+        :return: The frame, whether it is animated, and whether this press is the one to show it
+        """
+        window = session["input_window"]
+        users = session["emulator"].game_instance_manager.get_users(session["cartridge"])
+
+        # Only checked here, the game is started or woken by __emulate under its lock
+        if users is not None and user.id not in users:
+            raise UnauthorizedJoypadAccess()
+
+        # Nobody to wait for when playing alone
+        if window is None or users is None or len(users) < 2:
+            image_bytes, animated = await self.__emulate(session, [(user, button)])
+            return image_bytes, animated, True
+
+        (image_bytes, animated), leader = await window.submit(
+            (user, button), lambda presses: self.__emulate(session, presses)
+        )
+
+        return image_bytes, animated, leader
+
+    async def __emulate(self, session: GamingSession, presses: list[tuple[User, str | None]]) -> tuple[bytes, bool]:
+        emulator, cartridge = session["emulator"], session["cartridge"]
+
+        async with self.__get_game_lock(cartridge):
+            # Started here rather than in the thread, starting a game may load its ROM from the database
+            for user, _ in presses:
+                emulator.game_instance_manager.get_game_instance(cartridge, user)
+
+            emulator.prepare(cartridge)
+            return await asyncio.to_thread(self.__play_game, emulator, cartridge, presses)
+
+    def __get_game_lock(self, cartridge: Cartridge) -> asyncio.Lock:
+        # Presses emulate in a thread, nothing else may touch the same game meanwhile, hibernating it included
+        return self.__get_emulator(cartridge).game_instance_manager.get_lock(cartridge)
+
+    def __build_joypad_for(self, cartridge: Cartridge, owner: User | Type[User]) -> View:
+        match cartridge:
+            case GameBoyCartridge():
+                return self.__build_gameboy_joypad(cartridge, owner)
+            case NESCartridge():
+                return self.__build_nes_joypad(cartridge, owner)
+            case _:
+                raise ConsoleNotValid()
+
+    def __get_emulator(self, cartridge: Cartridge) -> BaseEmulator:
+        match cartridge:
+            case GameBoyCartridge():
+                return self.gameboy_emulator
+            case NESCartridge():
+                return self.nes_emulator
+            case _:
+                raise ConsoleNotValid()
+
+    def __build_gameboy_joypad(self, cartridge: GameBoyCartridge, owner: User | Type[User]) -> View:
         return self.__build_joypad(
             layout=[
                 "empty", "up", "empty", "empty", "a",
@@ -814,12 +1072,11 @@ class GamingRoom(commands.Cog):
                 "frame 30": discord.ButtonStyle.green,
                 "frame 60": discord.ButtonStyle.green
             },
-            emulator=emulator,
             cartridge=cartridge,
-            owner=user
+            owner=owner
         )
 
-    def __build_nes_joypad(self, emulator: NESEmulator, cartridge: NESCartridge, owner: User | Type[User]) -> View:
+    def __build_nes_joypad(self, cartridge: NESCartridge, owner: User | Type[User]) -> View:
         return self.__build_joypad(
             layout=[
                 "empty", "up", "empty", "b", "a",
@@ -840,7 +1097,6 @@ class GamingRoom(commands.Cog):
                 "frame 30": discord.ButtonStyle.green,
                 "frame 60": discord.ButtonStyle.green
             },
-            emulator=emulator,
             cartridge=cartridge,
             owner=owner
         )
@@ -850,9 +1106,17 @@ class GamingRoom(commands.Cog):
             layout,
             style: dict[str, ButtonStyle],
             owner: User | Type[User],
-            emulator: BaseEmulator,
             cartridge: Cartridge
     ) -> View:
+        """
+        Lay out the joypad buttons of a session, only used to send them along with a message.
+        Presses are routed by on_interaction from the button's custom_id, so no view is kept per session.
+        :param layout:
+        :param style:
+        :param owner:
+        :param cartridge:
+        :return:
+        """
         view = View(timeout=None)
 
         for index, action in enumerate(layout):
@@ -869,37 +1133,137 @@ class GamingRoom(commands.Cog):
                 )
                 continue
 
-            button = discord.ui.Button(
-                label=action.capitalize(),
-                style=style.get(action, discord.ButtonStyle.secondary),
-                row=row,
-                custom_id=f"joypad:{action}"
+            view.add_item(
+                discord.ui.Button(
+                    label=action.capitalize(),
+                    style=style.get(action, discord.ButtonStyle.secondary),
+                    row=row,
+                    custom_id=f"{self.JOYPAD_PREFIX}:{owner.id}:{cartridge.id}:{action}"
+                )
             )
 
-            def __make_press_callback(button: str):
-                async def on_button_press(interaction: discord.Interaction):
-                    await self.__press_joypad(interaction, view, owner, emulator, cartridge, button)
+        # A finished view is not kept in the bot's view store when the message is sent
+        view.stop()
 
-                return on_button_press
+        return view
 
-            button.callback = __make_press_callback(action)
-            view.add_item(button)
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        if interaction.type != discord.InteractionType.component:
+            return
 
-        return view
+        custom_id: str = (interaction.data or {}).get("custom_id", "")
+
+        try:
+            prefix, owner_id, cartridge_id, action = custom_id.split(":", 3)
+            owner_id, cartridge_id = int(owner_id), int(cartridge_id)
+        except ValueError:
+            # Not a joypad, or one sent before joypads were routed by custom_id
+            return
+
+        if prefix != self.JOYPAD_PREFIX:
+            return
+
+        await self.__press_joypad(interaction, owner_id, cartridge_id, action)
+
+    async def __resume_session(
+            self,
+            owner_id: int,
+            cartridge_id: int | None = None,
+            message: discord.Message | None = None
+    ) -> GamingSession | None:
+        """
+        Find a player's session, starting it again if it was lost, like after a restart.
+        :param owner_id:
+        :param cartridge_id: The game a joypad belongs to, if the session is needed for a press
+        :param message: The joypad's message
+        :return: None if the player has no such game, or is not playing it anymore
+        """
+        session = self.sessions.get(owner_id)
+
+        if session is None:
+            # A reloaded cog may still be checkpointing the games this one is about to start
+            await Checkpoint.wait_written()
+
+            checkpoint = Checkpoint.read(
+                self.__get_checkpoint_name(owner_id), max_age=BaseGameInstanceManager.HIBERNATION_TIMEOUT
+            )
+
+            if checkpoint is not None:
+                checkpoint_cartridge_id, channel_id, message_id = checkpoint
+
+                if message is None and message_id is not None:
+                    message = await self.__fetch_message(channel_id, message_id)
+
+                session = self.__start_session(owner_id, checkpoint_cartridge_id, message)
+            elif cartridge_id is not None:
+                session = self.__start_session(owner_id, cartridge_id, message)
+
+        if session is None or session["cartridge"] is None:
+            return None
+
+        if cartridge_id is not None and session["cartridge"].id != cartridge_id:
+            return None
+
+        return session
+
+    def __start_session(
+            self,
+            owner_id: int,
+            cartridge_id: int,
+            message: discord.Message | discord.PartialMessage | None
+    ) -> GamingSession | None:
+        try:
+            cartridge = self.storage_room_cog.cartridge_database.fetch_cartridge(cartridge_id)
+        except GameDoesNotExist:
+            return None
+
+        if cartridge.user_id != owner_id:
+            return None
+
+        emulator = self.__get_emulator(cartridge)
+        owner = self.storage_room_cog.user_database.fetch_or_register(owner_id)
+
+        # Woken up with its players if it was checkpointed, otherwise the owner must be the first player
+        emulator.game_instance_manager.get_game_instance(cartridge, owner)
+
+        session: GamingSession = {
+            "emulator": emulator,
+            "cartridge": cartridge,
+            "message": message,
+            "spectators": SpectatorFeed(),
+            "input_window": self.__create_input_window(cartridge),
+            "live_stream": None
+        }
+
+        self.sessions[owner_id] = session
+
+        return session
+
+    async def __fetch_message(self, channel_id: int, message_id: int) -> discord.Message | None:
+        # The real channel, a partial one knows neither its guild nor whether it is a DM
+        try:
+            channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+
+            return await channel.fetch_message(message_id)
+        except discord.HTTPException:
+            return None
 
     async def __press_joypad(
             self,
             interaction: discord.Interaction,
-            view: View,
-            owner: User | Type[User],
-            emulator: BaseEmulator,
-            cartridge: Cartridge,
+            owner_id: int,
+            cartridge_id: int,
             button: str
     ):
-        await interaction.response.defer()
+        # Discord's deadline runs from when the press arrived, not from when it got its turn
+        deadline = asyncio.get_running_loop().time() + self.FAST_PATH_DEADLINE
+
+        self.sessions.touch(owner_id)
 
         data: dict[str, Any] = {
             "channel_id": interaction.channel.id,
+            "guild_id": interaction.guild_id,
             "response_id": interaction.message.id,
             "locale": interaction.locale,
             "error": None,
@@ -907,25 +1271,61 @@ class GamingRoom(commands.Cog):
         }
 
         try:
+            session = await self.__resume_session(owner_id, cartridge_id, interaction.message)
+
+            if session is None:
+                await interaction.response.defer()
+                return
+
+            owner = self.storage_room_cog.user_database.fetch_or_register(owner_id)
             user = self.storage_room_cog.user_database.fetch_or_register(interaction.user.id)
 
-            game_instance, frames = await self.__play_game(emulator, cartridge, user, button)
+            if session["live_stream"] is not None and session["live_stream"].running:
+                # The game is running anyway, the press shows up in the next chunk
+                session["live_stream"].press((user, button))
+                await interaction.response.defer()
+                return
 
-            self.storage_room_cog.user_database.update(owner.id, owner)
+            # Queued behind another press or a chunk, the frame would not be ready in time anyway
+            if self.__get_game_lock(session["cartridge"]).locked():
+                timeout = 0
+            else:
+                timeout = max(0.0, deadline - asyncio.get_running_loop().time())
+
+            press = asyncio.create_task(self.__press(session, user, button))
+            done, _ = await asyncio.wait({press}, timeout=timeout)
+
+            if press in done:
+                image_bytes, animated, leader = press.result()
 
-            if len(frames) == 1:
-                image_bytes = FrameUtils.frame_to_bytes(frames[0])
-                file, embed = image_to_embed(image_bytes)
+                if leader:
+                    file, embed = self.__publish_frame(session, image_bytes, animated)
+
+                    # Answering with the new frame right away saves the defer round-trip
+                    await interaction.response.edit_message(
+                        content=interaction.message.content,
+                        file=file,
+                        embed=embed
+                    )
+                else:
+                    # The press that opened the window shows the frame for everyone in it
+                    await interaction.response.defer()
             else:
-                gif_bytes = FrameUtils.frames_to_bytes(frames)
-                file, embed = gif_to_embed(gif_bytes)
-
-            await interaction.message.edit(
-                content=interaction.message.content,
-                file=file,
-                embed=embed,
-                view=view
-            )
+                await interaction.response.defer()
+
+                image_bytes, animated, leader = await press
+
+                if leader:
+                    file, embed = self.__publish_frame(session, image_bytes, animated)
+
+                    # The joypad is left out, so the message keeps the buttons it already has
+                    await interaction.message.edit(
+                        content=interaction.message.content,
+                        file=file,
+                        embed=embed
+                    )
+
+            self.storage_room_cog.user_database.update(owner.id, owner)
         except UnauthorizedJoypadAccess:
             data["error"] = "UnauthorizedJoypadAccess"
         except NotEnoughJoypads:
@@ -945,18 +1345,13 @@ class GamingRoom(commands.Cog):
                 error = "response.gaming_room.play.fail_unknown"
 
         if error is not None:
-            await interaction.followup.send(
+            # The press may have failed before anything was sent back
+            await interaction.respond(
                 ephemeral=True,
                 content=translation_manager.translate_random(error, lang=interaction.locale)
             )
 
-            try:
-                requests.post(
-                    f"{Config.BOOMY_API}/gaming-room/joypad",
-                    json=data
-                )
-            except requests.exceptions.ConnectionError:
-                pass
+            self.intercom_cog.send(Config.BOOMY_API, "/gaming-room/joypad", data)
 
     @staticmethod
     async def respond_error(interaction: discord.Interaction, message: str, lang, prefix="", suffix="", **kwargs):
@@ -998,6 +1393,15 @@ class GamingRoom(commands.Cog):
 
         return maintenance_room_cog
 
+    @property
+    def intercom_cog(self):
+        intercom_cog: Intercom | None = self.bot.get_cog("Intercom")
+
+        if intercom_cog is None:
+            raise CogNotRegistered()
+
+        return intercom_cog
+
 
 __gaming_room_cog: GamingRoom | None = None
 
@@ -1017,5 +1421,6 @@ def teardown(bot):
     if not __gaming_room_cog:
         return
 
-    bot.loop.create_task(__gaming_room_cog.cog_unload())
+    # Its replacement is set up right away, and waits for this before reading any checkpoint
+    Checkpoint.track(bot.loop.create_task(__gaming_room_cog.cog_unload()))
     __gaming_room_cog = None
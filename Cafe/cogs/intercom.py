@@ -0,0 +1,50 @@
+from typing import Any
+
+import discord
+from discord.ext import commands
+
+from utils.event_client import EventClient
+
+
+class Intercom(commands.Cog):
+    def __init__(self, bot: discord.Bot):
+        self.bot = bot
+        self.__event_client = EventClient()
+
+    async def load(self):
+        await self.__event_client.start()
+
+    async def unload(self):
+        await self.__event_client.close()
+
+    def send(self, api: str, path: str, data: dict[str, Any]):
+        """
+        Let the other bots know what happened, without waiting for them.
+        :param api:
+        :param path:
+        :param data:
+        :return:
+        """
+        self.__event_client.send(api, path, data)
+
+
+__intercom_cog: Intercom | None = None
+
+
+def setup(bot):
+    global __intercom_cog
+
+    __intercom_cog = Intercom(bot)
+    bot.add_cog(__intercom_cog)
+
+    bot.loop.create_task(__intercom_cog.load())
+
+
+def teardown(bot):
+    global __intercom_cog
+
+    if not __intercom_cog:
+        return
+
+    bot.loop.create_task(__intercom_cog.unload())
+    __intercom_cog = None
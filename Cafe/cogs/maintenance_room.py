@@ -37,13 +37,14 @@ class MaintenanceRoom(commands.Cog):
                 return
 
             if "yes" in content:
-                user = self.storage_room_cog.user_database.fetch_or_register(Celebrity.Zark.value)
-                user.premium = True
-                self.storage_room_cog.user_database.update(user.id, user)
-
-                user = self.storage_room_cog.user_database.fetch_or_register(Celebrity.Amethyst.value)
-                user.premium = True
-                self.storage_room_cog.user_database.update(user.id, user)
+                async with self.storage_room_cog.unit_of_work() as vault:
+                    user = await vault.user_database.fetch_or_register(Celebrity.Zark.value)
+                    user.premium = True
+                    await vault.user_database.update(user.id, user)
+
+                    user = await vault.user_database.fetch_or_register(Celebrity.Amethyst.value)
+                    user.premium = True
+                    await vault.user_database.update(user.id, user)
 
     async def handle_exception(self):
         owner = await self.bot.fetch_user(self.bot.owner_id)
@@ -1,11 +1,10 @@
 from typing import Any
 
 import discord
-import requests
 from discord.ext import commands
 from poke_env import ServerConfiguration
-from poke_env.teambuilder import TeambuilderPokemon
 from vault.data.characters import Celebrity, Characters
+from vault.data.database.pokemon import Pokemon
 from vault.exceptions.berry_refuses_battle import BerryRefusesBattle
 from vault.exceptions.boomy_refuses_battle import BoomyRefusesBattle
 from vault.exceptions.cafe_refuses_battle import CafeRefusesBattle
@@ -16,20 +15,36 @@ from vault.exceptions.jax_refuses_battle import JaxRefusesBattle
 from vault.exceptions.no_pokemon_data import NoPokemonData
 from vault.exceptions.opponent_has_no_pokemon_data import OpponentHasNoPokemonData
 from vault.exceptions.user_cannot_challenge_self import UserCannotChallengeSelf
+from vault.utils.expiring_store import ExpiringStore
 
+from cogs.intercom import Intercom
 from cogs.maintenance_room import MaintenanceRoom
 from cogs.storage_room import StorageRoom
 from config import Config
 from main import translation_manager
-from pokemon.players.boomy_player import BoomyPlayer
-from pokemon.players.discord_random_player import DiscordRandomPlayer
+from pokemon.player_pool import PlayerPool
 from pokemon.single_mon_teambuilder import SingleMonTeambuilder
+from pokemon.team_validator import TeamValidator
 
 
 class Stadium(commands.Cog):
+    BATTLE_FORMAT = "[Gen 9] Boomy's Gaming Cafe"
+    REGISTER_FORMAT = "[Gen 8] Boomy's Gaming Cafe"
+
     def __init__(self, bot: discord.Bot):
         self.bot = bot
-        self.battles: dict[int, int] = dict()
+        self.battles: ExpiringStore[int, int] = ExpiringStore(ttl=30 * 60, max_size=1024)
+        self.__team_validator = TeamValidator(self.BATTLE_FORMAT)
+        self.__player_pool = PlayerPool(
+            ServerConfiguration(Config.SHOWDOWN_SERVER, "https://play.pokemonshowdown.com/action.php?"),
+            Config.SHOWDOWN_POOL_SIZE
+        )
+
+    async def load(self):
+        self.__player_pool.start()
+
+    async def unload(self):
+        await self.__player_pool.close()
 
     # stadium = discord.SlashCommandGroup(
     #     name="stadium"
@@ -55,7 +70,7 @@ class Stadium(commands.Cog):
         if not user.pokemon.mon:
             raise NoPokemonData()
 
-        user_team = SingleMonTeambuilder(user.pokemon.mon)
+        user_team = self.__get_team(user.pokemon)
 
         match who.id:
             case ctx.author.id:
@@ -63,7 +78,7 @@ class Stadium(commands.Cog):
             case self.bot.user.id:
                 raise CafeRefusesBattle()
             case Celebrity.Boomy.value:
-                opponent_team = SingleMonTeambuilder(Characters.Boomy["pokemon"])
+                opponent_team = SingleMonTeambuilder.cached(Characters.Boomy["pokemon"])
             case Celebrity.Berry.value:
                 raise BerryRefusesBattle()
             case Celebrity.Jax.value:
@@ -74,7 +89,7 @@ class Stadium(commands.Cog):
                 if not opponent.pokemon.mon:
                     raise OpponentHasNoPokemonData()
 
-                opponent_team = SingleMonTeambuilder(opponent.pokemon.mon)
+                opponent_team = self.__get_team(opponent.pokemon)
 
         # f"Interactive battle: {interaction.user.display_name} vs {opponent.display_name}"
         response = await ctx.respond(
@@ -86,53 +101,26 @@ class Stadium(commands.Cog):
 
         data["response_id"] = response.id
 
-        server_cfg = ServerConfiguration(Config.SHOWDOWN_SERVER, "https://play.pokemonshowdown.com/action.php?")
-
-        p1 = DiscordRandomPlayer(
-            server_configuration=server_cfg,
-            battle_format="[Gen 9] Boomy's Gaming Cafe",
-            team=user_team,
-            message=response
-        )
-
-        match who.id:
-            case Celebrity.Boomy.value:
-                p2 = BoomyPlayer(
-                    server_configuration=server_cfg,
-                    battle_format="[Gen 9] Boomy's Gaming Cafe",
-                    team=opponent_team,
-                    message=response
-                )
-            case _:
-                p2 = DiscordRandomPlayer(
-                    server_configuration=server_cfg,
-                    battle_format="[Gen 9] Boomy's Gaming Cafe",
-                    team=opponent_team,
-                    message=response
+        async with (
+            self.__player_pool.lease(user_team, self.BATTLE_FORMAT) as p1,
+            self.__lease_opponent(who, opponent_team) as p2
+        ):
+            await response.edit(
+                content=translation_manager.translate_random(
+                    "response.stadium.battle.ready", lang=ctx.interaction.locale,
+                    user=ctx.author.display_name, opponent=who.display_name
                 )
-
-        await response.edit(
-            content=translation_manager.translate_random(
-                "response.stadium.battle.ready", lang=ctx.interaction.locale,
-                user=ctx.author.display_name, opponent=who.display_name
             )
-        )
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/stadium/battle",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+            self.intercom_cog.send(Config.BOOMY_API, "/stadium/battle", data)
 
-        await p1.battle_against(p2, n_battles=1)
+            won = await PlayerPool.battle(p1, p2, message=response)
 
         winner = None
 
-        if p1.n_won_battles > p2.n_won_battles:
+        if won is True:
             winner = ctx.author
-        elif p2.n_won_battles > p1.n_won_battles:
+        elif won is False:
             winner = who
 
         await response.followup.send(
@@ -146,13 +134,7 @@ class Stadium(commands.Cog):
         if winner is not None:
             data["winner_id"] = winner.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/stadium/battle",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/stadium/battle", data)
 
     # @battle.error
     async def on_battle_error(self, ctx: discord.ApplicationContext, exception):
@@ -212,13 +194,7 @@ class Stadium(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/stadium/battle",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/stadium/battle", data)
 
     # @stadium.command(
     #     name="register",
@@ -249,44 +225,20 @@ class Stadium(commands.Cog):
         file_bytes = await file.read()
         pokemon = "\n".join(file_bytes.decode("utf-8").splitlines())
 
-        try:
-            mon = TeambuilderPokemon.from_showdown(pokemon)
-            data["species"] = mon.species
-        except ValueError:
-            raise InvalidPokemonTeam()
-
-        user.pokemon.mon = pokemon
-
-        user_team = SingleMonTeambuilder(user.pokemon.mon)
-        opponent_team = SingleMonTeambuilder(Characters.Boomy["pokemon"])
+        mon, problems = self.__team_validator.validate(pokemon)
 
-        server_cfg = ServerConfiguration(Config.SHOWDOWN_SERVER, "https://play.pokemonshowdown.com/action.php?")
+        if problems:
+            raise InvalidPokemonTeam([str(problem) for problem in problems])
 
-        p1 = DiscordRandomPlayer(
-            server_configuration=server_cfg,
-            battle_format="[Gen 8] Boomy's Gaming Cafe",
-            team=user_team
-        )
+        data["species"] = mon.species
 
-        p2 = BoomyPlayer(
-            server_configuration=server_cfg,
-            battle_format="[Gen 8] Boomy's Gaming Cafe",
-            team=opponent_team
-        )
-
-        await p1.battle_against(p2, n_battles=1)
-
-        winner = None
-
-        if p1.n_won_battles > p2.n_won_battles:
-            winner = ctx.author
-        elif p2.n_won_battles > p1.n_won_battles:
-            winner = self.bot.user
-
-        if winner is None:
-            raise InvalidPokemonTeam()
+        user.pokemon.mon = pokemon
+        user.pokemon.packed = SingleMonTeambuilder.join_team([mon])
+        user.pokemon.fingerprint = TeamValidator.fingerprint(pokemon)
 
-        data["winner_id"] = winner.id
+        if Config.STADIUM_DEEP_CHECK:
+            winner = await self.__deep_check(ctx, user.pokemon.mon)
+            data["winner_id"] = winner.id
 
         self.storage_room_cog.user_database.update(user.id, user)
 
@@ -298,13 +250,45 @@ class Stadium(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/stadium/register",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/stadium/register", data)
+
+    @staticmethod
+    def __get_team(pokemon: Pokemon) -> SingleMonTeambuilder:
+        # Teams registered before packing existed, or under older rules, are still parsed from their raw text
+        if pokemon.packed and pokemon.fingerprint == TeamValidator.fingerprint(pokemon.mon):
+            return SingleMonTeambuilder.from_packed(pokemon.packed)
+
+        return SingleMonTeambuilder(pokemon.mon)
+
+    def __lease_opponent(self, who: discord.User, team: SingleMonTeambuilder):
+        match who.id:
+            case Celebrity.Boomy.value:
+                return self.__player_pool.lease_boomy(team, self.BATTLE_FORMAT)
+            case _:
+                return self.__player_pool.lease(team, self.BATTLE_FORMAT)
+
+    async def __deep_check(self, ctx: discord.ApplicationContext, team: str) -> discord.User:
+        """
+        Let the Showdown server have the last word on a team, by battling Boomy with it.
+        :param ctx:
+        :param team:
+        :return: The winner
+        """
+        user_team = SingleMonTeambuilder(team)
+        opponent_team = SingleMonTeambuilder.cached(Characters.Boomy["pokemon"])
+
+        async with (
+            self.__player_pool.lease(user_team, self.REGISTER_FORMAT) as p1,
+            self.__player_pool.lease_boomy(opponent_team, self.REGISTER_FORMAT) as p2
+        ):
+            won = await PlayerPool.battle(p1, p2)
+
+        if won is True:
+            return ctx.author
+        elif won is False:
+            return self.bot.user
+
+        raise InvalidPokemonTeam()
 
     # @register.error
     async def on_register_error(self, ctx: discord.ApplicationContext, exception):
@@ -332,21 +316,21 @@ class Stadium(commands.Cog):
             case _:
                 message = "response.stadium.register.fail_unknown"
 
+        suffix = ""
+
+        if isinstance(exception.original, InvalidPokemonTeam):
+            suffix = "".join(f"\n-# - {problem}" for problem in exception.original.problems)
+
         response = await self.respond_error(
             interaction=ctx.interaction,
             message=message,
-            lang=ctx.interaction.locale
+            lang=ctx.interaction.locale,
+            suffix=suffix
         )
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/stadium/register",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/stadium/register", data)
 
     # @stadium.command(
     #     name="info",
@@ -361,7 +345,8 @@ class Stadium(commands.Cog):
             "locale": ctx.interaction.locale
         }
 
-        user = self.storage_room_cog.user_database.fetch_or_register(ctx.author.id)
+        async with self.storage_room_cog.unit_of_work() as vault:
+            user = await vault.user_database.fetch_or_register(ctx.author.id)
 
         if not user.pokemon.mon:
             raise NoPokemonData()
@@ -376,13 +361,7 @@ class Stadium(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/stadium/info",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/stadium/info", data)
 
     # @info.error
     async def on_info_error(self, ctx: discord.ApplicationContext, exception):
@@ -415,13 +394,7 @@ class Stadium(commands.Cog):
 
         data["response_id"] = response.id
 
-        try:
-            requests.post(
-                f"{Config.BOOMY_API}/stadium/info",
-                json=data
-            )
-        except requests.exceptions.ConnectionError:
-            pass
+        self.intercom_cog.send(Config.BOOMY_API, "/stadium/info", data)
 
     @staticmethod
     async def respond_error(interaction: discord.Interaction, message: str, lang, prefix="", suffix="", **kwargs):
@@ -463,6 +436,33 @@ class Stadium(commands.Cog):
 
         return maintenance_room_cog
 
+    @property
+    def intercom_cog(self):
+        intercom_cog: Intercom | None = self.bot.get_cog("Intercom")
+
+        if intercom_cog is None:
+            raise CogNotRegistered()
+
+        return intercom_cog
+
+
+__stadium_cog: Stadium | None = None
+
 
 def setup(bot):
-    bot.add_cog(Stadium(bot))
+    global __stadium_cog
+
+    __stadium_cog = Stadium(bot)
+    bot.add_cog(__stadium_cog)
+
+    bot.loop.create_task(__stadium_cog.load())
+
+
+def teardown(bot):
+    global __stadium_cog
+
+    if not __stadium_cog:
+        return
+
+    bot.loop.create_task(__stadium_cog.unload())
+    __stadium_cog = None
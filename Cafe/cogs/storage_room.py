@@ -1,3 +1,7 @@
+import asyncio
+
+from typing import AsyncContextManager
+
 import discord
 from discord.ext import commands
 from sqlalchemy import create_engine
@@ -7,12 +11,18 @@ from vault.data.database.gameboy_cartridge import GameBoyCartridge
 from vault.data.database.gameboy_profile import GameBoyProfile
 from vault.data.database.nes_cartridge import NESCartridge
 from vault.data.database.pokemon import Pokemon
+from vault.data.database.rom import Rom
 from vault.data.database.statistics import Statistics
 from vault.data.database.user import User
+from vault.database.async_vault import AsyncVault, UnitOfWork
 from vault.database.cartridge_database import CartridgeDatabase
+from vault.database.migrations import Migrations
+from vault.database.rom_database import RomDatabase
+from vault.database.user_cache import UserCache
 from vault.database.user_database import UserDatabase
 
 from config import Config
+from logger import logger
 
 
 class StorageRoom(commands.Cog):
@@ -21,29 +31,70 @@ class StorageRoom(commands.Cog):
         self.__session = None
         self.__user_database = None
         self.__cartridge_database = None
+        self.__async_vault = None
+        self.__rom_database = None
 
     async def cog_load(self):
-        engine = create_engine(Config.DATABASE_CONNECTION, echo=True)
+        engine = create_engine(
+            Config.DATABASE_CONNECTION,
+            echo=True,
+            pool_pre_ping=True,
+            pool_recycle=Config.DATABASE_POOL_RECYCLE
+        )
 
         User.metadata.create_all(engine)
         Statistics.metadata.create_all(engine)
         Pokemon.metadata.create_all(engine)
         GameBoyProfile.metadata.create_all(engine)
+        Rom.metadata.create_all(engine)
         Cartridge.metadata.create_all(engine)
         GameBoyCartridge.metadata.create_all(engine)
         NESCartridge.metadata.create_all(engine)
 
-        self.__session = Session(engine)
-        self.__user_database = UserDatabase(self.__session)
+        Migrations.run(engine)
+
+        # Cached users stay usable after a commit instead of reloading on their next attribute access
+        self.__session = Session(engine, expire_on_commit=False)
+        user_cache = UserCache()
+        self.__user_database = UserDatabase(self.__session, user_cache)
         self.__cartridge_database = CartridgeDatabase(self.__session)
 
+        self.__async_vault = AsyncVault(
+            Config.DATABASE_ASYNC_CONNECTION,
+            pool_size=Config.DATABASE_POOL_SIZE,
+            max_overflow=Config.DATABASE_MAX_OVERFLOW,
+            pool_recycle=Config.DATABASE_POOL_RECYCLE,
+            user_cache=user_cache
+        )
+        self.__rom_database = RomDatabase(self.__session)
+
+        self.bot.loop.create_task(self.__compress_save_states(engine))
+
+    @staticmethod
+    async def __compress_save_states(engine):
+        def compress_save_states() -> int:
+            # Runs on its own session, the shared one must not be touched from another thread
+            with Session(engine) as session:
+                return CartridgeDatabase(session).compress_save_states()
+
+        try:
+            compressed = await asyncio.to_thread(compress_save_states)
+            logger.info(f"Compressed save states of {compressed} cartridges")
+        except Exception as e:
+            logger.error(f"Failed to compress save states. Reason: {e}")
+
     async def cog_unload(self):
+        if self.__async_vault:
+            await self.__async_vault.dispose()
+            self.__async_vault = None
+
         if self.__session:
             self.__session.close()
             self.__session = None
 
             self.__user_database = None
             self.__cartridge_database = None
+            self.__rom_database = None
 
     async def list(self, ctx):
         """
@@ -69,6 +120,13 @@ class StorageRoom(commands.Cog):
         """
         raise NotImplemented()
 
+    def unit_of_work(self) -> AsyncContextManager[UnitOfWork]:
+        """
+        Open a session scoped to a single interaction on the pooled async engine.
+        :return:
+        """
+        return self.__async_vault.unit_of_work()
+
     @property
     def user_database(self) -> UserDatabase:
         return self.__user_database
@@ -77,6 +135,10 @@ class StorageRoom(commands.Cog):
     def cartridge_database(self) -> CartridgeDatabase:
         return self.__cartridge_database
 
+    @property
+    def rom_database(self) -> RomDatabase:
+        return self.__rom_database
+
 
 __storage_room_cog: StorageRoom | None = None
 
@@ -42,13 +42,31 @@ class Config:
     if not DATABASE_CONNECTION:
         raise MissingEnvironmentVariable("DATABASE_CONNECTION")
 
+    # Falls back to DATABASE_CONNECTION with its driver swapped for an asyncio one
+    DATABASE_ASYNC_CONNECTION = os.getenv("DATABASE_ASYNC_CONNECTION", DATABASE_CONNECTION)
+    DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", 10))
+    DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", 10))
+    DATABASE_POOL_RECYCLE = int(os.getenv("DATABASE_POOL_RECYCLE", 30 * 60))
+
     CAFE_API = os.getenv("CAFE_API", "http://localhost:8000")
     BOOMY_API = os.getenv("BOOMY_API", "http://localhost:8001")
     BERRY_API = os.getenv("BERRY_API", "http://localhost:8002")
     JAX_API = os.getenv("JAX_API", "http://localhost:8003")
 
     SHOWDOWN_SERVER = os.getenv("SHOWDOWN_SERVER", "ws://localhost:8187/showdown/websocket")
+    SHOWDOWN_POOL_SIZE = int(os.getenv("SHOWDOWN_POOL_SIZE", 4))
+    # Also validate registered teams with a real battle against Boomy on the Showdown server
+    STADIUM_DEEP_CHECK = os.getenv("STADIUM_DEEP_CHECK", "false").lower() == "true"
+
+    # Seconds NES presses wait for the other player's, so both are emulated in one burst
+    NES_INPUT_WINDOW = float(os.getenv("NES_INPUT_WINDOW", 0.15))
+
+    # Games emulating continuously at once, across every session
+    MAX_LIVE_STREAMS = int(os.getenv("MAX_LIVE_STREAMS", 4))
 
     OWNER_ID = int(OWNER_ID)
 
     ASSETS_DIR = os.path.join(PROJECT_ROOT, "assets")
+
+    # Kept across restarts, unlike temp/ which is cleared on startup
+    STATE_DIR = os.path.join(PROJECT_ROOT, "state")
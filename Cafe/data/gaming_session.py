@@ -1,12 +1,18 @@
 from typing import TypedDict
 
-from discord import Message
-from discord.ui import View
+from discord import Message, PartialMessage
+from vault.data.database.cartridge import Cartridge
 
 from emulator.base_emulator import BaseEmulator
+from emulator.input_window import InputWindow
+from utils.live_stream import LiveStream
+from utils.spectator_feed import SpectatorFeed
 
 
 class GamingSession(TypedDict):
     emulator: BaseEmulator
-    joypad: View
-    message: Message | None
+    cartridge: Cartridge
+    message: Message | PartialMessage | None
+    spectators: SpectatorFeed
+    input_window: InputWindow | None
+    live_stream: LiveStream | None
@@ -17,6 +17,15 @@ class BaseEmulator(abc.ABC):
     def start(self, cartridge: Cartridge, user: User | Type[User]) -> tuple[BaseGameInstance, Image]:
         pass
 
+    def prepare(self, cartridge: Cartridge):
+        """
+        Load whatever input reads from the database, on the thread that owns the database session.
+        input may then run on another thread without issuing any query.
+        :param cartridge:
+        :return:
+        """
+        pass
+
     @abc.abstractmethod
     def input(self, cartridge: Cartridge, user: User | Type[User], button=None) -> tuple[BaseGameInstance, list[Image]]:
         pass
@@ -0,0 +1,93 @@
+import marshal
+import os
+import tempfile
+from importlib.metadata import version, PackageNotFoundError
+from typing import Any
+
+from config import Config
+
+
+class BootCache:
+    """
+    States every instance of a ROM starts from, kept on disk and keyed by rom_hash and emulator version.
+    Entries are marshalled dicts, and the least recently used ones are evicted once the cache outgrows MAX_SIZE.
+    """
+
+    CACHE_DIR = os.path.join(Config.STATE_DIR, "boot_states")
+    EXTENSION = ".boot"
+    MAX_SIZE = 256 * 1024 * 1024  # bytes
+
+    __versions: dict[str, str] = {}
+
+    @staticmethod
+    def get_path(rom_hash: str, emulator: str) -> str:
+        # A different emulator version may not be able to load the states of another one
+        name = f"{emulator}-{BootCache.__get_version(emulator)}-{rom_hash}{BootCache.EXTENSION}"
+
+        return os.path.join(BootCache.CACHE_DIR, name)
+
+    @staticmethod
+    def read(rom_hash: str, emulator: str) -> dict[str, Any] | None:
+        path = BootCache.get_path(rom_hash, emulator)
+
+        try:
+            with open(path, "rb") as f:
+                entry = marshal.load(f)
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError):
+            # Unreadable entries are rebuilt by whoever boots the ROM next
+            return None
+
+        try:
+            # The modification time is what eviction goes by
+            os.utime(path)
+        except OSError:
+            pass
+
+        return entry
+
+    @staticmethod
+    def write(rom_hash: str, emulator: str, entry: dict[str, Any]):
+        os.makedirs(BootCache.CACHE_DIR, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=BootCache.CACHE_DIR, delete=False) as tmp:
+            marshal.dump(entry, tmp)
+
+        # Atomic, so concurrent instances never read a partially written entry
+        os.replace(tmp.name, BootCache.get_path(rom_hash, emulator))
+
+        BootCache.__evict()
+
+    @staticmethod
+    def __evict():
+        entries: list[tuple[float, int, str]] = []
+
+        with os.scandir(BootCache.CACHE_DIR) as it:
+            for dir_entry in it:
+                if dir_entry.name.endswith(BootCache.EXTENSION):
+                    stat = dir_entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total_size <= BootCache.MAX_SIZE:
+                break
+
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+            total_size -= size
+
+    @staticmethod
+    def __get_version(emulator: str) -> str:
+        if emulator not in BootCache.__versions:
+            try:
+                BootCache.__versions[emulator] = version(emulator)
+            except PackageNotFoundError:
+                BootCache.__versions[emulator] = "unknown"
+
+        return BootCache.__versions[emulator]
@@ -46,6 +46,16 @@ class BaseGameInstance(abc.ABC):
         if len(self.state_history) > self.__STATE_HISTORY_LIMIT:
             del self.state_history[0]
 
+    def get_controls(self):
+        """
+        Buttons that are held down, which must survive the instance being hibernated.
+        :return:
+        """
+        return None
+
+    def set_controls(self, controls):
+        pass
+
     @abc.abstractmethod
     def screenshot(self) -> Image:
         pass
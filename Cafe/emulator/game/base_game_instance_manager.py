@@ -1,6 +1,7 @@
 import abc
 import asyncio
 import time
+import weakref
 from typing import Optional
 
 from vault.data.database.cartridge import Cartridge
@@ -12,17 +13,25 @@ from vault.exceptions.user_is_cartridge_owner import UserIsCartridgeOwner
 from vault.exceptions.user_not_invited import UserNotInvited
 
 from emulator.game.base_game_instance import BaseGameInstance
+from emulator.game.hibernated_game import HibernatedGame
+from logger import logger
+from utils.checkpoint import Checkpoint
 
 
 class BaseGameInstanceManager(abc.ABC):
     CLEANUP_INTERVAL = 60  # seconds
     INSTANCE_TIMEOUT = 1 * 60  # 10 minutes
+    HIBERNATION_TIMEOUT = 6 * 60 * 60  # 6 hours
 
     @abc.abstractmethod
     def __init__(self):
         self.instances: dict[Cartridge, tuple[BaseGameInstance, list[int]]] = {}
+        self.hibernated: dict[Cartridge, HibernatedGame] = {}
         self.last_used: dict[Cartridge, float] = {}
 
+        # Only games someone is using keep their lock alive
+        self.locks: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+
         self.cleanup_task: Optional[asyncio.Task] = None
         self.should_stop: bool = False
 
@@ -36,19 +45,102 @@ class BaseGameInstanceManager(abc.ABC):
         while not self.should_stop:
             await asyncio.sleep(self.CLEANUP_INTERVAL)
             now = time.time()
+            to_hibernate: list[Cartridge] = []
             to_remove: list[Cartridge] = []
 
             for key, last_used in self.last_used.items():
-                if now - last_used > self.INSTANCE_TIMEOUT:
+                if now - last_used > self.HIBERNATION_TIMEOUT:
                     to_remove.append(key)
+                elif now - last_used > self.INSTANCE_TIMEOUT and key in self.instances:
+                    to_hibernate.append(key)
+
+            for key in to_hibernate:
+                try:
+                    await self.hibernate(key)
+                except Exception as e:
+                    # The instance is kept running, hibernating it is tried again on the next cleanup
+                    logger.error(f"Could not hibernate game {key.id}: {e}")
 
             for key in to_remove:
                 self.last_used.pop(key, None)
+                self.hibernated.pop(key, None)
 
                 instance = self.instances.pop(key, None)
                 if instance:
                     instance[0].stop()
 
+    def get_lock(self, cartridge: Cartridge) -> asyncio.Lock:
+        """
+        Held by whatever emulates or saves the game in a thread, nothing else may touch the same game meanwhile.
+        :param cartridge:
+        :return:
+        """
+        lock = self.locks.get(cartridge.id)
+
+        if lock is None:
+            lock = asyncio.Lock()
+            self.locks[cartridge.id] = lock
+
+        return lock
+
+    async def hibernate(self, cartridge: Cartridge):
+        """
+        Free the emulator of an instance, keeping only what is needed to start it again where it was.
+        The instance keeps running if it could not be saved, or if it was used while it was being saved.
+        :param cartridge:
+        :return:
+        """
+        async with self.get_lock(cartridge):
+            entry = self.instances.get(cartridge, None)
+            last_used = self.last_used.get(cartridge, 0)
+
+            # Someone may have started playing while waiting for the lock
+            if entry is None or time.time() - last_used <= self.INSTANCE_TIMEOUT:
+                return
+
+            instance, users = entry
+
+            # Compressing the state and its history is too slow for the event loop
+            game = await asyncio.to_thread(HibernatedGame.from_instance, instance, users)
+
+            if self.instances.get(cartridge, None) is not entry or self.last_used.get(cartridge, 0) != last_used:
+                return
+
+            self.instances.pop(cartridge)
+            self.hibernated[cartridge] = game
+
+            instance.stop()
+
+    def wake(self, cartridge: Cartridge):
+        """
+        Start a hibernated instance again, so it is back in instances with its players.
+        :param cartridge:
+        :return:
+        """
+        if cartridge in self.instances:
+            return
+
+        hibernated = self.hibernated.pop(cartridge, None)
+
+        if hibernated is None:
+            # Left behind by the last shutdown, if the game was running then
+            checkpoint = Checkpoint.read(self.get_checkpoint_name(cartridge.id), max_age=self.HIBERNATION_TIMEOUT)
+
+            if checkpoint is None:
+                return
+
+            hibernated = HibernatedGame.from_checkpoint(checkpoint)
+
+        instance = self.create_instance(cartridge)
+        hibernated.restore(instance)
+
+        self.instances[cartridge] = (instance, hibernated.users)
+        self.last_used[cartridge] = time.time()
+
+    @abc.abstractmethod
+    def create_instance(self, cartridge: Cartridge) -> BaseGameInstance:
+        pass
+
     @abc.abstractmethod
     def get_game_instance(self, cartridge: Cartridge, user: User) -> tuple[BaseGameInstance, int]:
         pass
@@ -56,15 +148,41 @@ class BaseGameInstanceManager(abc.ABC):
     def get_instance_from_user(self, user: User):
         for cartridge in self.instances:
             if user.id == cartridge.user_id:
+                # The caller is about to use the instance, it must not be hibernated meanwhile
+                self.last_used[cartridge] = time.time()
+
+                instance, users = self.instances[cartridge]
+                return cartridge, instance, users
+
+        for cartridge in self.hibernated:
+            if user.id == cartridge.user_id:
+                self.wake(cartridge)
+
                 instance, users = self.instances[cartridge]
                 return cartridge, instance, users
 
         raise GameNotStarted()
 
+    def get_users(self, cartridge: Cartridge) -> list[int] | None:
+        """
+        The players of a game, without waking it.
+        :param cartridge:
+        :return: None if the game is neither running nor hibernated
+        """
+        if cartridge in self.instances:
+            return self.instances[cartridge][1]
+
+        if cartridge in self.hibernated:
+            return self.hibernated[cartridge].users
+
+        return None
+
     def add_user(self, cartridge: Cartridge, user: User):
         if user.id == cartridge.user_id:
             raise UserIsCartridgeOwner()
 
+        self.wake(cartridge)
+
         if cartridge not in self.instances:
             raise GameNotStarted()
 
@@ -82,6 +200,8 @@ class BaseGameInstanceManager(abc.ABC):
         if user.id == cartridge.user_id:
             raise UserIsCartridgeOwner()
 
+        self.wake(cartridge)
+
         if cartridge not in self.instances:
             raise GameNotStarted()
 
@@ -92,6 +212,52 @@ class BaseGameInstanceManager(abc.ABC):
 
         users.pop(users.index(user.id))
 
+    async def checkpoint(self):
+        """
+        Stop every instance, leaving them all on disk to be woken up one by one when they are played again.
+        Instances are saved in parallel, so shutting down does not take longer with more players.
+        :return:
+        """
+        self.should_stop = True
+
+        await asyncio.gather(*(self.__checkpoint_game(cartridge) for cartridge in [*self.instances, *self.hibernated]))
+
+    async def __checkpoint_game(self, cartridge: Cartridge):
+        # Presses and live chunks still playing the game finish first, the state is saved after them
+        async with self.get_lock(cartridge):
+            entry = self.instances.pop(cartridge, None)
+            game = self.hibernated.pop(cartridge, None)
+
+            if entry is not None:
+                instance, users = entry
+                await asyncio.to_thread(self.__checkpoint_instance, cartridge.id, instance, users)
+            elif game is not None:
+                await asyncio.to_thread(self.__checkpoint_hibernated, cartridge.id, game)
+
+    @staticmethod
+    def get_checkpoint_name(cartridge_id: int) -> str:
+        return f"game-{cartridge_id}"
+
+    @staticmethod
+    def __checkpoint_instance(cartridge_id: int, instance: BaseGameInstance, users: list[int]):
+        try:
+            game = HibernatedGame.from_instance(instance, users)
+        except Exception as e:
+            logger.warning(f"Could not checkpoint game {cartridge_id}: {e}")
+            return
+        finally:
+            instance.stop()
+
+        BaseGameInstanceManager.__checkpoint_hibernated(cartridge_id, game)
+
+    @staticmethod
+    def __checkpoint_hibernated(cartridge_id: int, game: HibernatedGame):
+        try:
+            Checkpoint.write(BaseGameInstanceManager.get_checkpoint_name(cartridge_id), game.to_checkpoint())
+        except Exception as e:
+            # Only this game starts cold next time, the others are still saved
+            logger.warning(f"Could not checkpoint game {cartridge_id}: {e}")
+
     def shutdown(self):
         self.should_stop = True
 
@@ -1,6 +1,5 @@
 import io
 import os
-import tempfile
 
 from PIL import Image
 from PIL.Image import Resampling
@@ -8,18 +7,20 @@ from pyboy import PyBoy
 from vault.data.database.gameboy_cartridge import GameBoyCartridge
 
 from config import Config
+from emulator.boot_cache import BootCache
 from emulator.game.base_game_instance import BaseGameInstance
+from emulator.rom_cache import RomCache
 from utils.frame_utils import FrameUtils
 
 
 class GameBoyGameInstance(BaseGameInstance):
+    EMULATOR = "pyboy"
+    BOOT_FRAMES = 127
+
     def __init__(self, cartridge: GameBoyCartridge):
         super().__init__()
 
-        with tempfile.NamedTemporaryFile(dir=os.path.join(Config.PROJECT_ROOT, "temp"), delete=False) as tmp_rom:
-            tmp_rom.write(cartridge.rom)
-
-        self.rom_path = tmp_rom.name
+        self.rom_path = RomCache.get_rom_path(cartridge)
 
         self.emulator: PyBoy = PyBoy(
             window="null",
@@ -35,7 +36,20 @@ class GameBoyGameInstance(BaseGameInstance):
             os.path.join(Config.ASSETS_DIR, "gameboy", cartridge.boot_animation)
         )
 
-        self.__BOOT_SAVE_STATE: bytes = self.save_state
+        self.rom_hash = cartridge.rom_hash
+
+        # Every instance of a ROM boots into the same state, only the first one has to save it
+        self.__boot = BootCache.read(self.rom_hash, self.EMULATOR)
+
+        if self.__boot is None:
+            self.__boot = {
+                "boot_state": self.save_state,
+                "post_boot_state": None
+            }
+
+            BootCache.write(self.rom_hash, self.EMULATOR, self.__boot)
+
+        self.__BOOT_SAVE_STATE: bytes = self.__boot["boot_state"]
 
         self.inputs = []
 
@@ -97,9 +111,6 @@ class GameBoyGameInstance(BaseGameInstance):
     def stop(self):
         self.emulator.stop(save=False)
 
-        if os.path.isfile(self.rom_path) or os.path.islink(self.rom_path):
-            os.unlink(self.rom_path)
-
     @property
     def save_state(self) -> bytes:
         with io.BytesIO() as save_state:
@@ -110,6 +121,13 @@ class GameBoyGameInstance(BaseGameInstance):
     def load_state(self, save_state: bytes):
         self.emulator.load_state(io.BytesIO(save_state))
 
+    def get_controls(self) -> list[int]:
+        return list(self.inputs)
+
+    def set_controls(self, controls: list[int]):
+        # Only the toggles are restored, the emulator itself was saved with the buttons still held
+        self.inputs = list(controls)
+
     def screenshot(self) -> Image:
         return self.emulator.screen.image.copy()
 
@@ -123,9 +141,15 @@ class GameBoyGameInstance(BaseGameInstance):
             if self.__BOOT_ANIMATION:
                 frames.extend(self.__BOOT_ANIMATION)
 
-            # Advance emulator by 127 ticks (same as number of boot frames)
-            boot_frames = 127
-            self.emulator.tick(boot_frames, render=False, sound=False)
+            if self.__boot["post_boot_state"] is not None:
+                self.load_state(self.__boot["post_boot_state"])
+            else:
+                # Advance emulator by 127 ticks (same as number of boot frames)
+                self.emulator.tick(self.BOOT_FRAMES, render=False, sound=False)
+
+                # Nothing is pressed during the boot animation, so every instance of the ROM ends up here
+                self.__boot["post_boot_state"] = self.save_state
+                BootCache.write(self.rom_hash, self.EMULATOR, self.__boot)
 
         if button is not None:
             if button[0] in self.inputs:
@@ -17,6 +17,8 @@ class GameBoyGameInstanceManager(BaseGameInstanceManager):
         # Update last used time
         self.last_used[cartridge] = time.time()
 
+        self.wake(cartridge)
+
         # Use cached instance if available
         if cartridge in self.instances:
             instance, users = self.instances[cartridge]
@@ -27,6 +29,9 @@ class GameBoyGameInstanceManager(BaseGameInstanceManager):
                 raise UnauthorizedJoypadAccess()
 
         # Otherwise create a new one
-        instance = GameBoyGameInstance(cartridge)
+        instance = self.create_instance(cartridge)
         self.instances[cartridge] = (instance, [user.id])
         return instance, 0
+
+    def create_instance(self, cartridge: GameBoyCartridge) -> GameBoyGameInstance:
+        return GameBoyGameInstance(cartridge)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+from typing import Any
+
+from vault.data.database.compressed_blob import compress, decompress
+
+from emulator.game.base_game_instance import BaseGameInstance
+
+
+@dataclass
+class HibernatedGame:
+    """
+    What is left of an idle game instance once its emulator is freed, enough to start it again where it was.
+    """
+
+    state: bytes  # compressed
+    state_history: list[bytes]  # compressed, oldest first
+    users: list[int]
+    controls: Any
+
+    @staticmethod
+    def from_instance(instance: BaseGameInstance, users: list[int]) -> "HibernatedGame":
+        return HibernatedGame(
+            state=compress(instance.save_state),
+            state_history=[compress(save_state) for save_state in instance.state_history],
+            users=list(users),
+            controls=instance.get_controls()
+        )
+
+    @staticmethod
+    def from_checkpoint(checkpoint: dict) -> "HibernatedGame":
+        return HibernatedGame(
+            state=checkpoint["state"],
+            state_history=checkpoint["state_history"],
+            users=checkpoint["users"],
+            controls=checkpoint["controls"]
+        )
+
+    def to_checkpoint(self) -> dict:
+        return {
+            "state": self.state,
+            "state_history": self.state_history,
+            "users": self.users,
+            "controls": self.controls
+        }
+
+    def restore(self, instance: BaseGameInstance):
+        instance.load_state(decompress(self.state))
+        instance.state_history = [decompress(save_state) for save_state in self.state_history]
+        instance.set_controls(self.controls)
@@ -1,12 +1,9 @@
-import os
-import tempfile
-
 from PIL import Image
 from cynes import NES
 from vault.data.database.nes_cartridge import NESCartridge
 
-from config import Config
 from emulator.game.base_game_instance import BaseGameInstance
+from emulator.rom_cache import RomCache
 
 
 class NESGameInstance(BaseGameInstance):
@@ -15,10 +12,7 @@ class NESGameInstance(BaseGameInstance):
 
         self.cartridge: NESCartridge = cartridge
 
-        with tempfile.NamedTemporaryFile(dir=os.path.join(Config.PROJECT_ROOT, "temp"), delete=False) as tmp_rom:
-            tmp_rom.write(cartridge.rom)
-
-        self.rom_path = tmp_rom.name
+        self.rom_path = RomCache.get_rom_path(cartridge)
 
         self.emulator: NES = NES(
             rom=self.rom_path
@@ -33,8 +27,7 @@ class NESGameInstance(BaseGameInstance):
         self.load_state(self.__BOOT_SAVE_STATE)
 
     def stop(self):
-        if os.path.isfile(self.rom_path) or os.path.islink(self.rom_path):
-            os.unlink(self.rom_path)
+        pass
 
     @property
     def save_state(self) -> bytes:
@@ -45,6 +38,12 @@ class NESGameInstance(BaseGameInstance):
         # self.emulator.load(np.frombuffer(save_state, dtype=np.uint8).copy())
         pass
 
+    def get_controls(self) -> int:
+        return self.emulator.controller
+
+    def set_controls(self, controls: int):
+        self.emulator.controller = controls
+
     def screenshot(self) -> Image:
         return Image.fromarray(self.emulator.step())
 
@@ -17,6 +17,8 @@ class NESGameInstanceManager(BaseGameInstanceManager):
         # Update last used time
         self.last_used[cartridge] = time.time()
 
+        self.wake(cartridge)
+
         # Use cached instance if available
         if cartridge in self.instances:
             instance, users = self.instances[cartridge]
@@ -27,6 +29,9 @@ class NESGameInstanceManager(BaseGameInstanceManager):
                 raise UnauthorizedJoypadAccess()
 
         # Otherwise create a new one
-        instance = NESGameInstance(cartridge)
+        instance = self.create_instance(cartridge)
         self.instances[cartridge] = (instance, [user.id])
         return instance, 0
+
+    def create_instance(self, cartridge: NESCartridge) -> NESGameInstance:
+        return NESGameInstance(cartridge)
@@ -18,6 +18,12 @@ class GameBoyEmulator(BaseEmulator):
     def __init__(self):
         super().__init__()
         self.game_instance_manager: GameBoyGameInstanceManager = GameBoyGameInstanceManager()
+        # Cartridge id -> premium features, read from the user's profile by prepare
+        self.__premium_features: dict[int, tuple[bool, bool, str]] = {}
+
+    def prepare(self, cartridge: GameBoyCartridge):
+        # The user and their profile are lazy relationships, loading them from an input thread would query from it
+        self.__premium_features[cartridge.id] = self.__get_premium_features(cartridge)
 
     def start(
             self,
@@ -107,7 +113,10 @@ class GameBoyEmulator(BaseEmulator):
         if not frames:
             raise InvalidFrameData()
 
-        enable_color, enable_border, border = self.__get_premium_features(cartridge)
+        if cartridge.id in self.__premium_features:
+            enable_color, enable_border, border = self.__premium_features[cartridge.id]
+        else:
+            enable_color, enable_border, border = self.__get_premium_features(cartridge)
 
         frames = [
             self.__process_frame(
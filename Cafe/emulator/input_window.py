@@ -0,0 +1,91 @@
+import asyncio
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from logger import logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class InputWindow(Generic[T, R]):
+    """
+    Collects the presses every player of an instance makes within a short interval, so they are run as one burst.
+    The window opens with the first press and closes after the interval, or as soon as size presses are in.
+    Every press in it gets the same result.
+    """
+
+    REPORT_EVERY = 100  # windows
+
+    def __init__(self, interval: float, size: int):
+        self.interval = interval
+        self.size = size
+        self.windows = 0
+        self.presses = 0
+        self.__pending: list[T] = []
+        self.__result: asyncio.Future | None = None
+        self.__full: asyncio.Event | None = None
+
+    @property
+    def merge_ratio(self) -> float:
+        """
+        Presses run per burst, 1 when players never press together.
+        """
+        return self.presses / self.windows if self.windows else 0.0
+
+    async def submit(self, press: T, run: Callable[[list[T]], Awaitable[R]]) -> tuple[R, bool]:
+        """
+        Add a press to the open window, or open one.
+        :param press:
+        :param run: Runs the burst once the window closes, the one of the press that opened it is used
+        :return: The burst's result, and whether this press opened the window
+        """
+        if self.__result is not None:
+            self.__pending.append(press)
+
+            if len(self.__pending) >= self.size:
+                self.__full.set()
+
+            return await asyncio.shield(self.__result), False
+
+        self.__pending = [press]
+        self.__result = asyncio.get_running_loop().create_future()
+        self.__full = asyncio.Event()
+
+        result = self.__result
+
+        try:
+            if self.size > 1:
+                try:
+                    await asyncio.wait_for(self.__full.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+
+            presses = self.__pending
+            self.__pending, self.__result, self.__full = [], None, None
+
+            self.__count(len(presses))
+
+            result.set_result(await run(presses))
+        except BaseException as e:
+            if self.__result is result:
+                self.__pending, self.__result, self.__full = [], None, None
+
+            if not result.done():
+                if isinstance(e, asyncio.CancelledError):
+                    result.cancel()
+                else:
+                    result.set_exception(e)
+
+                    # Retrieved so it is never reported as unhandled when nobody else joined
+                    result.exception()
+
+            raise
+
+        return result.result(), True
+
+    def __count(self, presses: int):
+        self.windows += 1
+        self.presses += presses
+
+        if self.windows % self.REPORT_EVERY == 0:
+            logger.info(f"Input windows merged {self.merge_ratio:.2f} presses per burst over {self.windows} windows")
@@ -43,7 +43,34 @@ class NESEmulator(BaseEmulator):
             user: User | Type[User],
             button=None
     ) -> tuple[NESGameInstance, list[Image]]:
-        game_instance, player = self.game_instance_manager.get_game_instance(cartridge, user)
+        return self.input_many(cartridge, [(user, button)])
+
+    def input_many(
+            self,
+            cartridge: NESCartridge,
+            presses: list[tuple[User | Type[User], str | None]]
+    ) -> tuple[NESGameInstance, list[Image]]:
+        """
+        Apply the presses of both players together and emulate them as one burst.
+        :param cartridge:
+        :param presses: Each player's button, presses of the same player cancel out like pressing twice would
+        :return:
+        """
+        game_instance = None
+        controller = 0
+        duration_frames = 1
+
+        for user, button in presses:
+            game_instance, player = self.game_instance_manager.get_game_instance(cartridge, user)
+
+            button, frames = self.__parse_button(button)
+            duration_frames = max(duration_frames, frames)
+
+            if button is not None:
+                if player == 1:
+                    button = button << 8
+
+                controller ^= button
 
         if not cartridge.state:
             game_instance.restart()
@@ -52,8 +79,28 @@ class NESEmulator(BaseEmulator):
 
         game_instance.save_state_to_history(cartridge.state)
 
-        duration_frames = 1
+        frames = game_instance.input(controller or None, duration_frames)
 
+        if not frames:
+            raise InvalidFrameData()
+
+        frames = [
+            self.__process_frame(frame=frame, game_instance=game_instance)
+            for frame in frames
+        ]
+
+        # Save state
+        cartridge.state = game_instance.save_state
+        cartridge.play_time += len(frames)
+
+        return game_instance, frames
+
+    @staticmethod
+    def __parse_button(button) -> tuple[int | None, int]:
+        """
+        :param button:
+        :return: The button's bitmask, None for frame buttons, and how many frames to emulate
+        """
         if button is not None and isinstance(button, str):
             button = button.lower()
         else:
@@ -61,53 +108,31 @@ class NESEmulator(BaseEmulator):
 
         match button:
             case "frame 1":
-                duration_frames = 1
-                button = None
+                return None, 1
             case "frame 10":
-                duration_frames = 10
-                button = None
+                return None, 10
             case "frame 30":
-                duration_frames = 30
-                button = None
+                return None, 30
             case "frame 60":
-                duration_frames = 60
-                button = None
+                return None, 60
             case "up":
-                button = cynes.NES_INPUT_UP
+                return cynes.NES_INPUT_UP, 1
             case "down":
-                button = cynes.NES_INPUT_DOWN
+                return cynes.NES_INPUT_DOWN, 1
             case "left":
-                button = cynes.NES_INPUT_LEFT
+                return cynes.NES_INPUT_LEFT, 1
             case "right":
-                button = cynes.NES_INPUT_RIGHT
+                return cynes.NES_INPUT_RIGHT, 1
             case "a":
-                button = cynes.NES_INPUT_A
+                return cynes.NES_INPUT_A, 1
             case "b":
-                button = cynes.NES_INPUT_B
+                return cynes.NES_INPUT_B, 1
             case "start":
-                button = cynes.NES_INPUT_START
+                return cynes.NES_INPUT_START, 1
             case "select":
-                button = cynes.NES_INPUT_SELECT
-
-        if button is not None and isinstance(button, int):
-            if player == 1:
-                button = button << 8
-
-        frames = game_instance.input(button, duration_frames)
-
-        if not frames:
-            raise InvalidFrameData()
+                return cynes.NES_INPUT_SELECT, 1
 
-        frames = [
-            self.__process_frame(frame=frame, game_instance=game_instance)
-            for frame in frames
-        ]
-
-        # Save state
-        cartridge.state = game_instance.save_state
-        cartridge.play_time += len(frames)
-
-        return game_instance, frames
+        return None, 1
 
     @staticmethod
     def __process_frame(frame: Image, game_instance: NESGameInstance) -> Image:
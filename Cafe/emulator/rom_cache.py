@@ -0,0 +1,31 @@
+import os
+import tempfile
+
+from vault.data.database.cartridge import Cartridge
+
+from config import Config
+
+
+class RomCache:
+    """
+    ROM files on disk, keyed by rom_hash and shared by every game instance of the same ROM.
+    The ROM blob is only read from the Vault the first time a hash is requested.
+    """
+    ROM_DIR = os.path.join(Config.PROJECT_ROOT, "temp", "roms")
+
+    @staticmethod
+    def get_rom_path(cartridge: Cartridge) -> str:
+        rom_path = os.path.join(RomCache.ROM_DIR, cartridge.rom_hash)
+
+        if os.path.isfile(rom_path):
+            return rom_path
+
+        os.makedirs(RomCache.ROM_DIR, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=RomCache.ROM_DIR, delete=False) as tmp_rom:
+            tmp_rom.write(cartridge.rom.data)
+
+        # Atomic, so concurrent instances never boot a partially written ROM
+        os.replace(tmp_rom.name, rom_path)
+
+        return rom_path
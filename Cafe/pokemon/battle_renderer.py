@@ -0,0 +1,95 @@
+import asyncio
+import time
+from contextlib import suppress
+
+import discord
+
+from logger import logger
+
+
+class BattleRenderer:
+    """
+    Shows a battle under a Discord message, shared by both players of the battle.
+    Updates only replace the pending content, and it is flushed at most once every interval in the background,
+    so the battle runs at the simulator's pace instead of Discord's edit rate limit.
+    Players call update from poke_env's loop, everything else happens on the loop the renderer was created on.
+    """
+
+    INTERVAL = 2  # seconds
+
+    def __init__(self, message: discord.Message | discord.PartialMessage, interval: float = INTERVAL):
+        self.message = message
+        self.interval = interval
+        self.__reply: discord.Message | None = None
+        self.__content: str | None = None
+        self.__shown: str | None = None
+        self.__last_flush = 0.0
+        self.__flush_task: asyncio.Task | None = None
+        self.__closed = False
+        self.__loop = asyncio.get_running_loop()
+
+    def update(self, content: str):
+        """
+        Safe to call from any thread.
+        :param content:
+        :return:
+        """
+        self.__loop.call_soon_threadsafe(self.__schedule, content)
+
+    async def close(self, summary: str | None = None):
+        """
+        Stop the pending flush and show the final state right away.
+        :param summary: Shown instead of the last update
+        :return:
+        """
+        self.__closed = True
+
+        if self.__flush_task is not None:
+            self.__flush_task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self.__flush_task
+
+            self.__flush_task = None
+
+        if summary is not None:
+            self.__content = summary
+
+        await self.__flush()
+
+    def __schedule(self, content: str):
+        # Updates handed off just before the battle ended must not flush after the summary
+        if self.__closed:
+            return
+
+        self.__content = content
+
+        if self.__flush_task is None or self.__flush_task.done():
+            self.__flush_task = asyncio.create_task(self.__flush_later())
+
+    async def __flush_later(self):
+        delay = self.__last_flush + self.interval - time.monotonic()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        await self.__flush()
+
+    async def __flush(self):
+        content = self.__content
+
+        if content is None or content == self.__shown:
+            return
+
+        try:
+            if self.__reply is None:
+                self.__reply = await self.message.reply(content=content)
+            else:
+                await self.__reply.edit(content=content)
+
+            self.__shown = content
+        except discord.HTTPException as e:
+            # The battle goes on regardless, the next flush shows the latest state
+            logger.warning(f"Could not show battle state: {e}")
+
+        self.__last_flush = time.monotonic()
@@ -0,0 +1,239 @@
+import argparse
+import asyncio
+import inspect
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from poke_env import AccountConfiguration, LocalhostServerConfiguration, ServerConfiguration, Player
+from poke_env.battle import AbstractBattle
+from poke_env.player import BattleOrder
+from vault.data.characters import Characters
+
+from pokemon.players.boomy_player import BoomyPlayer
+from pokemon.players.discord_random_player import DiscordRandomPlayer
+from pokemon.single_mon_teambuilder import SingleMonTeambuilder
+
+DEFAULT_FORMAT = "[Gen 9] Boomy's Gaming Cafe"
+
+# New heuristics only need an entry here to be benchmarked
+PLAYER_TYPES: dict[str, type[Player]] = {
+    "random": DiscordRandomPlayer,
+    "boomy": BoomyPlayer
+}
+
+
+@dataclass
+class ShardResult:
+    battles: int = 0
+    wins_a: int = 0
+    wins_b: int = 0
+    decision_times: list[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+def timed(player_class: type[Player]) -> type[Player]:
+    """
+    Subclass a player type so the time it takes to choose every move is recorded.
+    """
+
+    class TimedPlayer(player_class):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.decision_times: list[float] = []
+
+        async def choose_move(self, battle: AbstractBattle) -> BattleOrder:
+            start = time.perf_counter()
+
+            order = super().choose_move(battle)
+            if inspect.isawaitable(order):
+                order = await order
+
+            self.decision_times.append(time.perf_counter() - start)
+            return order
+
+    TimedPlayer.__name__ = f"Timed{player_class.__name__}"
+    return TimedPlayer
+
+
+def load_team(source: str) -> str:
+    """
+    Read a team from a Showdown export file, "boomy" for Boomy's team or "user:<id>" for a registered user's team.
+    :param source:
+    :return:
+    """
+    if source == "boomy":
+        return Characters.Boomy["pokemon"]
+
+    if source.startswith("user:"):
+        # Only needed for registered teams, the rest of the runner works without a bot environment
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+        from vault.database.user_database import UserDatabase
+
+        from config import Config
+
+        with Session(create_engine(Config.DATABASE_CONNECTION)) as session:
+            return UserDatabase(session).fetch(int(source.removeprefix("user:"))).pokemon.mon
+
+    with open(source, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def run_shard(
+        shard: int,
+        n_battles: int,
+        team_a: str,
+        team_b: str,
+        player_a: str,
+        player_b: str,
+        battle_format: str,
+        concurrency: int,
+        websocket_url: str | None
+) -> ShardResult:
+    return asyncio.run(
+        __run_shard(shard, n_battles, team_a, team_b, player_a, player_b, battle_format, concurrency, websocket_url)
+    )
+
+
+async def __run_shard(
+        shard: int,
+        n_battles: int,
+        team_a: str,
+        team_b: str,
+        player_a: str,
+        player_b: str,
+        battle_format: str,
+        concurrency: int,
+        websocket_url: str | None
+) -> ShardResult:
+    server_configuration = LocalhostServerConfiguration
+    if websocket_url is not None:
+        server_configuration = ServerConfiguration(websocket_url, LocalhostServerConfiguration.authentication_url)
+
+    # Usernames must be unique across processes, Showdown usernames are at most 18 characters
+    prefix = f"bench{os.getpid() % 10 ** 7}s{shard}"
+
+    players = [
+        timed(PLAYER_TYPES[player_type])(
+            account_configuration=AccountConfiguration(f"{prefix}{side}", None),
+            server_configuration=server_configuration,
+            battle_format=battle_format,
+            team=SingleMonTeambuilder(team),
+            max_concurrent_battles=concurrency
+        )
+        for side, player_type, team in (("a", player_a, team_a), ("b", player_b, team_b))
+    ]
+
+    a, b = players
+
+    start = time.perf_counter()
+    await a.battle_against(b, n_battles=n_battles)
+    elapsed = time.perf_counter() - start
+
+    finished = [battle for battle in a.battles.values() if battle.finished]
+
+    return ShardResult(
+        battles=len(finished),
+        wins_a=sum(1 for battle in finished if battle.won is True),
+        wins_b=sum(1 for battle in finished if battle.won is False),
+        decision_times=a.decision_times + b.decision_times,
+        elapsed=elapsed
+    )
+
+
+def wilson_interval(wins: int, n: int, z: float = 1.96) -> tuple[float, float]:
+    if n == 0:
+        return 0.0, 0.0
+
+    p = wins / n
+    denominator = 1 + z ** 2 / n
+    centre = (p + z ** 2 / (2 * n)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+
+    return centre - margin, centre + margin
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def report(results: list[ShardResult], wall_time: float, player_a: str, player_b: str):
+    battles = sum(result.battles for result in results)
+    wins_a = sum(result.wins_a for result in results)
+    wins_b = sum(result.wins_b for result in results)
+    decision_times = sorted(t for result in results for t in result.decision_times)
+
+    print(f"battles:     {battles} in {wall_time:.2f} s ({battles / wall_time if wall_time else 0:.2f} battles/s)")
+
+    for name, wins in ((f"a ({player_a})", wins_a), (f"b ({player_b})", wins_b)):
+        low, high = wilson_interval(wins, battles)
+        rate = wins / battles if battles else 0.0
+        print(f"win rate {name}: {rate:.3f} [95% CI {low:.3f} - {high:.3f}]")
+
+    print(f"ties:        {battles - wins_a - wins_b}")
+
+    if decision_times:
+        mean = sum(decision_times) / len(decision_times)
+        print(
+            f"decisions:   {len(decision_times)}, "
+            f"mean {mean * 1000:.3f} ms, "
+            f"p50 {percentile(decision_times, 0.5) * 1000:.3f} ms, "
+            f"p95 {percentile(decision_times, 0.95) * 1000:.3f} ms, "
+            f"p99 {percentile(decision_times, 0.99) * 1000:.3f} ms"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless battles between two teams and player types")
+    parser.add_argument("--team-a", default="boomy", help="Export file, \"boomy\" or \"user:<id>\"")
+    parser.add_argument("--team-b", default="boomy", help="Export file, \"boomy\" or \"user:<id>\"")
+    parser.add_argument("--player-a", default="random", choices=PLAYER_TYPES.keys())
+    parser.add_argument("--player-b", default="boomy", choices=PLAYER_TYPES.keys())
+    parser.add_argument("--battles", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent battles per process")
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--format", default=DEFAULT_FORMAT)
+    parser.add_argument("--server", default=None, help="Showdown websocket url, a local server by default")
+    args = parser.parse_args()
+
+    team_a = load_team(args.team_a)
+    team_b = load_team(args.team_b)
+
+    # Spread the battles as evenly as possible
+    shards = [
+        args.battles // args.processes + (1 if shard < args.battles % args.processes else 0)
+        for shard in range(args.processes)
+    ]
+
+    start = time.perf_counter()
+
+    if args.processes == 1:
+        results = [
+            run_shard(
+                0, shards[0], team_a, team_b, args.player_a, args.player_b, args.format, args.concurrency, args.server
+            )
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=args.processes) as executor:
+            futures = [
+                executor.submit(
+                    run_shard,
+                    shard, n_battles, team_a, team_b, args.player_a, args.player_b, args.format, args.concurrency,
+                    args.server
+                )
+                for shard, n_battles in enumerate(shards)
+                if n_battles
+            ]
+            results = [future.result() for future in futures]
+
+    report(results, time.perf_counter() - start, args.player_a, args.player_b)
+
+
+if __name__ == "__main__":
+    main()
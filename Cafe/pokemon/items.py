@@ -0,0 +1,54 @@
+# Items a Pokémon can hold in each generation's standard formats, by Showdown id.
+# poke_env ships no item table, so this one is kept by hand.
+
+GEN9_ITEMS = frozenset({
+    # Berries
+    "aguavberry", "apicotberry", "aspearberry", "babiriberry", "chartiberry", "cheriberry", "chestoberry",
+    "chilanberry", "chopleberry", "cobaberry", "colburberry", "custapberry", "enigmaberry", "figyberry",
+    "ganlonberry", "grepaberry", "habanberry", "hondewberry", "iapapaberry", "jabocaberry", "kasibberry",
+    "kebiaberry", "keeberry", "kelpsyberry", "lansatberry", "leppaberry", "liechiberry", "lumberry", "magoberry",
+    "marangaberry", "micleberry", "occaberry", "oranberry", "passhoberry", "payapaberry", "pechaberry",
+    "persimberry", "petayaberry", "pomegberry", "qualotberry", "rawstberry", "rindoberry", "roseliberry",
+    "rowapberry", "salacberry", "shucaberry", "sitrusberry", "starfberry", "tamatoberry", "tangaberry",
+    "wacanberry", "wikiberry", "yacheberry",
+
+    # Battle items
+    "abilityshield", "absorbbulb", "adrenalineorb", "airballoon", "assaultvest", "bigroot", "bindingband",
+    "blacksludge", "blunderpolicy", "boosterenergy", "brightpowder", "cellbattery", "choiceband", "choicescarf",
+    "choicespecs", "clearamulet", "covertcloak", "damprock", "destinyknot", "ejectbutton", "ejectpack",
+    "electricseed", "eviolite", "expertbelt", "flameorb", "floatstone", "focusband", "focussash", "grassyseed",
+    "heatrock", "heavydutyboots", "icyrock", "ironball", "kingsrock", "laggingtail", "leftovers", "lifeorb",
+    "lightclay", "loadeddice", "mentalherb", "metronome", "mirrorherb", "mistyseed", "muscleband", "normalgem",
+    "powerherb", "protectivepads", "psychicseed", "punchingglove", "quickclaw", "razorclaw", "razorfang",
+    "redcard", "ringtarget", "rockyhelmet", "roomservice", "safetygoggles", "scopelens", "shedshell", "shellbell",
+    "smoothrock", "snowball", "stickybarb", "terrainextender", "throatspray", "toxicorb", "utilityumbrella",
+    "weaknesspolicy", "whiteherb", "widelens", "wiseglasses", "zoomlens",
+
+    # Type boosters
+    "blackbelt", "blackglasses", "charcoal", "dragonfang", "fairyfeather", "hardstone", "magnet", "metalcoat",
+    "miracleseed", "mysticwater", "nevermeltice", "poisonbarb", "sharpbeak", "silkscarf", "silverpowder",
+    "softsand", "spelltag", "twistedspoon", "oddincense", "rockincense", "roseincense", "seaincense",
+    "waveincense",
+
+    # Plates
+    "dracoplate", "dreadplate", "earthplate", "fistplate", "flameplate", "icicleplate", "insectplate",
+    "ironplate", "legendplate", "meadowplate", "mindplate", "pixieplate", "skyplate", "splashplate",
+    "spookyplate", "stoneplate", "toxicplate", "zapplate",
+
+    # Species items
+    "adamantcrystal", "adamantorb", "cornerstonemask", "griseouscore", "griseousorb", "hearthflamemask", "leek",
+    "lightball", "lustrousglobe", "lustrousorb", "luckypunch", "metalpowder", "quickpowder", "rustedshield",
+    "rustedsword", "souldew", "thickclub", "wellspringmask",
+
+    # Held without an effect in battle
+    "amuletcoin", "auspiciousarmor", "chippedpot", "cleansetag", "crackedpot", "dragonscale", "dubiousdisc",
+    "electirizer", "everstone", "fullincense", "galaricacuff", "galaricawreath", "laxincense", "leaderscrest",
+    "luckyegg", "machobrace", "magmarizer", "maliciousarmor", "masterpieceteacup", "metalalloy", "ovalstone",
+    "poweranklet", "powerband", "powerbelt", "powerbracer", "powerlens", "powerweight", "prismscale", "protector",
+    "reapercloth", "sachet", "scrollofdarkness", "scrollofwaters", "smokeball", "soothebell", "sweetapple",
+    "syrupyapple", "tartapple", "unremarkableteacup", "upgrade", "whippeddream"
+})
+
+ITEMS: dict[int, frozenset[str]] = {
+    9: GEN9_ITEMS
+}
@@ -0,0 +1,184 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator
+
+import discord
+from poke_env import ServerConfiguration, Player
+from poke_env.concurrency import POKE_LOOP
+from poke_env.teambuilder import Teambuilder
+
+from logger import logger
+from pokemon.battle_renderer import BattleRenderer
+from pokemon.players.boomy_player import BoomyPlayer
+from pokemon.players.discord_random_player import DiscordRandomPlayer
+
+
+class PlayerPool:
+    """
+    Logged-in Showdown players kept around between battles, so a battle does not need a fresh websocket login.
+    Pooled players are leased by one battle at a time with its team swapped in, and up to size of them are kept idle
+    per player type and format. Boomy's players are pooled the same way, a player accepts challenges from a single
+    queue and waits for all of its battles, so it cannot be shared between concurrent battles.
+    """
+
+    LOGIN_TIMEOUT = 10  # seconds
+    HEALTH_CHECK_INTERVAL = 60  # seconds
+
+    def __init__(self, server_configuration: ServerConfiguration, size: int):
+        self.server_configuration = server_configuration
+        self.size = size
+        self.__idle: dict[tuple[type[Player], str], list[Player]] = {}
+        self.__health_check: asyncio.Task | None = None
+
+    def start(self):
+        if self.__health_check is None or self.__health_check.done():
+            self.__health_check = asyncio.create_task(self.__check_health())
+
+    async def close(self):
+        if self.__health_check is not None:
+            self.__health_check.cancel()
+            self.__health_check = None
+
+        players: list[Player] = [player for idle in self.__idle.values() for player in idle]
+
+        self.__idle.clear()
+
+        await asyncio.gather(*(self.__stop(player) for player in players))
+
+    def lease(self, team: Teambuilder, battle_format: str) -> AsyncContextManager[DiscordRandomPlayer]:
+        return self.__lease(DiscordRandomPlayer, team, battle_format)
+
+    def lease_boomy(self, team: Teambuilder, battle_format: str) -> AsyncContextManager[BoomyPlayer]:
+        return self.__lease(BoomyPlayer, team, battle_format)
+
+    @staticmethod
+    async def battle(player: Player, opponent: Player, message: discord.Message | None = None) -> bool | None:
+        """
+        Run one battle between two leased players.
+        :param player: Must be leased exclusively, the result is read from its battles
+        :param opponent:
+        :param message: Message both players show the battle under, through one shared renderer
+        :return: Whether player won, None on a tie
+        """
+        before = set(player.battles.keys())
+
+        renderer = BattleRenderer(message) if message is not None else None
+
+        if renderer is not None:
+            player.renderers[opponent.username] = renderer
+            opponent.renderers[player.username] = renderer
+
+        try:
+            await player.battle_against(opponent, n_battles=1)
+        finally:
+            player.renderers.pop(opponent.username, None)
+            opponent.renderers.pop(player.username, None)
+
+        battles = [battle for battle_tag, battle in player.battles.items() if battle_tag not in before]
+
+        if renderer is not None:
+            await renderer.close(str(battles[0]) if battles else None)
+
+        return battles[0].won if battles else None
+
+    @asynccontextmanager
+    async def __lease(self, player_class: type[Player], team: Teambuilder, battle_format: str) -> AsyncIterator[Player]:
+        """
+        Borrow a player for one battle, logging a new one in when none is idle.
+        Leases never wait on each other, a battle leasing both its players cannot deadlock with another one.
+        :param player_class:
+        :param team:
+        :param battle_format:
+        :return:
+        """
+        player = None
+
+        try:
+            player = self.__take_idle(player_class, battle_format)
+
+            if player is None:
+                player = await self.__create(player_class, battle_format)
+
+            player.update_team(team)
+
+            yield player
+        finally:
+            if player is not None:
+                self.__give_back(player, battle_format)
+
+    def __take_idle(self, player_class: type[Player], battle_format: str) -> Player | None:
+        idle = self.__idle.get((player_class, battle_format), [])
+
+        while idle:
+            player = idle.pop()
+
+            if self.__is_healthy(player):
+                return player
+
+            asyncio.create_task(self.__stop(player))
+
+        return None
+
+    def __give_back(self, player: Player, battle_format: str):
+        player.renderers.clear()
+
+        idle = self.__idle.setdefault((type(player), battle_format), [])
+
+        # Only size players are kept logged in, the rest were extra for a busy moment
+        if len(idle) >= self.size or not self.__is_healthy(player) or not self.__forget_battles(player):
+            asyncio.create_task(self.__stop(player))
+            return
+
+        idle.append(player)
+
+    async def __create(self, player_class: type[Player], battle_format: str, **kwargs):
+        player = player_class(
+            server_configuration=self.server_configuration,
+            battle_format=battle_format,
+            **kwargs
+        )
+
+        # The login event belongs to poke_env's loop, it is waited on there and only the result comes back here
+        login = asyncio.run_coroutine_threadsafe(player.ps_client.logged_in.wait(), POKE_LOOP)
+
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(login), self.LOGIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            # Battles will still wait for the login, it just was not there in time to be warm
+            logger.warning(f"Showdown player {player.username} did not log in within {self.LOGIN_TIMEOUT} seconds")
+
+        return player
+
+    @staticmethod
+    def __forget_battles(player: Player) -> bool:
+        # Finished battles would pile up in a long-lived player
+        try:
+            player.reset_battles()
+        except EnvironmentError:
+            return False
+
+        return True
+
+    @staticmethod
+    def __is_healthy(player: Player) -> bool:
+        return player.ps_client.logged_in.is_set()
+
+    @staticmethod
+    async def __stop(player: Player):
+        try:
+            await player.ps_client.stop_listening()
+        except Exception as e:
+            logger.warning(f"Could not stop Showdown player {player.username}: {e}")
+
+    async def __check_health(self):
+        while True:
+            await asyncio.sleep(self.HEALTH_CHECK_INTERVAL)
+
+            unhealthy: list[Player] = []
+
+            # Swapped out before stopping anything, so players given back meanwhile are not lost
+            for key, idle in self.__idle.items():
+                unhealthy += [player for player in idle if not self.__is_healthy(player)]
+                self.__idle[key] = [player for player in idle if self.__is_healthy(player)]
+
+            await asyncio.gather(*(self.__stop(player) for player in unhealthy))
@@ -1,28 +1,23 @@
-import discord
 from poke_env import Player
 from poke_env.battle import AbstractBattle
 from poke_env.player import BattleOrder
 
+from pokemon.battle_renderer import BattleRenderer
+
 
 class DiscordRandomPlayer(Player):
-    def __init__(self, message: discord.Message | None = None, **kwargs):
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.message = message
-        self.reply = None
+        # Opponent username -> renderer the battle is shown with, a pooled player may battle several opponents
+        self.renderers: dict[str, BattleRenderer] = {}
 
     async def choose_move(self, battle: AbstractBattle) -> BattleOrder:
-        move = self.choose_random_move(battle)
+        renderer = self.renderers.get(battle.opponent_username, None)
 
-        if self.message is None:
-            return move
+        if renderer is not None:
+            renderer.update(str(battle))
 
-        if self.reply is None:
-            self.reply = await self.message.reply(
-                content=str(battle)
-            )
-        else:
-            await self.reply.edit(
-                content=str(battle)
-            )
+        return self.choose_random_move(battle)
 
-        return move
+    def _battle_finished_callback(self, battle: AbstractBattle):
+        self.renderers.pop(battle.opponent_username, None)
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import List
 
 from poke_env.teambuilder import Teambuilder, TeambuilderPokemon
@@ -12,9 +13,35 @@ class SingleMonTeambuilder(Teambuilder):
 
         self.packed_team = self.join_team(self._mons[:1])
 
+    @classmethod
+    def from_packed(cls, packed_team: str) -> "SingleMonTeambuilder":
+        """
+        Build from a team that was already packed, without parsing it.
+        :param packed_team: A single Pokémon in Showdown's packed format
+        :return:
+        """
+        teambuilder = cls.__new__(cls)
+        teambuilder._mons = None
+        teambuilder.packed_team = packed_team
+
+        return teambuilder
+
+    @staticmethod
+    @cache
+    def cached(team: str) -> "SingleMonTeambuilder":
+        """
+        Shared teambuilder for a team that never changes, like an NPC's, parsed once per process.
+        :param team:
+        :return:
+        """
+        return SingleMonTeambuilder(team)
+
     def yield_team(self) -> str:
         return self.packed_team
 
     @property
     def team(self) -> List[TeambuilderPokemon]:
+        if self._mons is None:
+            self._mons = self.parse_packed_team(self.packed_team)
+
         return self._mons
@@ -0,0 +1,186 @@
+import hashlib
+from dataclasses import dataclass
+
+from poke_env.data import GenData, to_id_str
+from poke_env.teambuilder import TeambuilderPokemon
+
+from pokemon.items import ITEMS
+
+
+@dataclass
+class TeamProblem:
+    field: str
+    message: str
+
+    def __str__(self):
+        return f"{self.field}: {self.message}"
+
+
+class TeamValidator:
+    """
+    Checks a Showdown team against the local data tables of the Cafe's format, without a Showdown server.
+    """
+
+    RULES_VERSION = 2  # bump whenever the checks change, so teams packed under older rules are packed again
+    MAX_MOVES = 4
+    MAX_EV = 252
+    MAX_TOTAL_EVS = 510
+    MAX_IV = 31
+    MAX_LEVEL = 100
+
+    # The format's own additions, which the official tables do not know about
+    CUSTOM_SPECIES = {
+        "boomy": {
+            "abilities": {"gameglitch"},
+            "learnset": {"nastyplot", "glitchpulse", "darkpulse", "substitute"}
+        }
+    }
+    CUSTOM_ABILITIES = {"gameglitch"}
+    CUSTOM_MOVES = {"glitchpulse"}
+    CUSTOM_ITEMS: set[str] = set()
+
+    def __init__(self, battle_format: str):
+        """
+        :param battle_format: The format teams are battled in, its generation's tables are the ones checked against
+        """
+        self.__data = GenData.from_format(to_id_str(battle_format))
+        self.__items = ITEMS.get(self.__data.gen, None)
+
+    def validate(self, team: str) -> tuple[TeambuilderPokemon | None, list[TeamProblem]]:
+        """
+        Parse and check the first Pokémon of a team.
+        :param team: Showdown export format
+        :return: The parsed Pokémon, or None if it could not be parsed, and every problem found with it
+        """
+        try:
+            mon = TeambuilderPokemon.from_showdown(team)
+        except (ValueError, IndexError):
+            return None, [TeamProblem("team", "could not be parsed")]
+
+        species_id = to_id_str(mon.species or mon.nickname or "")
+
+        if species_id in self.CUSTOM_SPECIES:
+            abilities = self.CUSTOM_SPECIES[species_id]["abilities"]
+            learnset = self.CUSTOM_SPECIES[species_id]["learnset"]
+        elif species_id in self.__data.pokedex:
+            abilities = {to_id_str(ability) for ability in self.__data.pokedex[species_id]["abilities"].values()}
+            learnset = self.__get_learnset(species_id)
+        else:
+            # Nothing else can be checked without a species
+            return mon, [TeamProblem("species", f"unknown species {mon.species}")]
+
+        problems: list[TeamProblem] = []
+
+        problems += self.__check_ability(mon, abilities)
+        problems += self.__check_moves(mon, learnset)
+        problems += self.__check_item(mon)
+        problems += self.__check_stats(mon)
+
+        return mon, problems
+
+    @staticmethod
+    def fingerprint(team: str) -> str:
+        """
+        Identify a team together with the rules it was validated under.
+        :param team: Showdown export format
+        :return:
+        """
+        return hashlib.sha256(f"{TeamValidator.RULES_VERSION}\n{team}".encode("utf-8")).hexdigest()
+
+    def __get_learnset(self, species_id: str) -> set[str]:
+        """
+        Moves a species can learn, including the ones only its base forme or earlier evolutions learn.
+        """
+        learnset: set[str] = set()
+        visited: set[str] = set()
+        pending = [species_id]
+
+        while pending:
+            current = pending.pop()
+
+            if current in visited or current not in self.__data.pokedex:
+                continue
+
+            visited.add(current)
+            learnset.update(self.__data.learnset.get(current, {}).get("learnset", {}).keys())
+
+            entry = self.__data.pokedex[current]
+            for related in ("prevo", "baseSpecies", "changesFrom"):
+                if related in entry:
+                    pending.append(to_id_str(entry[related]))
+
+        return learnset
+
+    def __check_ability(self, mon: TeambuilderPokemon, abilities: set[str]) -> list[TeamProblem]:
+        if not mon.ability:
+            return [TeamProblem("ability", "missing")]
+
+        ability_id = to_id_str(mon.ability)
+
+        if ability_id not in abilities:
+            return [TeamProblem("ability", f"{mon.species} cannot have {mon.ability}")]
+
+        return []
+
+    def __check_moves(self, mon: TeambuilderPokemon, learnset: set[str]) -> list[TeamProblem]:
+        problems: list[TeamProblem] = []
+
+        if not mon.moves:
+            return [TeamProblem("moves", "at least one move is needed")]
+
+        if len(mon.moves) > self.MAX_MOVES:
+            problems.append(TeamProblem("moves", f"at most {self.MAX_MOVES} moves are allowed"))
+
+        seen: set[str] = set()
+
+        for move in mon.moves:
+            move_id = to_id_str(move)
+
+            if move_id in seen:
+                problems.append(TeamProblem("moves", f"{move} is repeated"))
+                continue
+
+            seen.add(move_id)
+
+            if move_id not in self.__data.moves and move_id not in self.CUSTOM_MOVES:
+                problems.append(TeamProblem("moves", f"unknown move {move}"))
+            elif move_id not in learnset and not move_id.startswith("hiddenpower"):
+                problems.append(TeamProblem("moves", f"{mon.species} cannot learn {move}"))
+
+        return problems
+
+    def __check_item(self, mon: TeambuilderPokemon) -> list[TeamProblem]:
+        if not mon.item:
+            return []
+
+        item_id = to_id_str(mon.item)
+
+        if not item_id:
+            return [TeamProblem("item", f"invalid item {mon.item}")]
+
+        # Generations without an item table are only checked for the shape of the name
+        if self.__items is not None and item_id not in self.__items and item_id not in self.CUSTOM_ITEMS:
+            return [TeamProblem("item", f"unknown item {mon.item}")]
+
+        return []
+
+    def __check_stats(self, mon: TeambuilderPokemon) -> list[TeamProblem]:
+        problems: list[TeamProblem] = []
+
+        evs = mon.evs or []
+        if any(ev < 0 or ev > self.MAX_EV for ev in evs):
+            problems.append(TeamProblem("evs", f"each EV must be between 0 and {self.MAX_EV}"))
+        if sum(evs) > self.MAX_TOTAL_EVS:
+            problems.append(TeamProblem("evs", f"EVs add up to {sum(evs)}, the limit is {self.MAX_TOTAL_EVS}"))
+
+        ivs = mon.ivs or []
+        if any(iv < 0 or iv > self.MAX_IV for iv in ivs):
+            problems.append(TeamProblem("ivs", f"each IV must be between 0 and {self.MAX_IV}"))
+
+        if mon.level is not None and not 1 <= int(mon.level) <= self.MAX_LEVEL:
+            problems.append(TeamProblem("level", f"must be between 1 and {self.MAX_LEVEL}"))
+
+        if mon.nature and to_id_str(mon.nature) not in self.__data.natures:
+            problems.append(TeamProblem("nature", f"unknown nature {mon.nature}"))
+
+        return problems
@@ -0,0 +1,75 @@
+import asyncio
+import marshal
+import os
+import tempfile
+import time
+from typing import Any
+
+from config import Config
+
+
+class Checkpoint:
+    """
+    Small records left on disk when the bot goes down, read back once the next time they are needed.
+    Values must be marshallable, so only plain data like bytes, numbers, lists, tuples and dicts.
+    """
+
+    CHECKPOINT_DIR = os.path.join(Config.STATE_DIR, "checkpoints")
+    EXTENSION = ".checkpoint"
+
+    # Tasks still writing checkpoints, kept here since the cogs that start them are reloaded without waiting
+    __writing: set[asyncio.Task] = set()
+
+    @staticmethod
+    def track(task: asyncio.Task):
+        Checkpoint.__writing.add(task)
+        task.add_done_callback(Checkpoint.__writing.discard)
+
+    @staticmethod
+    async def wait_written():
+        """
+        Wait for every tracked task, so a checkpoint being written is not missed by reading it too early.
+        :return:
+        """
+        if Checkpoint.__writing:
+            await asyncio.wait(set(Checkpoint.__writing))
+
+    @staticmethod
+    def get_path(name: str) -> str:
+        return os.path.join(Checkpoint.CHECKPOINT_DIR, name + Checkpoint.EXTENSION)
+
+    @staticmethod
+    def write(name: str, value: Any):
+        os.makedirs(Checkpoint.CHECKPOINT_DIR, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=Checkpoint.CHECKPOINT_DIR, delete=False) as tmp:
+            marshal.dump(value, tmp)
+
+        # Atomic, so a checkpoint interrupted halfway is never read back
+        os.replace(tmp.name, Checkpoint.get_path(name))
+
+    @staticmethod
+    def read(name: str, max_age: float | None = None) -> Any | None:
+        """
+        Take a checkpoint back, it is removed so it can only be restored once.
+        :param name:
+        :param max_age: Seconds after which a checkpoint is too old to be restored
+        :return: None if there is no checkpoint, or it is too old or unreadable
+        """
+        path = Checkpoint.get_path(name)
+
+        try:
+            with open(path, "rb") as f:
+                age = time.time() - os.fstat(f.fileno()).st_mtime
+                value = marshal.load(f) if max_age is None or age <= max_age else None
+        except FileNotFoundError:
+            return None
+        except (EOFError, ValueError, TypeError):
+            value = None
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+        return value
@@ -0,0 +1,132 @@
+import asyncio
+import random
+from typing import Any
+
+import aiohttp
+
+from logger import logger
+
+
+class EventClient:
+    """
+    Fire-and-forget client for the events the Cafe sends to the other bots' APIs.
+    Events are queued and sent in batches by a single worker over one keep-alive session,
+    so a slow or unreachable bot never blocks a command.
+    Several events for the same bot go out as one request to its /batch endpoint, when it has one.
+    """
+
+    TIMEOUT = 5  # seconds, for the whole request
+    CONNECT_TIMEOUT = 2  # seconds
+    RETRIES = 3  # only when the connection could not be made, events are not idempotent
+    BACKOFF = 0.5  # seconds, doubled on every retry
+    BATCH_SIZE = 16
+    QUEUE_SIZE = 1024
+    CONNECTIONS_PER_HOST = 8
+
+    def __init__(self):
+        self.__session: aiohttp.ClientSession | None = None
+        self.__queue: asyncio.Queue[tuple[str, str, dict[str, Any]]] = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self.__worker: asyncio.Task | None = None
+        # APIs that turned out to have no batch endpoint
+        self.__unbatched_apis: set[str] = set()
+
+    async def start(self):
+        if self.__session is None or self.__session.closed:
+            self.__session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.TIMEOUT, connect=self.CONNECT_TIMEOUT),
+                connector=aiohttp.TCPConnector(limit_per_host=self.CONNECTIONS_PER_HOST)
+            )
+
+        if self.__worker is None or self.__worker.done():
+            self.__worker = asyncio.create_task(self.__run())
+
+    async def close(self, timeout: float = TIMEOUT):
+        # Give queued events a chance to go out before the session is gone
+        try:
+            await asyncio.wait_for(self.__queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Dropped {self.__queue.qsize()} events on shutdown")
+
+        if self.__worker is not None:
+            self.__worker.cancel()
+            self.__worker = None
+
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    def send(self, api: str, path: str, data: dict[str, Any]):
+        """
+        Queue an event, returns immediately.
+        :param api: Base url of the bot's API
+        :param path:
+        :param data: Copied, so the caller may keep changing it
+        :return:
+        """
+        try:
+            self.__queue.put_nowait((api, path, dict(data)))
+        except asyncio.QueueFull:
+            logger.warning(f"Event queue is full, dropped event for {api}{path}")
+
+    async def __run(self):
+        while True:
+            batch = [await self.__queue.get()]
+
+            while len(batch) < self.BATCH_SIZE and not self.__queue.empty():
+                batch.append(self.__queue.get_nowait())
+
+            events_by_api: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+            for api, path, data in batch:
+                events_by_api.setdefault(api, []).append((path, data))
+
+            try:
+                await asyncio.gather(*(self.__send_events(api, events) for api, events in events_by_api.items()))
+            except Exception as e:
+                # The worker must outlive any one batch, or every later event would sit in the queue forever
+                logger.error(f"Could not send {len(batch)} events: {e}")
+            finally:
+                for _ in batch:
+                    self.__queue.task_done()
+
+    async def __send_events(self, api: str, events: list[tuple[str, dict[str, Any]]]):
+        if len(events) > 1 and api not in self.__unbatched_apis:
+            status = await self.__post(f"{api}/batch", {"events": [{"path": path, "data": data} for path, data in events]})
+
+            if status not in (404, 405):
+                return
+
+            self.__unbatched_apis.add(api)
+
+        # One at a time per channel, so replies show up in the order they happened
+        events_by_channel: dict[int | None, list[tuple[str, dict[str, Any]]]] = {}
+        for path, data in events:
+            events_by_channel.setdefault(data.get("channel_id", None), []).append((path, data))
+
+        async def send_channel_events(channel_events: list[tuple[str, dict[str, Any]]]):
+            for path, data in channel_events:
+                await self.__post(f"{api}{path}", data)
+
+        await asyncio.gather(*(send_channel_events(channel_events) for channel_events in events_by_channel.values()))
+
+    async def __post(self, url: str, data: dict[str, Any]) -> int | None:
+        for attempt in range(self.RETRIES + 1):
+            try:
+                async with self.__session.post(url, json=data) as response:
+                    if response.status >= 500:
+                        logger.warning(f"Event to {url} failed with status {response.status}")
+
+                    return response.status
+            except aiohttp.ClientConnectorError:
+                # Nothing was sent yet, so the bot cannot have acted on the event
+                pass
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                # The bot may have replied already, sending the event again could reply twice
+                logger.warning(f"Event to {url} may not have arrived: {e!r}")
+                return None
+
+            if attempt < self.RETRIES:
+                # Full jitter, so bots coming back up are not hit by every retry at once
+                await asyncio.sleep(random.uniform(0, self.BACKOFF * 2 ** attempt))
+
+        logger.warning(f"Gave up sending event to {url} after {self.RETRIES + 1} attempts")
+        return None
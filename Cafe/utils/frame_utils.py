@@ -20,7 +20,7 @@ class FrameUtils:
         return image_bytes_io.getvalue()
 
     @staticmethod
-    def frames_to_bytes(frames: list[Image]) -> bytes:
+    def frames_to_bytes(frames: list[Image], fps=30) -> bytes:
         gif_bytes_io = io.BytesIO()
 
         frames[0].save(
@@ -29,7 +29,7 @@ class FrameUtils:
             save_all=True,
             append_images=frames,
             loop=None,
-            duration=FrameUtils.fps_to_ms(30)
+            duration=FrameUtils.fps_to_ms(fps)
         )
 
         return gif_bytes_io.getvalue()
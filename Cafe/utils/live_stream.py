@@ -0,0 +1,113 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Generic, TypeVar
+
+from vault.exceptions.too_many_live_streams import TooManyLiveStreams
+
+from config import Config
+from logger import logger
+
+T = TypeVar("T")
+
+
+class LiveStream(Generic[T]):
+    """
+    Keeps a game running on its own, uploading it in chunks instead of waiting for presses.
+    A chunk is emulated while the one before it uploads, and presses made meanwhile are played at the start of the next.
+    The stream stops by itself once nobody has pressed anything for idle_timeout.
+    """
+
+    INTERVAL = 2  # seconds, at least this long between uploads, about what a chunk lasts
+    IDLE_TIMEOUT = 5 * 60  # seconds
+
+    # Counted across every stream, emulating continuously is far heavier than answering presses
+    __running = 0
+
+    def __init__(
+            self,
+            emulate: Callable[[list[T]], Awaitable[bytes]],
+            upload: Callable[[bytes], Awaitable[None]],
+            interval: float = INTERVAL,
+            idle_timeout: float = IDLE_TIMEOUT
+    ):
+        """
+        :param emulate: Plays the presses and emulates one chunk, encoded and ready to upload
+        :param upload:
+        :param interval:
+        :param idle_timeout:
+        """
+        self.emulate = emulate
+        self.upload = upload
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.last_interaction = time.monotonic()
+        self.__presses: list[T] = []
+        self.__task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.__task is not None and not self.__task.done()
+
+    def start(self):
+        if self.running:
+            return
+
+        if LiveStream.__running >= Config.MAX_LIVE_STREAMS:
+            raise TooManyLiveStreams()
+
+        LiveStream.__running += 1
+
+        self.last_interaction = time.monotonic()
+        self.__task = asyncio.create_task(self.__run())
+
+        # Released even if the stream is stopped before it ever ran
+        self.__task.add_done_callback(LiveStream.__release)
+
+    def stop(self):
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    def press(self, press: T):
+        self.__presses.append(press)
+        self.last_interaction = time.monotonic()
+
+    async def __run(self):
+        upload: asyncio.Task | None = None
+
+        try:
+            while time.monotonic() - self.last_interaction < self.idle_timeout:
+                presses, self.__presses = self.__presses, []
+
+                chunk = await self.emulate(presses)
+
+                # Never more than one chunk ahead of the upload, or presses would show up later and later
+                if upload is not None:
+                    await upload
+
+                upload = asyncio.create_task(self.__upload(chunk))
+
+            if upload is not None:
+                await upload
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Live stream stopped: {e}")
+        finally:
+            if upload is not None and not upload.done():
+                upload.cancel()
+
+    @staticmethod
+    def __release(task: asyncio.Task):
+        LiveStream.__running -= 1
+
+    async def __upload(self, chunk: bytes):
+        start = time.monotonic()
+
+        await self.upload(chunk)
+
+        # Paced so every chunk plays out before the next one replaces it
+        delay = start + self.interval - time.monotonic()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
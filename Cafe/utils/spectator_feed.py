@@ -0,0 +1,104 @@
+import asyncio
+import time
+from dataclasses import dataclass
+
+import discord
+
+from logger import logger
+from utils.discord_utils import image_to_embed, gif_to_embed
+
+
+@dataclass
+class Spectator:
+    channel: discord.abc.Messageable
+    message: discord.Message | None = None
+    pending: tuple[bytes, bool] | None = None
+    last_flush: float = 0.0
+    flush_task: asyncio.Task | None = None
+
+
+class SpectatorFeed:
+    """
+    Shows the frames of one game in other channels, each under a message of its own.
+    Frames are published already encoded, so every spectator uploads the very same bytes,
+    and each channel is edited at most once every interval, skipping straight to the latest frame.
+    """
+
+    INTERVAL = 2  # seconds
+    MAX_SPECTATORS = 10
+
+    def __init__(self, interval: float = INTERVAL):
+        self.interval = interval
+        self.__spectators: dict[int, Spectator] = {}
+        self.__last_frame: tuple[bytes, bool] | None = None
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self.__spectators
+
+    def __len__(self) -> int:
+        return len(self.__spectators)
+
+    def subscribe(self, channel: discord.abc.Messageable):
+        spectator = Spectator(channel=channel)
+        self.__spectators[channel.id] = spectator
+
+        # Latecomers see the game as it is right now, not only from the next press on
+        if self.__last_frame is not None:
+            self.__schedule(spectator, self.__last_frame)
+
+    def unsubscribe(self, channel_id: int):
+        spectator = self.__spectators.pop(channel_id, None)
+
+        if spectator is not None and spectator.flush_task is not None:
+            spectator.flush_task.cancel()
+
+    def publish(self, image_bytes: bytes, animated: bool):
+        """
+        Send a frame to every spectator, without waiting for any upload.
+        :param image_bytes: A PNG, or a GIF if animated
+        :param animated:
+        :return:
+        """
+        self.__last_frame = (image_bytes, animated)
+
+        for spectator in self.__spectators.values():
+            self.__schedule(spectator, self.__last_frame)
+
+    def close(self):
+        for channel_id in list(self.__spectators):
+            self.unsubscribe(channel_id)
+
+    def __schedule(self, spectator: Spectator, frame: tuple[bytes, bool]):
+        spectator.pending = frame
+
+        if spectator.flush_task is None or spectator.flush_task.done():
+            spectator.flush_task = asyncio.create_task(self.__flush_later(spectator))
+
+    async def __flush_later(self, spectator: Spectator):
+        delay = spectator.last_flush + self.interval - time.monotonic()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        frame, spectator.pending = spectator.pending, None
+
+        if frame is None:
+            return
+
+        image_bytes, animated = frame
+        file, embed = gif_to_embed(image_bytes) if animated else image_to_embed(image_bytes)
+
+        try:
+            if spectator.message is None:
+                spectator.message = await spectator.channel.send(file=file, embed=embed)
+            else:
+                await spectator.message.edit(file=file, embed=embed)
+        except discord.HTTPException as e:
+            # The spectator misses this frame, the next one is tried regardless
+            logger.warning(f"Could not show a frame to spectators in {spectator.channel.id}: {e}")
+
+        spectator.last_flush = time.monotonic()
+
+        # Frames published during the upload are shown by the next flush
+        if spectator.pending is not None:
+            spectator.flush_task = asyncio.create_task(self.__flush_later(spectator))
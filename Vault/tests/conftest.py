@@ -0,0 +1,15 @@
+from sqlalchemy import BigInteger
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.ext.compiler import compiles
+
+
+# The Vault runs on MySQL, these stand in for its types on SQLite
+@compiles(LONGBLOB, "sqlite")
+def __compile_longblob(element, compiler, **kwargs):
+    return "BLOB"
+
+
+@compiles(BigInteger, "sqlite")
+def __compile_big_integer(element, compiler, **kwargs):
+    # Only INTEGER primary keys autoincrement on SQLite
+    return "INTEGER"
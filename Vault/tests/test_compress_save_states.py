@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from vault.data.database.base import Base
+from vault.data.database.compressed_blob import is_compressed
+from vault.data.database.gameboy_cartridge import GameBoyCartridge
+from vault.data.database.rom import Rom
+from vault.data.database.user import User
+from vault.database.cartridge_database import CartridgeDatabase
+
+USER_ID = 1234
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            User(
+                id=USER_ID,
+                gameboy_cartridges=[
+                    GameBoyCartridge(id=1, title="Game", rom=Rom(data=b"\x00" * 1024)),
+                    GameBoyCartridge(id=2, title="Other game", rom=Rom(data=b"\x01" * 1024))
+                ]
+            )
+        )
+        session.commit()
+
+        # Written around CompressedBlob, like the rows stored before compression was introduced
+        session.execute(text("UPDATE cartridge SET state = :state, save_state = :save_state"), {
+            "state": b"state",
+            "save_state": b"save"
+        })
+        session.commit()
+
+    return engine
+
+
+def fetch_raw(engine, cartridge_id: int) -> tuple[bytes, bytes]:
+    with engine.connect() as connection:
+        return connection.execute(
+            text("SELECT state, save_state FROM cartridge WHERE id = :id"), {"id": cartridge_id}
+        ).one()
+
+
+def test_compresses_raw_states_once(engine):
+    with Session(engine) as session:
+        assert CartridgeDatabase(session).compress_save_states() == 2
+
+    assert all(is_compressed(value) for value in fetch_raw(engine, 1))
+
+    with Session(engine) as session:
+        cartridge = session.get(GameBoyCartridge, 1)
+
+        assert cartridge.state == b"state"
+        assert cartridge.save_state == b"save"
+
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        assert CartridgeDatabase(session).compress_save_states() == 0
+
+    # Compressed rows are filtered out by the database, so the first batch already comes back empty
+    assert len(statements) == 1
+    assert statements[0].startswith("SELECT")
+
+
+def test_keeps_states_saved_while_compressing(engine):
+    saved: list[bool] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def save_meanwhile(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and not saved:
+            saved.append(True)
+
+            # A press saving the game between the read and the rewrite
+            conn.exec_driver_sql("UPDATE cartridge SET state = ? WHERE id = 1", (b"newer",))
+
+    with Session(engine) as session:
+        assert CartridgeDatabase(session).compress_save_states() == 1
+
+    assert fetch_raw(engine, 1)[0] == b"newer"
+    assert all(is_compressed(value) for value in fetch_raw(engine, 2))
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from vault.data.database.base import Base
+from vault.data.database.gameboy_cartridge import GameBoyCartridge
+from vault.data.database.gameboy_profile import GameBoyProfile
+from vault.data.database.nes_cartridge import NESCartridge
+from vault.data.database.pokemon import Pokemon
+from vault.data.database.rom import Rom
+from vault.data.database.statistics import Statistics
+from vault.data.database.user import User
+from vault.database.fetch_profile import FetchProfile
+from vault.database.user_database import UserDatabase
+
+USER_ID = 1234
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(
+            User(
+                id=USER_ID,
+                statistics=Statistics(),
+                pokemon=Pokemon(),
+                gameboy_profile=GameBoyProfile(),
+                gameboy_cartridges=[
+                    GameBoyCartridge(title="Game", rom=Rom(data=b"\x00" * 1024), state=b"state", save_state=b"save")
+                ],
+                nes_cartridges=[
+                    NESCartridge(title="Game", rom=Rom(data=b"\x01" * 1024), state=b"state", save_state=b"save")
+                ]
+            )
+        )
+        session.commit()
+
+    return engine
+
+
+@pytest.fixture
+def statements(engine):
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+def test_profile_fetch_loads_no_cartridges(engine, statements):
+    # What a /talk, a ping mention or a joypad press fetches
+    with Session(engine) as session:
+        user = UserDatabase(session).fetch(USER_ID)
+
+        assert user.statistics is not None
+        assert user.gameboy_profile is not None
+
+    assert statements
+    assert not any("cartridge" in statement for statement in statements)
+    assert not any("rom." in statement for statement in statements)
+
+
+def test_cartridges_fetch_loads_no_blobs(engine, statements):
+    with Session(engine) as session:
+        user = UserDatabase(session).fetch(USER_ID, FetchProfile.Cartridges)
+
+        assert [cartridge.title for cartridge in user.gameboy_cartridges] == ["Game"]
+        assert [cartridge.title for cartridge in user.nes_cartridges] == ["Game"]
+
+    for statement in statements:
+        assert "rom.data" not in statement
+        assert "cartridge.state" not in statement
+        assert "cartridge.save_state" not in statement
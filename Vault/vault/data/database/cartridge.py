@@ -1,11 +1,18 @@
-import hashlib
+from enum import Enum
 
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
-from sqlalchemy.dialects.mysql import LONGBLOB
-from sqlalchemy.orm import mapped_column, Mapped
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, event, update, delete, JSON
+from sqlalchemy.orm import mapped_column, Mapped, relationship, deferred
 from sqlalchemy.util.preloaded import orm
 
 from vault.data.database.base import Base
+from vault.data.database.compressed_blob import CompressedBlob
+from vault.data.database.rom import Rom
+
+
+class CartridgeBlob(Enum):
+    # Deferred column groups, only loaded when a fetch asks for them or the attribute is accessed
+    State = "state"
+    SaveState = "save_state"
 
 
 class Cartridge(Base):
@@ -31,15 +38,17 @@ class Cartridge(Base):
 
     play_time = Column(Integer, default=0, nullable=False)
 
-    rom = Column(LONGBLOB, nullable=False)
-    rom_hash = Column(String(64), nullable=False)
+    header = Column(JSON, nullable=True)  # what the ROM's header says about the game, read at check-in
+
+    rom_hash: Mapped[str] = mapped_column(ForeignKey("rom.hash"), nullable=False)
+    rom: Mapped[Rom] = relationship()
 
-    state = Column(LONGBLOB, nullable=True)
-    save_state = Column(LONGBLOB, nullable=True)
+    state = deferred(Column(CompressedBlob, nullable=True), group=CartridgeBlob.State.value)
+    save_state = deferred(Column(CompressedBlob, nullable=True), group=CartridgeBlob.SaveState.value)
 
     @staticmethod
     def generate_rom_hash(rom_bytes: bytes) -> str:
-        return hashlib.sha256(rom_bytes).hexdigest()
+        return Rom.generate_hash(rom_bytes)
 
     @orm.reconstructor
     def init_on_load(self):
@@ -49,5 +58,30 @@ class Cartridge(Base):
     @orm.validates('rom')
     def __validate_rom(self, key, value):
         # Automatically update rom_hash on setting rom
-        self.rom_hash = self.generate_rom_hash(value)
+        self.rom_hash = value.hash
         return value
+
+
+@event.listens_for(Cartridge, "after_insert", propagate=True)
+def __reference_rom(mapper, connection, target: Cartridge):
+    connection.execute(
+        update(Rom.__table__)
+        .where(Rom.__table__.c.hash == target.rom_hash)
+        .values(reference_count=Rom.__table__.c.reference_count + 1)
+    )
+
+
+@event.listens_for(Cartridge, "after_delete", propagate=True)
+def __release_rom(mapper, connection, target: Cartridge):
+    connection.execute(
+        update(Rom.__table__)
+        .where(Rom.__table__.c.hash == target.rom_hash)
+        .values(reference_count=Rom.__table__.c.reference_count - 1)
+    )
+
+    # Nobody owns this ROM anymore
+    connection.execute(
+        delete(Rom.__table__)
+        .where(Rom.__table__.c.hash == target.rom_hash)
+        .where(Rom.__table__.c.reference_count <= 0)
+    )
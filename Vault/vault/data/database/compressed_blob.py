@@ -0,0 +1,36 @@
+import zstandard
+from sqlalchemy import TypeDecorator
+from sqlalchemy.dialects.mysql import LONGBLOB
+
+# Prefix written in front of every compressed value, so rows stored before compression still load as raw bytes
+COMPRESSED_BLOB_HEADER = b"BZS\x01"
+COMPRESSION_LEVEL = 3
+
+
+def is_compressed(value: bytes | None) -> bool:
+    return value is not None and bytes(value[:len(COMPRESSED_BLOB_HEADER)]) == COMPRESSED_BLOB_HEADER
+
+
+def compress(value: bytes | None) -> bytes | None:
+    if value is None or is_compressed(value):
+        return value
+
+    return COMPRESSED_BLOB_HEADER + zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(bytes(value))
+
+
+def decompress(value: bytes | None) -> bytes | None:
+    if not is_compressed(value):
+        return value
+
+    return zstandard.ZstdDecompressor().decompress(bytes(value[len(COMPRESSED_BLOB_HEADER):]))
+
+
+class CompressedBlob(TypeDecorator):
+    impl = LONGBLOB
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return compress(value)
+
+    def process_result_value(self, value, dialect):
+        return decompress(value)
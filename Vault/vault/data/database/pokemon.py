@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Text, Integer
+from sqlalchemy import Column, ForeignKey, Text, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from vault.data.database.base import Base
@@ -13,3 +13,5 @@ class Pokemon(Base):
     user: Mapped["User"] = relationship(back_populates="pokemon")
 
     mon = Column(Text, nullable=True)  # raw Showdown team string
+    packed = Column(Text, nullable=True)  # mon in Showdown's packed format, ready to battle
+    fingerprint = Column(String(64), nullable=True)  # which mon and validation rules packed was made from
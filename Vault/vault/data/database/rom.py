@@ -0,0 +1,28 @@
+import hashlib
+
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.dialects.mysql import LONGBLOB
+from sqlalchemy.orm import deferred
+from sqlalchemy.util.preloaded import orm
+
+from vault.data.database.base import Base
+
+
+class Rom(Base):
+    __tablename__ = 'rom'
+
+    hash = Column(String(64), primary_key=True)
+    data = deferred(Column(LONGBLOB, nullable=False))
+
+    # Number of cartridges pointing at this ROM, kept up to date by the Cartridge mapper events
+    reference_count = Column(Integer, default=0, nullable=False)
+
+    @staticmethod
+    def generate_hash(rom_bytes: bytes) -> str:
+        return hashlib.sha256(rom_bytes).hexdigest()
+
+    @orm.validates('data')
+    def __validate_data(self, key, value):
+        # Automatically update hash on setting data
+        self.hash = self.generate_hash(value)
+        return value
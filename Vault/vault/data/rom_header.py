@@ -0,0 +1,185 @@
+from dataclasses import dataclass, asdict
+from typing import Any
+
+from vault.exceptions.invalid_rom import InvalidROM
+
+
+@dataclass
+class GameBoyHeader:
+    """
+    The cartridge header every Game Boy ROM carries at 0x100-0x14F, checked the same way the boot ROM does.
+    """
+
+    HEADER_END = 0x150
+
+    # The boot ROM refuses to start a cartridge without this exact logo
+    LOGO = bytes.fromhex(
+        "CEED6666CC0D000B03730083000C000D0008111F8889000EDCCC6EE6DDDDD999BBBB67636E0EECCCDDDC999FBBB9333E"
+    )
+
+    CARTRIDGE_TYPES = {
+        0x00: "ROM",
+        0x01: "MBC1",
+        0x02: "MBC1+RAM",
+        0x03: "MBC1+RAM+BATTERY",
+        0x05: "MBC2",
+        0x06: "MBC2+BATTERY",
+        0x08: "ROM+RAM",
+        0x09: "ROM+RAM+BATTERY",
+        0x0B: "MMM01",
+        0x0C: "MMM01+RAM",
+        0x0D: "MMM01+RAM+BATTERY",
+        0x0F: "MBC3+TIMER+BATTERY",
+        0x10: "MBC3+TIMER+RAM+BATTERY",
+        0x11: "MBC3",
+        0x12: "MBC3+RAM",
+        0x13: "MBC3+RAM+BATTERY",
+        0x19: "MBC5",
+        0x1A: "MBC5+RAM",
+        0x1B: "MBC5+RAM+BATTERY",
+        0x1C: "MBC5+RUMBLE",
+        0x1D: "MBC5+RUMBLE+RAM",
+        0x1E: "MBC5+RUMBLE+RAM+BATTERY",
+        0x20: "MBC6",
+        0x22: "MBC7+SENSOR+RUMBLE+RAM+BATTERY",
+        0xFC: "POCKET CAMERA",
+        0xFD: "BANDAI TAMA5",
+        0xFE: "HuC3",
+        0xFF: "HuC1+RAM+BATTERY"
+    }
+
+    RAM_SIZES = {0x00: 0, 0x01: 2 * 1024, 0x02: 8 * 1024, 0x03: 32 * 1024, 0x04: 128 * 1024, 0x05: 64 * 1024}
+
+    title: str
+    cgb: str  # "dmg", "compatible" or "only"
+    sgb: bool
+    cartridge_type: str
+    rom_size: int  # bytes
+    ram_size: int  # bytes
+
+    @staticmethod
+    def parse(rom_bytes: bytes) -> "GameBoyHeader":
+        if len(rom_bytes) < GameBoyHeader.HEADER_END:
+            raise InvalidROM("ROM is too small to have a header")
+
+        if rom_bytes[0x104:0x134] != GameBoyHeader.LOGO:
+            raise InvalidROM("Header logo does not match")
+
+        checksum = 0
+        for byte in rom_bytes[0x134:0x14D]:
+            checksum = (checksum - byte - 1) & 0xFF
+
+        if checksum != rom_bytes[0x14D]:
+            raise InvalidROM("Header checksum does not match")
+
+        if rom_bytes[0x147] not in GameBoyHeader.CARTRIDGE_TYPES:
+            raise InvalidROM(f"Unknown cartridge type {rom_bytes[0x147]:#04x}")
+
+        if rom_bytes[0x148] > 0x08:
+            raise InvalidROM(f"Unknown ROM size {rom_bytes[0x148]:#04x}")
+
+        if rom_bytes[0x149] not in GameBoyHeader.RAM_SIZES:
+            raise InvalidROM(f"Unknown RAM size {rom_bytes[0x149]:#04x}")
+
+        match rom_bytes[0x143]:
+            case 0xC0:
+                cgb = "only"
+                title_end = 0x143
+            case 0x80:
+                cgb = "compatible"
+                title_end = 0x143
+            case _:
+                cgb = "dmg"
+                title_end = 0x144
+
+        return GameBoyHeader(
+            title=rom_bytes[0x134:title_end].split(b"\x00", 1)[0].decode("ascii", errors="replace").strip(),
+            cgb=cgb,
+            sgb=rom_bytes[0x146] == 0x03,
+            cartridge_type=GameBoyHeader.CARTRIDGE_TYPES[rom_bytes[0x147]],
+            rom_size=(32 * 1024) << rom_bytes[0x148],
+            ram_size=GameBoyHeader.RAM_SIZES[rom_bytes[0x149]]
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class NESHeader:
+    """
+    The 16 byte iNES or NES 2.0 header in front of every NES ROM dump.
+    """
+
+    HEADER_SIZE = 16
+    TRAINER_SIZE = 512
+    MAGIC = b"NES\x1a"
+
+    format: str  # "iNES" or "NES 2.0"
+    mapper: int
+    submapper: int
+    prg_rom_size: int  # bytes
+    chr_rom_size: int  # bytes
+    mirroring: str  # "horizontal", "vertical" or "four-screen"
+    battery: bool
+    trainer: bool
+
+    @staticmethod
+    def parse(rom_bytes: bytes) -> "NESHeader":
+        if len(rom_bytes) < NESHeader.HEADER_SIZE or rom_bytes[:4] != NESHeader.MAGIC:
+            raise InvalidROM("Missing iNES header")
+
+        flags6, flags7 = rom_bytes[6], rom_bytes[7]
+
+        mapper = (flags6 >> 4) | (flags7 & 0xF0)
+        submapper = 0
+
+        if flags7 & 0x0C == 0x08:
+            header_format = "NES 2.0"
+            mapper |= (rom_bytes[8] & 0x0F) << 8
+            submapper = rom_bytes[8] >> 4
+            prg_rom_size = NESHeader.__get_nes2_size(rom_bytes[4], rom_bytes[9] & 0x0F, 16 * 1024)
+            chr_rom_size = NESHeader.__get_nes2_size(rom_bytes[5], rom_bytes[9] >> 4, 8 * 1024)
+        else:
+            header_format = "iNES"
+            prg_rom_size = rom_bytes[4] * 16 * 1024
+            chr_rom_size = rom_bytes[5] * 8 * 1024
+
+        if not prg_rom_size:
+            raise InvalidROM("ROM has no PRG ROM")
+
+        trainer = bool(flags6 & 0x04)
+
+        expected_size = NESHeader.HEADER_SIZE + (NESHeader.TRAINER_SIZE if trainer else 0) + prg_rom_size + chr_rom_size
+
+        if len(rom_bytes) < expected_size:
+            raise InvalidROM("ROM is smaller than its header says")
+
+        if flags6 & 0x08:
+            mirroring = "four-screen"
+        elif flags6 & 0x01:
+            mirroring = "vertical"
+        else:
+            mirroring = "horizontal"
+
+        return NESHeader(
+            format=header_format,
+            mapper=mapper,
+            submapper=submapper,
+            prg_rom_size=prg_rom_size,
+            chr_rom_size=chr_rom_size,
+            mirroring=mirroring,
+            battery=bool(flags6 & 0x02),
+            trainer=trainer
+        )
+
+    @staticmethod
+    def __get_nes2_size(lsb: int, msb: int, unit: int) -> int:
+        if msb == 0x0F:
+            # Exponent-multiplier notation, for sizes that are not a multiple of the unit
+            return (1 << (lsb >> 2)) * ((lsb & 0x03) * 2 + 1)
+
+        return ((msb << 8) | lsb) * unit
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
@@ -0,0 +1,61 @@
+from typing import Type
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
+
+from vault.data.database.cartridge import Cartridge, CartridgeBlob
+from vault.data.database.gameboy_cartridge import GameBoyCartridge
+from vault.data.database.nes_cartridge import NESCartridge
+from vault.data.database.user import User
+from vault.exceptions.game_already_registered import GameAlreadyRegistered
+from vault.exceptions.game_does_not_exist import GameDoesNotExist
+
+
+class AsyncCartridgeDatabase:
+    def __init__(self, session: AsyncSession):
+        self.__session = session
+
+    async def register(self, cartridge: Cartridge):
+        result = await self.__session.execute(select(Cartridge.id).filter_by(title=cartridge.title))
+
+        if result.first():
+            raise GameAlreadyRegistered()
+
+        try:
+            self.__session.add(cartridge)
+            await self.__session.commit()
+        except IntegrityError:
+            await self.__session.rollback()
+            raise GameAlreadyRegistered()
+
+    async def fetch_gameboy_cartridge(
+            self, user: User, title: str, blobs: tuple[CartridgeBlob, ...] = (CartridgeBlob.State,)
+    ) -> GameBoyCartridge | Type[GameBoyCartridge]:
+        result = await self.__session.execute(
+            select(GameBoyCartridge).filter_by(user=user, title=title).options(
+                *[undefer_group(blob.value) for blob in blobs]
+            )
+        )
+        cartridge = result.scalars().first()
+
+        if cartridge is None:
+            raise GameDoesNotExist()
+
+        return cartridge
+
+    async def fetch_nes_cartridge(
+            self, user: User, title: str, blobs: tuple[CartridgeBlob, ...] = (CartridgeBlob.State,)
+    ) -> NESCartridge | Type[NESCartridge]:
+        result = await self.__session.execute(
+            select(NESCartridge).filter_by(user=user, title=title).options(
+                *[undefer_group(blob.value) for blob in blobs]
+            )
+        )
+        cartridge = result.scalars().first()
+
+        if cartridge is None:
+            raise GameDoesNotExist()
+
+        return cartridge
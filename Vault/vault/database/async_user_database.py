@@ -0,0 +1,106 @@
+from typing import Type
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from vault.data.database.gameboy_profile import GameBoyProfile
+from vault.data.database.pokemon import Pokemon
+from vault.data.database.statistics import Statistics
+from vault.data.database.user import User
+from vault.database.fetch_profile import FetchProfile
+from vault.database.user_cache import UserCache
+from vault.exceptions.user_already_registered import UserAlreadyRegistered
+from vault.exceptions.user_not_registered import UserNotRegistered
+
+
+class AsyncUserDatabase:
+    def __init__(self, session: AsyncSession, cache: UserCache | None = None):
+        self.__session = session
+        # Only invalidated, the cache hands out users of the synchronous session
+        self.__cache = cache
+
+    async def register(self, user: User):
+        if await self.__session.get(User, user.id):
+            raise UserAlreadyRegistered()
+
+        try:
+            self.__session.add(user)
+            await self.__session.commit()
+        except IntegrityError:
+            await self.__session.rollback()
+            raise IntegrityError
+
+    async def update(self, user_id: int, updated_user: User):
+        user = await self.__session.get(User, user_id)
+
+        if user is None:
+            raise UserNotRegistered()
+
+        user = updated_user
+
+        try:
+            await self.__session.commit()
+        except IntegrityError:
+            await self.__session.rollback()
+            raise IntegrityError
+        finally:
+            # After the commit, or the synchronous side could cache the old row again meanwhile
+            self.__invalidate(user_id)
+
+    async def fetch(self, user_id: int, profile: FetchProfile = FetchProfile.Profile) -> User | Type[User]:
+        # Lazy loads are not available on an AsyncSession, everything the profile promises is loaded here
+        options = [
+            joinedload(User.statistics),
+            joinedload(User.pokemon),
+            joinedload(User.gameboy_profile)
+        ]
+
+        if profile == FetchProfile.Cartridges:
+            options.append(joinedload(User.gameboy_cartridges))
+            options.append(joinedload(User.nes_cartridges))
+
+        result = await self.__session.execute(select(User).filter_by(id=user_id).options(*options))
+        user = result.unique().scalars().first()
+
+        if user is None:
+            raise UserNotRegistered()
+
+        return user
+
+    async def fetch_or_register(self, user_id: int, profile: FetchProfile = FetchProfile.Profile) -> User | Type[User]:
+        try:
+            return await self.fetch(user_id, profile)
+        except UserNotRegistered:
+            user = User(
+                id=user_id,
+                statistics=Statistics(),
+                pokemon=Pokemon(),
+                gameboy_profile=GameBoyProfile(),
+                gameboy_cartridges=[],
+                nes_cartridges=[]
+            )
+
+            await self.register(user)
+
+            return user
+
+    async def delete(self, user_id: int):
+        user = await self.__session.get(User, user_id)
+
+        if user is None:
+            raise UserNotRegistered()
+
+        try:
+            await self.__session.delete(user)
+            await self.__session.commit()
+        except IntegrityError:
+            await self.__session.rollback()
+            raise IntegrityError
+        finally:
+            self.__invalidate(user_id)
+
+    def __invalidate(self, user_id: int):
+        if self.__cache:
+            self.__cache.invalidate(user_id)
@@ -0,0 +1,68 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from vault.database.async_cartridge_database import AsyncCartridgeDatabase
+from vault.database.async_user_database import AsyncUserDatabase
+from vault.database.user_cache import UserCache
+
+
+class UnitOfWork:
+    def __init__(self, session: AsyncSession, user_cache: UserCache | None = None):
+        self.session = session
+        self.user_database = AsyncUserDatabase(session, user_cache)
+        self.cartridge_database = AsyncCartridgeDatabase(session)
+
+
+class AsyncVault:
+    """
+    Pooled async engine for the Vault.
+    Every interaction opens its own unit of work, so concurrent interactions never share a session or a connection.
+    """
+
+    # Blocking drivers and their asyncio counterparts
+    __ASYNC_DRIVERS = {
+        "mysql": "mysql+aiomysql",
+        "mysql+pymysql": "mysql+aiomysql",
+        "mysql+mysqldb": "mysql+aiomysql",
+        "mysql+mysqlconnector": "mysql+aiomysql",
+    }
+
+    def __init__(
+            self,
+            connection: str,
+            pool_size: int = 10,
+            max_overflow: int = 10,
+            pool_recycle: int = 1800,
+            user_cache: UserCache | None = None
+    ):
+        """
+        :param connection:
+        :param pool_size:
+        :param max_overflow:
+        :param pool_recycle:
+        :param user_cache: The synchronous UserDatabase's cache, invalidated by writes made here
+        """
+        url = make_url(connection)
+        url = url.set(drivername=self.__ASYNC_DRIVERS.get(url.drivername, url.drivername))
+
+        self.__engine = create_async_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=pool_recycle
+        )
+
+        self.__session_maker = async_sessionmaker(self.__engine, expire_on_commit=False)
+        self.__user_cache = user_cache
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[UnitOfWork]:
+        async with self.__session_maker() as session:
+            yield UnitOfWork(session, self.__user_cache)
+
+    async def dispose(self):
+        await self.__engine.dispose()
@@ -1,9 +1,11 @@
 from typing import Type
 
+from sqlalchemy import select, update, type_coerce, LargeBinary, func, or_, and_
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
-from vault.data.database.cartridge import Cartridge
+from vault.data.database.cartridge import Cartridge, CartridgeBlob
+from vault.data.database.compressed_blob import is_compressed, COMPRESSED_BLOB_HEADER
 from vault.data.database.gameboy_cartridge import GameBoyCartridge
 from vault.data.database.nes_cartridge import NESCartridge
 from vault.data.database.user import User
@@ -26,18 +28,95 @@ class CartridgeDatabase:
             self.__session.rollback()
             raise GameAlreadyRegistered()
 
-    def fetch_gameboy_cartridge(self, user: User, title: str) -> GameBoyCartridge | Type[GameBoyCartridge]:
-        cartridge = self.__session.query(GameBoyCartridge).filter_by(user=user, title=title).first()
+    def fetch_cartridge(
+            self, cartridge_id: int, blobs: tuple[CartridgeBlob, ...] = (CartridgeBlob.State,)
+    ) -> Cartridge | Type[Cartridge]:
+        cartridge = self.__session.query(Cartridge).filter_by(id=cartridge_id).options(
+            *[undefer_group(blob.value) for blob in blobs]
+        ).first()
 
         if cartridge is None:
             raise GameDoesNotExist()
 
         return cartridge
 
-    def fetch_nes_cartridge(self, user: User, title: str) -> NESCartridge | Type[NESCartridge]:
-        cartridge = self.__session.query(NESCartridge).filter_by(user=user, title=title).first()
+    def fetch_gameboy_cartridge(
+            self, user: User, title: str, blobs: tuple[CartridgeBlob, ...] = (CartridgeBlob.State,)
+    ) -> GameBoyCartridge | Type[GameBoyCartridge]:
+        cartridge = self.__session.query(GameBoyCartridge).filter_by(user=user, title=title).options(
+            *[undefer_group(blob.value) for blob in blobs]
+        ).first()
 
         if cartridge is None:
             raise GameDoesNotExist()
 
         return cartridge
+
+    def fetch_nes_cartridge(
+            self, user: User, title: str, blobs: tuple[CartridgeBlob, ...] = (CartridgeBlob.State,)
+    ) -> NESCartridge | Type[NESCartridge]:
+        cartridge = self.__session.query(NESCartridge).filter_by(user=user, title=title).options(
+            *[undefer_group(blob.value) for blob in blobs]
+        ).first()
+
+        if cartridge is None:
+            raise GameDoesNotExist()
+
+        return cartridge
+
+    def compress_save_states(self, batch_size: int = 50) -> int:
+        """
+        Rewrite states stored before compression was introduced, so they go through CompressedBlob.
+        Safe to run while the game is being played, a state saved meanwhile is left as it is.
+        :param batch_size: Cartridges read and committed per round-trip
+        :return: Number of cartridges that were recompressed
+        """
+        table = Cartridge.__table__
+
+        # Bypass CompressedBlob on read, otherwise compressed and raw rows look the same
+        raw_state = type_coerce(table.c.state, LargeBinary)
+        raw_save_state = type_coerce(table.c.save_state, LargeBinary)
+
+        # Checked by the database, so rows that are already compressed are never sent over
+        uncompressed = or_(*(
+            type_coerce(func.substr(raw, 1, len(COMPRESSED_BLOB_HEADER)), LargeBinary) != COMPRESSED_BLOB_HEADER
+            for raw in (raw_state, raw_save_state)
+        ))
+
+        compressed = 0
+        last_id = 0
+
+        while True:
+            rows = self.__session.execute(
+                select(table.c.id, raw_state.label("state"), raw_save_state.label("save_state"))
+                .where(table.c.id > last_id, uncompressed)
+                .order_by(table.c.id)
+                .limit(batch_size)
+            ).all()
+
+            if not rows:
+                break
+
+            for cartridge_id, state, save_state in rows:
+                last_id = cartridge_id
+                values = {}
+                unchanged = []
+
+                if state is not None and not is_compressed(state):
+                    values["state"] = state
+                    unchanged.append(raw_state == state)
+
+                if save_state is not None and not is_compressed(save_state):
+                    values["save_state"] = save_state
+                    unchanged.append(raw_save_state == save_state)
+
+                if values:
+                    # Skipped if a press saved a new state since it was read, it is compressed already
+                    result = self.__session.execute(
+                        update(table).where(table.c.id == cartridge_id, and_(*unchanged)).values(**values)
+                    )
+                    compressed += result.rowcount
+
+            self.__session.commit()
+
+        return compressed
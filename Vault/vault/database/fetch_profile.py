@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class FetchProfile(Enum):
+    # Statistics, Pokémon and Game Boy profile, enough for conversations, mentions and joypad presses
+    Profile = "profile"
+
+    # Profile plus every cartridge row, without ROMs or states
+    Cartridges = "cartridges"
@@ -0,0 +1,111 @@
+from sqlalchemy import Connection, Engine, inspect, select, insert, func, table, column, text, LargeBinary, String
+
+from vault.data.database.rom import Rom
+
+
+class Migrations:
+    """
+    Schema changes that create_all cannot apply to tables which already exist.
+    Every migration checks the live schema first, so running them on every startup is safe.
+    Both bots run them against the same database, so they run under a database lock, one bot at a time.
+    """
+
+    LOCK_NAME = "vault_migrations"
+    LOCK_TIMEOUT = 300  # seconds, moving ROMs out of a large cartridge table takes a while
+
+    @staticmethod
+    def run(engine: Engine):
+        with engine.connect() as lock_connection:
+            Migrations.__acquire_lock(lock_connection)
+
+            try:
+                Migrations.move_roms_to_rom_table(engine)
+                Migrations.add_packed_pokemon_columns(engine)
+                Migrations.add_cartridge_header_column(engine)
+            finally:
+                Migrations.__release_lock(lock_connection)
+
+    @staticmethod
+    def __acquire_lock(connection: Connection):
+        # Only MySQL has named locks, other databases are only used by a single process
+        if connection.dialect.name != "mysql":
+            return
+
+        acquired = connection.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"), {"name": Migrations.LOCK_NAME, "timeout": Migrations.LOCK_TIMEOUT}
+        ).scalar()
+
+        if acquired != 1:
+            raise TimeoutError(f"Could not acquire the {Migrations.LOCK_NAME} lock")
+
+    @staticmethod
+    def __release_lock(connection: Connection):
+        if connection.dialect.name != "mysql":
+            return
+
+        connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": Migrations.LOCK_NAME})
+
+    @staticmethod
+    def move_roms_to_rom_table(engine: Engine):
+        """
+        Move the ROM bytes embedded in every cartridge row into the shared, content-addressed rom table.
+        :param engine:
+        :return:
+        """
+        if "rom" not in [c["name"] for c in inspect(engine).get_columns("cartridge")]:
+            return
+
+        cartridge = table("cartridge", column("rom_hash", String), column("rom", LargeBinary))
+        rom = Rom.__table__
+
+        with engine.begin() as connection:
+            references = connection.execute(
+                select(cartridge.c.rom_hash, func.count()).group_by(cartridge.c.rom_hash)
+            ).all()
+
+            for rom_hash, reference_count in references:
+                if connection.execute(select(rom.c.hash).where(rom.c.hash == rom_hash)).first():
+                    continue
+
+                data = connection.execute(
+                    select(cartridge.c.rom).where(cartridge.c.rom_hash == rom_hash).limit(1)
+                ).scalar_one()
+
+                connection.execute(insert(rom).values(hash=rom_hash, data=data, reference_count=reference_count))
+
+        with engine.begin() as connection:
+            connection.execute(text("ALTER TABLE cartridge DROP COLUMN rom"))
+            connection.execute(text(
+                "ALTER TABLE cartridge ADD CONSTRAINT fk_cartridge_rom_hash FOREIGN KEY (rom_hash) REFERENCES rom (hash)"
+            ))
+
+    @staticmethod
+    def add_packed_pokemon_columns(engine: Engine):
+        """
+        Add the columns holding a registered Pokémon's packed team and its validation fingerprint.
+        Existing rows keep them empty until the team is registered again, the raw team is used meanwhile.
+        :param engine:
+        :return:
+        """
+        columns = [c["name"] for c in inspect(engine).get_columns("pokemon")]
+
+        with engine.begin() as connection:
+            if "packed" not in columns:
+                connection.execute(text("ALTER TABLE pokemon ADD COLUMN packed TEXT NULL"))
+
+            if "fingerprint" not in columns:
+                connection.execute(text("ALTER TABLE pokemon ADD COLUMN fingerprint VARCHAR(64) NULL"))
+
+    @staticmethod
+    def add_cartridge_header_column(engine: Engine):
+        """
+        Add the column holding what a cartridge's ROM header says about it.
+        Cartridges checked in before it existed keep it empty and are played as before.
+        :param engine:
+        :return:
+        """
+        if "header" in [c["name"] for c in inspect(engine).get_columns("cartridge")]:
+            return
+
+        with engine.begin() as connection:
+            connection.execute(text("ALTER TABLE cartridge ADD COLUMN header JSON NULL"))
@@ -0,0 +1,19 @@
+from typing import Type
+
+from sqlalchemy.orm import Session
+
+from vault.data.database.rom import Rom
+from vault.exceptions.rom_not_found import RomNotFound
+
+
+class RomDatabase:
+    def __init__(self, session: Session):
+        self.__session = session
+
+    def fetch(self, rom_hash: str) -> Rom | Type[Rom]:
+        rom = self.__session.get(Rom, rom_hash)
+
+        if rom is None:
+            raise RomNotFound()
+
+        return rom
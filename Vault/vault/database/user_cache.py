@@ -0,0 +1,69 @@
+import time
+from collections import OrderedDict
+from typing import Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from vault.data.database.user import User
+from vault.database.fetch_profile import FetchProfile
+
+
+class UserCache:
+    """
+    In-process cache of User aggregates in front of UserDatabase.
+    Entries are only handed out while they are still live, unexpired members of the caller's session identity map.
+    """
+
+    def __init__(self, ttl: float = 30, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries: OrderedDict[int, tuple[float, User | Type[User], FetchProfile]] = OrderedDict()
+
+    def get(self, user_id: int, profile: FetchProfile, session: Session) -> User | Type[User] | None:
+        entry = self.__entries.get(user_id, None)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, user, cached_profile = entry
+
+        if (
+                expires_at < time.monotonic()
+                or (profile == FetchProfile.Cartridges and cached_profile != FetchProfile.Cartridges)
+                or not self.__is_live(user, session)
+        ):
+            self.__entries.pop(user_id, None)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return user
+
+    def put(self, user: User | Type[User], profile: FetchProfile):
+        self.__entries.pop(user.id, None)
+        self.__entries[user.id] = (time.monotonic() + self.ttl, user, profile)
+
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, user_id: int):
+        self.__entries.pop(user_id, None)
+
+    def clear(self):
+        self.__entries.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def __is_live(user: User | Type[User], session: Session) -> bool:
+        state = inspect(user)
+
+        # Expired objects would lazily reload anyway, and detached or deleted ones must not be reused
+        return state.session is session and not state.expired and not state.detached and not state.deleted
@@ -7,13 +7,16 @@ from vault.data.database.gameboy_profile import GameBoyProfile
 from vault.data.database.pokemon import Pokemon
 from vault.data.database.statistics import Statistics
 from vault.data.database.user import User
+from vault.database.fetch_profile import FetchProfile
+from vault.database.user_cache import UserCache
 from vault.exceptions.user_already_registered import UserAlreadyRegistered
 from vault.exceptions.user_not_registered import UserNotRegistered
 
 
 class UserDatabase:
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, cache: UserCache | None = None):
         self.__session = session
+        self.__cache = cache
 
     def register(self, user: User):
         if self.__session.query(User).filter_by(id=user.id).first():
@@ -27,36 +30,55 @@ class UserDatabase:
             raise IntegrityError
 
     def update(self, user_id: int, updated_user: User):
-        user = self.__session.query(User).filter_by(id=user_id).first()
+        # Served from the identity map without a round-trip when the user was fetched on this session
+        user = self.__session.get(User, user_id)
 
         if user is None:
             raise UserNotRegistered()
 
         user = updated_user
 
+        if self.__cache:
+            self.__cache.invalidate(user_id)
+
         try:
             self.__session.commit()
         except IntegrityError:
             self.__session.rollback()
             raise IntegrityError
 
-    def fetch(self, user_id: int) -> User | Type[User]:
-        user = self.__session.query(User).filter_by(id=user_id).options(
+    def fetch(self, user_id: int, profile: FetchProfile = FetchProfile.Profile) -> User | Type[User]:
+        if self.__cache:
+            user = self.__cache.get(user_id, profile, self.__session)
+
+            if user is not None:
+                return user
+
+        options = [
             joinedload(User.statistics),
             joinedload(User.pokemon),
-            joinedload(User.gameboy_profile),
-            joinedload(User.gameboy_cartridges),
-            joinedload(User.nes_cartridges)
-        ).first()
+            joinedload(User.gameboy_profile)
+        ]
+
+        if profile == FetchProfile.Cartridges:
+            # Blobs stay deferred, only the cartridge rows themselves are loaded
+            options.append(joinedload(User.gameboy_cartridges))
+            options.append(joinedload(User.nes_cartridges))
+
+        # Refresh identity map copies too, other bots write to the same rows
+        user = self.__session.query(User).filter_by(id=user_id).options(*options).populate_existing().first()
 
         if user is None:
             raise UserNotRegistered()
 
+        if self.__cache:
+            self.__cache.put(user, profile)
+
         return user
 
-    def fetch_or_register(self, user_id: int) -> User | Type[User]:
+    def fetch_or_register(self, user_id: int, profile: FetchProfile = FetchProfile.Profile) -> User | Type[User]:
         try:
-            return self.fetch(user_id)
+            return self.fetch(user_id, profile)
         except UserNotRegistered:
             user = User(
                 id=user_id,
@@ -75,9 +97,16 @@ class UserDatabase:
         if user is None:
             raise UserNotRegistered()
 
+        if self.__cache:
+            self.__cache.invalidate(user_id)
+
         try:
             self.__session.delete(user)
             self.__session.commit()
         except IntegrityError:
             self.__session.rollback()
             raise IntegrityError
+
+    @property
+    def cache(self) -> UserCache | None:
+        return self.__cache
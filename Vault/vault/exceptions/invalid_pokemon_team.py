@@ -1,3 +1,4 @@
 class InvalidPokemonTeam(Exception):
-    def __init__(self):
+    def __init__(self, problems: list[str] | None = None):
         super().__init__()
+        self.problems = problems or []
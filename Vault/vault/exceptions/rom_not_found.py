@@ -0,0 +1,3 @@
+class RomNotFound(Exception):
+    def __init__(self, message="ROM not found"):
+        super().__init__(message)
@@ -0,0 +1,3 @@
+class TooManyLiveStreams(Exception):
+    def __init__(self, message="Too many live streams"):
+        super().__init__(message)
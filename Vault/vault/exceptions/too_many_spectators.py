@@ -0,0 +1,3 @@
+class TooManySpectators(Exception):
+    def __init__(self, message="Too many spectators"):
+        super().__init__(message)
@@ -0,0 +1,248 @@
+import argparse
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import tempfile
+import time
+from typing import Any
+
+# lang -> flattened "dotted.key" -> (value, random variants or None)
+LocaleIndex = dict[str, tuple[Any, tuple | None]]
+
+
+class LocaleBundle:
+    """
+    A locale directory compiled into a single pre-merged, pre-flattened marshal snapshot.
+    The header stores the hash of the JSON sources it was built from, so a stale bundle is never served.
+    """
+
+    MAGIC = b"BLB\x01"
+    EXTENSION = ".bundle"
+    HASH_SIZE = hashlib.sha256().digest_size
+    # Magic, marshal format version, source hash
+    HEADER_SIZE = len(MAGIC) + 1 + HASH_SIZE
+
+    @staticmethod
+    def get_path(locale_dir: str, lang: str) -> str:
+        return os.path.join(locale_dir, lang + LocaleBundle.EXTENSION)
+
+    @staticmethod
+    def get_source_files(lang_path: str) -> list[str]:
+        return sorted(
+            os.path.join(lang_path, file)
+            for file in os.listdir(lang_path)
+            if file.endswith(".json")
+        )
+
+    @staticmethod
+    def hash_sources(lang_path: str) -> bytes:
+        digest = hashlib.sha256()
+
+        for full_path in LocaleBundle.get_source_files(lang_path):
+            with open(full_path, "rb") as f:
+                content = f.read()
+
+            digest.update(os.path.basename(full_path).encode("utf-8"))
+            digest.update(len(content).to_bytes(8, "little"))
+            digest.update(content)
+
+        return digest.digest()
+
+    @staticmethod
+    def compile(lang_path: str) -> LocaleIndex:
+        """
+        Merge every JSON file of a locale directory and flatten it into dotted keys.
+        :param lang_path:
+        :return:
+        """
+        merged = {}
+        for full_path in LocaleBundle.get_source_files(lang_path):
+            with open(full_path, "r", encoding="utf-8") as f:
+                LocaleBundle.__merge_dicts(merged, json.load(f))
+
+        index = {}
+
+        def visit(node: dict, prefix: str):
+            for key, value in node.items():
+                key_path = f"{prefix}.{key}" if prefix else key
+                index[key_path] = (value, LocaleBundle.__get_variants(value))
+
+                if isinstance(value, dict):
+                    visit(value, key_path)
+
+        visit(merged, "")
+
+        return index
+
+    @staticmethod
+    def __merge_dicts(a, b):
+        for key, value in b.items():
+            if key in a and isinstance(a[key], dict) and isinstance(value, dict):
+                LocaleBundle.__merge_dicts(a[key], value)
+            else:
+                a[key] = value
+
+    @staticmethod
+    def __get_variants(value) -> tuple | None:
+        """
+        If value is a dict with numeric string keys "1", "2", ..., "n" with no skips,
+        return its values in order, so a random one can be picked later.
+        """
+        if not isinstance(value, dict):
+            return None
+
+        numbered_keys = [k for k in value.keys() if k.isdigit()]
+        if numbered_keys:
+            nums = sorted(int(k) for k in numbered_keys)
+            # Check if sequential starting at 1
+            if nums == list(range(1, len(nums) + 1)):
+                return tuple(value[str(num)] for num in nums)
+        return None
+
+    @staticmethod
+    def read(bundle_path: str, source_hash: bytes | None) -> LocaleIndex | None:
+        """
+        Memory-map a bundle and unmarshal its index.
+        :param bundle_path:
+        :param source_hash: Hash the bundle must have been built from, None accepts any bundle
+        :return: The index, or None when the bundle is missing, corrupt or stale
+        """
+        try:
+            with open(bundle_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if len(mapped) < LocaleBundle.HEADER_SIZE or mapped[:len(LocaleBundle.MAGIC)] != LocaleBundle.MAGIC:
+                    return None
+
+                if mapped[len(LocaleBundle.MAGIC)] != marshal.version:
+                    return None
+
+                if source_hash is not None and mapped[len(LocaleBundle.MAGIC) + 1:LocaleBundle.HEADER_SIZE] != source_hash:
+                    return None
+
+                with memoryview(mapped) as view:
+                    return marshal.loads(view[LocaleBundle.HEADER_SIZE:])
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+
+    @staticmethod
+    def write(bundle_path: str, source_hash: bytes, index: LocaleIndex):
+        payload = marshal.dumps(index)
+
+        # Written to a temporary file first, so a running bot never maps a half-written bundle
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(bundle_path), suffix=LocaleBundle.EXTENSION)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(LocaleBundle.MAGIC)
+                f.write(bytes([marshal.version]))
+                f.write(source_hash)
+                f.write(payload)
+            os.replace(temp_path, bundle_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+    @staticmethod
+    def load(locale_dir: str, lang: str, write_bundle=True) -> LocaleIndex | None:
+        """
+        Load the index of a language from its bundle, recompiling the JSON sources when the bundle is stale.
+        :param locale_dir:
+        :param lang:
+        :param write_bundle: Whether a recompiled index is written back as the new bundle
+        :return: The index, or None when the language does not exist
+        """
+        lang_path = os.path.join(locale_dir, lang)
+        bundle_path = LocaleBundle.get_path(locale_dir, lang)
+
+        if not os.path.isdir(lang_path):
+            # Deployments may ship the bundle alone
+            return LocaleBundle.read(bundle_path, None)
+
+        source_hash = LocaleBundle.hash_sources(lang_path)
+
+        index = LocaleBundle.read(bundle_path, source_hash)
+        if index is not None:
+            return index
+
+        index = LocaleBundle.compile(lang_path)
+
+        if write_bundle:
+            try:
+                LocaleBundle.write(bundle_path, source_hash, index)
+            except OSError:
+                # Read-only deployments still work, they just keep parsing JSON
+                pass
+
+        return index
+
+    @staticmethod
+    def build(locale_dir: str) -> list[str]:
+        """
+        Compile every locale directory into its bundle.
+        :param locale_dir:
+        :return: Paths of the bundles written
+        """
+        bundle_paths = []
+
+        for lang in sorted(os.listdir(locale_dir)):
+            lang_path = os.path.join(locale_dir, lang)
+
+            if not os.path.isdir(lang_path):
+                continue
+
+            bundle_path = LocaleBundle.get_path(locale_dir, lang)
+            LocaleBundle.write(bundle_path, LocaleBundle.hash_sources(lang_path), LocaleBundle.compile(lang_path))
+            bundle_paths.append(bundle_path)
+
+        return bundle_paths
+
+
+def benchmark(locale_dir: str, lang: str, key: str, rounds: int):
+    # Imported here, translation_manager depends on this module
+    from vault.i18n.translation_manager import TranslationManager
+
+    def measure(use_bundles: bool) -> tuple[float, float]:
+        cold_start = 0.0
+        first_response = 0.0
+
+        for _ in range(rounds):
+            start = time.perf_counter()
+            translation_manager = TranslationManager(locale_dir, lang, watch_interval=None, use_bundles=use_bundles)
+            loaded = time.perf_counter()
+            try:
+                translation_manager.translate(key)
+            except (KeyError, IndexError):
+                # Missing placeholder arguments, the lookup itself was still measured
+                pass
+            cold_start += loaded - start
+            first_response += time.perf_counter() - start
+
+        return cold_start / rounds * 1000, first_response / rounds * 1000
+
+    LocaleBundle.build(locale_dir)
+
+    for name, use_bundles in (("json", False), ("bundle", True)):
+        cold_start, first_response = measure(use_bundles)
+        print(f"{name:>6}: cold start {cold_start:.2f} ms, first response {first_response:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile locale directories into bundles")
+    parser.add_argument("locale_dir")
+    parser.add_argument("--benchmark", action="store_true", help="Compare cold start against plain JSON")
+    parser.add_argument("--lang", default="en-US")
+    parser.add_argument("--key", default="", help="Key translated to measure the first response")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.locale_dir, args.lang, args.key, args.rounds)
+        return
+
+    for bundle_path in LocaleBundle.build(args.locale_dir):
+        print(bundle_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,137 +1,146 @@
-import json
 import os
 import random
+import threading
+from typing import Any
+
+from vault.i18n.locale_bundle import LocaleBundle, LocaleIndex
 
 
 class TranslationManager:
-    def __init__(self, locale_dir: str, default_lang="en-US"):
+    def __init__(self, locale_dir: str, default_lang="en-US", watch_interval: float | None = 2, use_bundles=True):
         self.locale_dir = locale_dir
         self.default_lang = default_lang
         self.language = default_lang
-        self.__loaded_languages = {}
+        self.watch_interval = watch_interval
+        self.use_bundles = use_bundles
+        self.__indexes: dict[str, LocaleIndex] = {}
+        self.__missing_languages: set[str] = set()
         self.__file_mtimes = {}
+        self.__watcher: threading.Thread | None = None
+        self.__stop_watching = threading.Event()
         self.__load_language(self.default_lang)
 
-    def __merge_dicts(self, a, b):
-        for key, value in b.items():
-            if key in a and isinstance(a[key], dict) and isinstance(value, dict):
-                self.__merge_dicts(a[key], value)
-            else:
-                a[key] = value
+        if self.watch_interval:
+            self.start_watching()
 
     def __load_language(self, lang, force_reload=False):
-        # Check if we already cached and files are unchanged
-        if not force_reload and lang in self.__loaded_languages:
-            if not self.__files_changed(lang):
-                return self.__loaded_languages[lang]
+        # Reloads are driven by the watcher, lookups never touch the filesystem once a language is cached
+        if not force_reload:
+            index = self.__indexes.get(lang, None)
+
+            if index is not None:
+                return index
+
+            if lang in self.__missing_languages:
+                return {}
 
         lang_path = os.path.join(self.locale_dir, lang)
-        if not os.path.isdir(lang_path):
+        file_mtimes = self.__scan_files(lang_path) if os.path.isdir(lang_path) else {}
+
+        if self.use_bundles:
+            index = LocaleBundle.load(self.locale_dir, lang)
+        elif os.path.isdir(lang_path):
+            index = LocaleBundle.compile(lang_path)
+        else:
+            index = None
+
+        if index is None:
+            self.__missing_languages.add(lang)
             return {}
 
-        merged = {}
-        file_mtimes = {}
-        for file in os.listdir(lang_path):
-            if file.endswith(".json"):
-                full_path = os.path.join(lang_path, file)
-                file_mtimes[full_path] = os.path.getmtime(full_path)
-                with open(full_path, "r", encoding="utf-8") as f:
-                    section = json.load(f)
-                    self.__merge_dicts(merged, section)
-
-        self.__loaded_languages[lang] = merged
+        self.__indexes[lang] = index
         self.__file_mtimes[lang] = file_mtimes
-        return merged
+        self.__missing_languages.discard(lang)
+        return index
+
+    @staticmethod
+    def __scan_files(lang_path) -> dict[str, float]:
+        return {full_path: os.path.getmtime(full_path) for full_path in LocaleBundle.get_source_files(lang_path)}
 
     def __files_changed(self, lang):
-        """Check if any file in a cached language was modified since last load"""
+        """Check if any file in a cached language was added, removed or modified since last load"""
         if lang not in self.__file_mtimes:
             return True
-        for path, old_mtime in self.__file_mtimes[lang].items():
-            try:
-                if os.path.getmtime(path) != old_mtime:
-                    return True
-            except FileNotFoundError:
-                return True
-        return False
+
+        lang_path = os.path.join(self.locale_dir, lang)
+        if not os.path.isdir(lang_path):
+            # Served from a bundle shipped without its sources
+            return False
+
+        return self.__scan_files(lang_path) != self.__file_mtimes[lang]
+
+    def start_watching(self):
+        if self.__watcher is not None and self.__watcher.is_alive():
+            return
+
+        self.__stop_watching.clear()
+        self.__watcher = threading.Thread(target=self.__watch, name="translation-watcher", daemon=True)
+        self.__watcher.start()
+
+    def stop_watching(self):
+        self.__stop_watching.set()
+        self.__watcher = None
+
+    def __watch(self):
+        while not self.__stop_watching.wait(self.watch_interval):
+            # Give languages that did not exist a new chance, their directory may have been added since
+            self.__missing_languages.clear()
+
+            for lang in list(self.__indexes.keys()):
+                try:
+                    if self.__files_changed(lang):
+                        self.__load_language(lang, force_reload=True)
+                except (OSError, ValueError):
+                    # Half-written file, keep serving the previous index until the next poll
+                    pass
 
     def set_language(self, lang):
         self.__load_language(lang)
         self.language = lang
 
-    @staticmethod
-    def __get_nested(dictionary, key_path):
-        keys = key_path.split(".")
+    def __lookup(self, key, lang) -> tuple[Any, tuple | None] | None:
+        entry = self.__load_language(self.language if lang is None else lang).get(key, None)
 
-        for key in keys:
-            if isinstance(dictionary, dict):
-                dictionary = dictionary.get(key)
-            else:
-                return None
+        if entry is None or entry[0] is None:
+            entry = self.__load_language(self.default_lang).get(key, None)
 
-        return dictionary
+        if entry is None or entry[0] is None:
+            return None
 
-    @staticmethod
-    def __get_random(value: dict, **kwargs):
-        """
-        If value is a dict with numeric string keys "1", "2", ..., "n" with no skips,
-        pick a random one, format it if it's a string, and return it.
-        """
-        numbered_keys = [k for k in value.keys() if k.isdigit()]
-        if numbered_keys:
-            nums = sorted(int(k) for k in numbered_keys)
-            # Check if sequential starting at 1
-            if nums == list(range(1, len(nums) + 1)):
-                choice_key = str(random.choice(nums))
-                chosen_value = value[choice_key]
-                if isinstance(chosen_value, str):
-                    return chosen_value.format(**kwargs)
-                return chosen_value
-        return None
+        return entry
 
     def translate_random(self, key, lang: str = None, **kwargs):
-        lang_dict = self.__load_language(self.language if lang is None else lang)
-        fallback_dict = self.__load_language(self.default_lang)
-
-        # Try in current language
-        result = self.__get_nested(lang_dict, key)
-        if result is None:
-            result = self.__get_nested(fallback_dict, key)
+        entry = self.__lookup(key, lang)
 
-        if result is None:
+        if entry is None:
             return f"[{key}]"
 
-        if not isinstance(result, dict):
+        result, variants = entry
+
+        if not isinstance(result, dict) or variants is None:
             return f"[{key}]"
 
         # Random selection + formatting
-        result = self.__get_random(result, **kwargs)
+        result = random.choice(variants)
 
         if result is None:
             return f"[{key}]"
 
-        # If it's still a string, format normally
         if isinstance(result, str):
             return result.format(**kwargs)
 
         return str(result)  # fallback if not a string
 
     def translate(self, key, lang: str = None, count=None, **kwargs):
-        lang_dict = self.__load_language(self.language if lang is None else lang)
-        fallback_dict = self.__load_language(self.default_lang)
-
         plural_key = key + "|plural" if count is not None and abs(count) != 1 else key
 
-        # Try in current language
-        result = self.__get_nested(lang_dict, plural_key)
+        # Try in current language, then in the default one
+        entry = self.__lookup(plural_key, lang)
 
-        if result is None:
-            result = self.__get_nested(fallback_dict, plural_key)
-
-        if result is None:
+        if entry is None:
             return f"[{key}]"
 
         if count is not None:
             kwargs["count"] = count
 
-        return result.format(**kwargs)
+        return entry[0].format(**kwargs)
@@ -0,0 +1,90 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class ExpiringStore(Generic[K, V]):
+    """
+    Dict-like store whose entries expire a fixed time after they were last set or touched.
+    Every entry of a store shares the same TTL, so insertion order is also expiry order and purging only looks at the oldest entries.
+    """
+
+    def __init__(self, ttl: float, max_size: int | None = None, on_expire: Callable[[K, V], None] | None = None):
+        self.ttl = ttl
+        self.max_size = max_size
+        # Called when an entry expires or is evicted for space, not when it is removed or replaced explicitly
+        self.on_expire = on_expire
+        self.__entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def __contains__(self, key: K) -> bool:
+        self.purge()
+        return key in self.__entries
+
+    def __getitem__(self, key: K) -> V:
+        self.purge()
+        return self.__entries[key][1]
+
+    def __setitem__(self, key: K, value: V):
+        self.__entries.pop(key, None)
+        self.__entries[key] = (time.monotonic() + self.ttl, value)
+
+        self.purge()
+
+        if self.max_size is not None:
+            while len(self.__entries) > self.max_size:
+                self.__expire(*self.__entries.popitem(last=False))
+
+    def __delitem__(self, key: K):
+        del self.__entries[key]
+
+    def __len__(self) -> int:
+        self.purge()
+        return len(self.__entries)
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        self.purge()
+        entry = self.__entries.get(key, None)
+        return entry[1] if entry is not None else default
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        self.purge()
+        entry = self.__entries.pop(key, None)
+        return entry[1] if entry is not None else default
+
+    def items(self) -> list[tuple[K, V]]:
+        self.purge()
+        return [(key, value) for key, (expires_at, value) in self.__entries.items()]
+
+    def touch(self, key: K):
+        """
+        Push back the expiry of an entry, as if it was just set.
+        :param key:
+        :return:
+        """
+        self.purge()
+        entry = self.__entries.pop(key, None)
+
+        if entry is not None:
+            self.__entries[key] = (time.monotonic() + self.ttl, entry[1])
+
+    def purge(self):
+        now = time.monotonic()
+
+        while self.__entries:
+            key, (expires_at, value) = next(iter(self.__entries.items()))
+
+            if expires_at > now:
+                break
+
+            del self.__entries[key]
+            self.__expire(key, (expires_at, value))
+
+    def clear(self):
+        self.__entries.clear()
+
+    def __expire(self, key: K, entry: tuple[float, V]):
+        if self.on_expire is not None:
+            self.on_expire(key, entry[1])